@@ -3,9 +3,13 @@ from __future__ import annotations
 import os
 from typing import Any, Dict
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("alpha_vantage")
 class AlphaVantageClient:
     """
     Minimal Alpha Vantage client.
@@ -18,14 +22,37 @@ class AlphaVantageClient:
     def __init__(self, api_key: str | None = None) -> None:
         self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
 
-    def get_quote(self, symbol: str) -> Dict[str, Any]:
+    def _quote_params(self, symbol: str) -> Dict[str, Any]:
         if not self.api_key:
             raise RuntimeError("ALPHA_VANTAGE_API_KEY is not set")
 
-        params = {
+        return {
             "function": "GLOBAL_QUOTE",
             "symbol": symbol,
             "apikey": self.api_key,
         }
-        data = http_get(self.BASE_URL, params=params)
+
+    def get_quote(self, symbol: str) -> Dict[str, Any]:
+        data = http_get(self.BASE_URL, params=self._quote_params(symbol))
+        return data.get("Global Quote", data)
+
+
+@instrumented("alpha_vantage")
+class AsyncAlphaVantageClient(AlphaVantageClient):
+    """
+    Asyncio variant of AlphaVantageClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.transport = transport
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:  # type: ignore[override]
+        data = await async_http_get(
+            self.BASE_URL, params=self._quote_params(symbol), transport=self.transport
+        )
         return data.get("Global Quote", data)
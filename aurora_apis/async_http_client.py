@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import weakref
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Mapping, MutableMapping, Tuple
+from urllib import parse
+
+from aurora_apis.async_transport import AsyncPooledTransport, AsyncTransport
+from aurora_apis.http_client import _build_url, _raise_for_status, get_resilience
+from aurora_apis.metrics import get_metrics
+from aurora_apis.transport import HTTPResponse
+
+
+AsyncRequestGate = Callable[[str], Awaitable[None]]
+
+_request_gate: AsyncRequestGate | None = None
+
+# Connections are bound to an event loop, so the default transport is too.
+_default_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_transport() -> AsyncTransport:
+    """
+    Return the default async transport for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    transport = _default_transports.get(loop)
+    if transport is None:
+        transport = AsyncPooledTransport()
+        _default_transports[loop] = transport
+    return transport
+
+
+def set_async_transport(transport: AsyncTransport) -> None:
+    """
+    Use `transport` as the default for the running event loop.
+    """
+    _default_transports[asyncio.get_running_loop()] = transport
+
+
+def set_async_request_gate(gate: AsyncRequestGate | None) -> AsyncRequestGate | None:
+    """
+    Coroutine counterpart of `http_client.set_request_gate`.
+    """
+    global _request_gate
+    previous, _request_gate = _request_gate, gate
+    return previous
+
+
+async def async_http_request(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    body: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10,
+    transport: AsyncTransport | None = None,
+) -> HTTPResponse:
+    """
+    Coroutine counterpart of `http_request`. Uses the same retry and
+    circuit-breaker policy (`http_client.set_resilience`).
+    """
+    full_url = _build_url(url, params)
+    selected = transport or get_async_transport()
+
+    async def send() -> HTTPResponse:
+        metrics = get_metrics()
+        if metrics is None:
+            resp = await selected.request(
+                method, full_url, body=body, headers=headers, timeout=timeout
+            )
+        else:
+            with metrics.time_request(method, full_url, len(body or b"")) as timer:
+                resp = await selected.request(
+                    method, full_url, body=body, headers=headers, timeout=timeout
+                )
+                timer.done(resp.status, len(resp.body))
+        _raise_for_status(resp)
+        return resp
+
+    request_gate = _request_gate
+    gate = None if request_gate is None else partial(request_gate, full_url)
+    resilience = get_resilience()
+    if resilience is None:
+        if gate is not None:
+            await gate()
+        return await send()
+    return await resilience.call_async(method, full_url, send, gate=gate)
+
+
+async def async_http_get(
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10,
+    transport: AsyncTransport | None = None,
+) -> Dict[str, Any]:
+    resp = await async_http_request(
+        "GET", url, params=params, headers=headers, timeout=timeout, transport=transport
+    )
+    return resp.json()
+
+
+async def async_http_post(
+    url: str,
+    data: Mapping[str, Any] | None = None,
+    headers: MutableMapping[str, str] | None = None,
+    auth_basic: Tuple[str, str] | None = None,
+    timeout: float = 10,
+    transport: AsyncTransport | None = None,
+) -> Dict[str, Any]:
+    body = parse.urlencode(data or {}).encode()
+    req_headers: Dict[str, str] = {
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
+    req_headers.update(headers or {})
+
+    if auth_basic:
+        user, password = auth_basic
+        token = base64.b64encode(f"{user}:{password}".encode()).decode()
+        req_headers["Authorization"] = f"Basic {token}"
+
+    resp = await async_http_request(
+        "POST", url, body=body, headers=req_headers, timeout=timeout, transport=transport
+    )
+    return resp.json()
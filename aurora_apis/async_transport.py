@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Tuple
+from urllib import parse
+
+from aurora_apis.transport import HTTPResponse, decode_body
+
+
+class _StaleConnection(Exception):
+    """
+    Raised when a pooled connection was closed before any response byte.
+    """
+
+
+@dataclass
+class _AsyncConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    last_used: float = field(default_factory=time.monotonic)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+@dataclass
+class _AsyncHostPool:
+    slots: asyncio.Semaphore
+    idle: List[_AsyncConnection] = field(default_factory=list)
+
+
+class AsyncTransport:
+    """
+    Interface for the coroutine-based transport used by `async_http_client`.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> HTTPResponse:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncPooledTransport(AsyncTransport):
+    """
+    HTTP/1.1 keep-alive transport built on asyncio streams.
+
+    Mirrors `PooledTransport`: a persistent connection pool per host capped
+    at `max_connections_per_host`, idle eviction after `idle_timeout`
+    seconds and gzip/deflate decoding. Waiting for a connection slot is a
+    coroutine suspension, not a blocked thread, so a single event loop can
+    keep thousands of requests in flight across hosts.
+
+    A transport instance belongs to the event loop it is first used on.
+    Proxies from the environment are not applied.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 64,
+        idle_timeout: float = 30.0,
+        accept_encoding: str = "gzip, deflate",
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be >= 1")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.accept_encoding = accept_encoding
+        self.ssl_context = ssl_context
+        self._pools: Dict[Tuple[str, str, int], _AsyncHostPool] = {}
+
+    def _pool(self, key: Tuple[str, str, int]) -> _AsyncHostPool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = _AsyncHostPool(asyncio.Semaphore(self.max_connections_per_host))
+            self._pools[key] = pool
+        return pool
+
+    async def _connect(self, scheme: str, host: str, port: int) -> _AsyncConnection:
+        ssl_ctx = None
+        if scheme == "https":
+            ssl_ctx = self.ssl_context or ssl.create_default_context()
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=ssl_ctx, server_hostname=host if ssl_ctx else None
+        )
+        return _AsyncConnection(reader, writer)
+
+    def _checkout(self, pool: _AsyncHostPool) -> _AsyncConnection | None:
+        now = time.monotonic()
+        while pool.idle:
+            conn = pool.idle.pop()
+            if now - conn.last_used <= self.idle_timeout and not conn.reader.at_eof():
+                return conn
+            conn.close()
+        return None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> HTTPResponse:
+        parts = parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        host = parts.hostname or ""
+        default_port = 443 if scheme == "https" else 80
+        port = parts.port or default_port
+        key = (scheme, host, port)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        req_headers: Dict[str, str] = {
+            "Host": host if port == default_port else f"{host}:{port}",
+            "Connection": "keep-alive",
+            "User-Agent": "aurora-http",
+        }
+        if self.accept_encoding:
+            req_headers["Accept-Encoding"] = self.accept_encoding
+        req_headers.update(headers or {})
+        if body is not None:
+            req_headers["Content-Length"] = str(len(body))
+        head = f"{method} {target} HTTP/1.1\r\n"
+        head += "".join(f"{k}: {v}\r\n" for k, v in req_headers.items())
+        payload = head.encode("latin-1") + b"\r\n" + (body or b"")
+
+        pool = self._pool(key)
+        return await asyncio.wait_for(
+            self._request_on_pool(pool, key, method, payload, url), timeout
+        )
+
+    async def _request_on_pool(
+        self,
+        pool: _AsyncHostPool,
+        key: Tuple[str, str, int],
+        method: str,
+        payload: bytes,
+        url: str,
+    ) -> HTTPResponse:
+        async with pool.slots:
+            conn = self._checkout(pool)
+            reused = conn is not None
+            if conn is None:
+                conn = await self._connect(*key)
+            try:
+                try:
+                    status, reason, headers, raw, keep = await self._exchange(
+                        conn, method, payload
+                    )
+                except _StaleConnection:
+                    conn.close()
+                    if not reused:
+                        raise ConnectionResetError("Connection closed by server")
+                    conn = await self._connect(*key)
+                    status, reason, headers, raw, keep = await self._exchange(
+                        conn, method, payload
+                    )
+            except BaseException:
+                conn.close()
+                raise
+
+            if keep:
+                conn.last_used = time.monotonic()
+                pool.idle.append(conn)
+            else:
+                conn.close()
+
+        body = decode_body(raw, headers.get("content-encoding"))
+        return HTTPResponse(status, reason, headers, body, url)
+
+    @staticmethod
+    async def _exchange(
+        conn: _AsyncConnection, method: str, payload: bytes
+    ) -> Tuple[int, str, Dict[str, str], bytes, bool]:
+        try:
+            conn.writer.write(payload)
+            await conn.writer.drain()
+            status_line = await conn.reader.readline()
+        except (ConnectionResetError, BrokenPipeError) as exc:
+            raise _StaleConnection() from exc
+        if not status_line:
+            raise _StaleConnection()
+
+        version, status_text, *rest = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        status = int(status_text)
+        reason = rest[0] if rest else ""
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep = version == "HTTP/1.1"
+        connection = headers.get("connection", "").lower()
+        if connection == "close":
+            keep = False
+        elif connection == "keep-alive":
+            keep = True
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            raw = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            raw = await _read_chunked(conn.reader)
+        elif "content-length" in headers:
+            raw = await conn.reader.readexactly(int(headers["content-length"]))
+        else:
+            raw = await conn.reader.read()
+            keep = False
+        return status, reason, headers, raw, keep
+
+    def idle_connections(self) -> Dict[str, int]:
+        return {
+            f"{scheme}://{host}:{port}": len(pool.idle)
+            for (scheme, host, port), pool in self._pools.items()
+        }
+
+    async def aclose(self) -> None:
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            for conn in pool.idle:
+                conn.close()
+            pool.idle = []
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # Drain optional trailers up to the terminating blank line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
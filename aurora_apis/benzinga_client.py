@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List
 
-from aurora_apis.http_client import http_get
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
+from aurora_apis.http_client import http_get, http_get_items
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("benzinga")
 class BenzingaClient:
     """
     Minimal Benzinga news client.
@@ -18,15 +22,111 @@ class BenzingaClient:
     def __init__(self, api_key: str | None = None) -> None:
         self.api_key = api_key or os.getenv("BENZINGA_API_KEY")
 
-    def get_news(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def _news_params(self, symbol: str, limit: int) -> Dict[str, Any]:
         if not self.api_key:
             raise RuntimeError("BENZINGA_API_KEY is not set")
 
-        params = {
+        return {
             "token": self.api_key,
             "tickers": symbol,
             "channels": "stocks",
             "pageSize": limit,
         }
+
+    def _updates_params(
+        self,
+        tickers: Iterable[str] | None,
+        updated_since: int,
+        page: int,
+        page_size: int,
+    ) -> Dict[str, Any]:
+        if not self.api_key:
+            raise RuntimeError("BENZINGA_API_KEY is not set")
+
+        params: Dict[str, Any] = {
+            "token": self.api_key,
+            "updatedSince": int(updated_since),
+            "sort": "updated:asc",
+            "page": page,
+            "pageSize": page_size,
+        }
+        if tickers:
+            params["tickers"] = ",".join(tickers)
+        return params
+
+    def get_news(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/news"
+        return http_get(url, params=self._news_params(symbol, limit))
+
+    def iter_news(self, symbol: str, limit: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Stream news items one at a time; useful for large page sizes.
+        """
+        url = f"{self.BASE_URL}/news"
+        headers = {"Accept": "application/json"}
+        for _, item in http_get_items(
+            url, [], params=self._news_params(symbol, limit), headers=headers
+        ):
+            yield item
+
+    def get_news_updates(
+        self,
+        tickers: Iterable[str] | None,
+        updated_since: int,
+        page: int = 0,
+        page_size: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stories created or revised at or after the `updated_since` Unix
+        time, oldest update first, for the given tickers (all stories if
+        None). Page through with `page` until a short page comes back.
+        """
+        url = f"{self.BASE_URL}/news"
+        headers = {"Accept": "application/json"}
+        params = self._updates_params(tickers, updated_since, page, page_size)
+        return http_get(url, params=params, headers=headers)
+
+
+@instrumented("benzinga")
+class AsyncBenzingaClient(BenzingaClient):
+    """
+    Asyncio variant of BenzingaClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.transport = transport
+
+    async def get_news(  # type: ignore[override]
+        self, symbol: str, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/news"
+        return await async_http_get(
+            url, params=self._news_params(symbol, limit), transport=self.transport
+        )
+
+    async def iter_news(  # type: ignore[override]
+        self, symbol: str, limit: int = 10
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        News items one at a time. The async transport reads whole bodies,
+        so the page is fetched in full first.
+        """
+        for item in await self.get_news(symbol, limit):
+            yield item
+
+    async def get_news_updates(  # type: ignore[override]
+        self,
+        tickers: Iterable[str] | None,
+        updated_since: int,
+        page: int = 0,
+        page_size: int = 100,
+    ) -> List[Dict[str, Any]]:
         url = f"{self.BASE_URL}/news"
-        return http_get(url, params=params)
+        headers = {"Accept": "application/json"}
+        params = self._updates_params(tickers, updated_since, page, page_size)
+        return await async_http_get(url, params=params, headers=headers, transport=self.transport)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping
+
+
+def normalize_ticker(symbol: str) -> str:
+    """
+    Canonical ticker form used by the SEC file: upper-case, "-" for class
+    separators (BRK.B and BRK/B both become BRK-B).
+    """
+    return symbol.strip().upper().replace(".", "-").replace("/", "-")
+
+
+class CIKIndex:
+    """
+    In-memory ticker -> CIK map backed by SEC's company_tickers.json.
+
+    Lookups are plain dict reads and never do I/O. The map is persisted as
+    a compact `{"TICKER": cik}` JSON file and refreshed from the SEC at
+    most every `refresh_interval` seconds on a background thread started by
+    the first lookup after it falls due; a failed refresh keeps the current
+    map. Call `ensure_loaded()` to fetch an empty map up front.
+    """
+
+    TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        fetch: Callable[[], Mapping[str, Any]] | None = None,
+        refresh_interval: float = 24 * 3600,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self._by_ticker: Dict[str, int] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.RLock()
+        self._refresher: threading.Thread | None = None
+        if self.path is not None and self.path.exists():
+            self.load_file(self.path)
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and normalize_ticker(symbol) in self._by_ticker
+
+    def tickers(self) -> List[str]:
+        """
+        All known tickers, in normalized form.
+        """
+        self._refresh_if_due()
+        return list(self._by_ticker)
+
+    @staticmethod
+    def parse_sec_payload(payload: Mapping[str, Any]) -> Dict[str, int]:
+        """
+        Convert SEC's `{"0": {"cik_str": ..., "ticker": ...}, ...}` layout.
+        """
+        out: Dict[str, int] = {}
+        for row in payload.values():
+            ticker = row.get("ticker")
+            cik = row.get("cik_str")
+            if ticker and cik is not None:
+                # The SEC file lists a company's primary ticker first.
+                out.setdefault(normalize_ticker(ticker), int(cik))
+        return out
+
+    def load_file(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        if payload and isinstance(next(iter(payload.values())), dict):
+            mapping = self.parse_sec_payload(payload)
+        else:
+            mapping = {normalize_ticker(k): int(v) for k, v in payload.items()}
+        self._by_ticker = mapping
+        self._loaded_at = os.path.getmtime(path)
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> None:
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No path configured for the CIK index")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(self._by_ticker, fh, separators=(",", ":"))
+        os.replace(tmp, target)
+
+    def update(self, mapping: Mapping[str, int]) -> None:
+        self._by_ticker = {normalize_ticker(k): int(v) for k, v in mapping.items()}
+        self._loaded_at = time.time()
+
+    def is_stale(self) -> bool:
+        return time.time() - self._loaded_at >= self.refresh_interval
+
+    def store_payload(self, payload: Mapping[str, Any]) -> None:
+        """
+        Replace the map with a freshly fetched SEC payload and persist it.
+        For callers that fetch the file themselves, e.g. asynchronously.
+        """
+        mapping = self.parse_sec_payload(payload)
+        with self._lock:
+            self._by_ticker = mapping
+            self._loaded_at = time.time()
+            if self.path is not None:
+                self.save()
+
+    def defer_refresh(self) -> None:
+        """
+        After a failed refresh: keep the current map until the next interval.
+        """
+        self._loaded_at = time.time()
+
+    def refresh(self) -> bool:
+        """
+        Reload from the SEC via `fetch`, blocking until done. Returns False
+        if no fetcher is set.
+        """
+        if self.fetch is None:
+            return False
+        with self._refresh_lock:
+            self.store_payload(self.fetch())
+        return True
+
+    def ensure_loaded(self) -> None:
+        """
+        Block on a refresh only if the map is still empty (a cold start with
+        no index file). Failures propagate.
+        """
+        if self._by_ticker or self.fetch is None:
+            return
+        with self._refresh_lock:
+            if not self._by_ticker:
+                self.refresh()
+
+    def _refresh_if_due(self) -> None:
+        # Lookups never wait on the SEC: a due refresh runs on a daemon
+        # thread while the current map keeps serving.
+        if self.fetch is None or not self.is_stale():
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._background_refresh, name="aurora-cik-refresh", daemon=True
+            )
+            self._refresher.start()
+
+    def _background_refresh(self) -> None:
+        if not self.is_stale():
+            return
+        try:
+            self.refresh()
+        except Exception:
+            # Try again on the next interval rather than on every lookup.
+            self.defer_refresh()
+
+    def join_refresh(self, timeout: float | None = None) -> None:
+        """
+        Wait for an in-flight background refresh, if any.
+        """
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout)
+
+    def lookup(self, symbol: str) -> int | None:
+        self._refresh_if_due()
+        return self._by_ticker.get(normalize_ticker(symbol))
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+
+@dataclass
+class CachedFactsMeta:
+    cik: int
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+    validated_at: float = 0.0
+    size: int = 0
+
+
+class CompanyFactsDiskCache:
+    """
+    On-disk store of raw SEC companyfacts bodies keyed by CIK.
+
+    Each CIK is kept as `CIK##########.json` (the body exactly as served)
+    plus a small `.meta.json` with the validators needed for a conditional
+    GET. Opening the cache only lists the directory; bodies are
+    memory-mapped and parsed on demand, so large filers cost nothing until
+    they are actually read.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _body_path(self, cik: int) -> Path:
+        return self.directory / f"CIK{cik:010d}.json"
+
+    def _meta_path(self, cik: int) -> Path:
+        return self.directory / f"CIK{cik:010d}.meta.json"
+
+    def ciks(self) -> Iterator[int]:
+        for path in self.directory.glob("CIK*.meta.json"):
+            yield int(path.name[3:13])
+
+    def meta(self, cik: int) -> CachedFactsMeta | None:
+        path = self._meta_path(cik)
+        if not path.exists() or not self._body_path(cik).exists():
+            return None
+        with open(path, "r", encoding="utf-8") as fh:
+            return CachedFactsMeta(**json.load(fh))
+
+    def conditional_headers(self, cik: int) -> Dict[str, str]:
+        """
+        Validators to send so the server can answer 304 Not Modified.
+        """
+        meta = self.meta(cik)
+        headers: Dict[str, str] = {}
+        if meta is None:
+            return headers
+        if meta.etag:
+            headers["If-None-Match"] = meta.etag
+        if meta.last_modified:
+            headers["If-Modified-Since"] = meta.last_modified
+        return headers
+
+    def open_raw(self, cik: int) -> mmap.mmap:
+        """
+        Memory-map the stored body read-only. The caller closes the map.
+        """
+        with open(self._body_path(cik), "rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def iter_chunks(self, cik: int, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Yield the stored body in slices of the memory map.
+        """
+        with self.open_raw(cik) as mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start + chunk_size]
+
+    def load(self, cik: int) -> Dict[str, Any]:
+        with self.open_raw(cik) as mapped:
+            return json.loads(mapped[:])
+
+    def store(self, cik: int, body: bytes, headers: Dict[str, str]) -> CachedFactsMeta:
+        now = time.time()
+        meta = CachedFactsMeta(
+            cik=cik,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=now,
+            validated_at=now,
+            size=len(body),
+        )
+        with self._lock:
+            self._atomic_write(self._body_path(cik), body)
+            self._atomic_write(self._meta_path(cik), json.dumps(asdict(meta)).encode())
+        return meta
+
+    def store_stream(
+        self, cik: int, chunks: Iterable[bytes], headers: Dict[str, str]
+    ) -> Iterator[bytes]:
+        """
+        Pass `chunks` through while spooling them to disk. The entry is only
+        committed once the stream has been fully consumed.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+                    size += len(chunk)
+                    yield chunk
+            now = time.time()
+            meta = CachedFactsMeta(
+                cik=cik,
+                etag=headers.get("etag"),
+                last_modified=headers.get("last-modified"),
+                fetched_at=now,
+                validated_at=now,
+                size=size,
+            )
+            with self._lock:
+                os.replace(tmp, self._body_path(cik))
+                self._atomic_write(self._meta_path(cik), json.dumps(asdict(meta)).encode())
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def touch(self, cik: int) -> None:
+        """
+        Record a successful revalidation (304) without rewriting the body.
+        """
+        meta = self.meta(cik)
+        if meta is None:
+            return
+        meta.validated_at = time.time()
+        with self._lock:
+            self._atomic_write(self._meta_path(cik), json.dumps(asdict(meta)).encode())
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.market_stream import FinnhubStream, TickHandler
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("finnhub")
 class FinnhubClient:
     """
     Minimal Finnhub client for quote + sentiment.
@@ -23,14 +28,51 @@ class FinnhubClient:
         self.api_secret = api_secret or os.getenv("FINNHUB_SECRET")
         self.proxy_url = proxy_url or os.getenv("FINNHUB_PROXY_URL")
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare(self, path: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         if not self.api_key:
             raise RuntimeError("FINNHUB_API_KEY is not set")
 
         params = dict(params)
         params["token"] = self.api_key
-        url = f"{self.BASE_URL}{path}"
+        return f"{self.BASE_URL}{path}", params
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
         return http_get(url, params=params)
 
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         return self._get("/quote", {"symbol": symbol})
+
+    def stream(self, on_tick: TickHandler, **kwargs: Any) -> FinnhubStream:
+        """
+        WebSocket trade stream; run it with `await stream.run()`.
+        """
+        if not self.api_key:
+            raise RuntimeError("FINNHUB_API_KEY is not set")
+        return FinnhubStream(self.api_key, on_tick, **kwargs)
+
+
+@instrumented("finnhub")
+class AsyncFinnhubClient(FinnhubClient):
+    """
+    Asyncio variant of FinnhubClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        proxy_url: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key, api_secret=api_secret, proxy_url=proxy_url)
+        self.transport = transport
+
+    async def _get(  # type: ignore[override]
+        self, path: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
+        return await async_http_get(url, params=params, transport=self.transport)
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:  # type: ignore[override]
+        return await self._get("/quote", {"symbol": symbol})
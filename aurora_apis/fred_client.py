@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Tuple
 
-from aurora_apis.http_client import http_get
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
+from aurora_apis.fred_series import FREDSeries
+from aurora_apis.http_client import http_get, http_get_items
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("fred")
 class FREDClient:
     """
     Minimal FRED client for macroeconomic series.
@@ -16,15 +21,79 @@ class FREDClient:
     def __init__(self, api_key: str | None = None) -> None:
         self.api_key = api_key or os.getenv("FRED_API_KEY")
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare(self, path: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         if not self.api_key:
             raise RuntimeError("FRED_API_KEY is not set")
 
         params = dict(params)
         params["api_key"] = self.api_key
         params["file_type"] = "json"
-        url = f"{self.BASE_URL}{path}"
+        return f"{self.BASE_URL}{path}", params
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
         return http_get(url, params=params)
 
     def get_series(self, series_id: str) -> Dict[str, Any]:
         return self._get("/series/observations", {"series_id": series_id})
+
+    def iter_observations(self, series_id: str, **params: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a series' observations one dict at a time instead of
+        materializing the whole response.
+        """
+        url, query = self._prepare(
+            "/series/observations", {"series_id": series_id, **params}
+        )
+        for _, observation in http_get_items(url, ["observations"], params=query):
+            yield observation
+
+    def get_series_columnar(self, series_id: str, **params: Any) -> FREDSeries:
+        """
+        Fetch a series straight into a compact `FREDSeries`, streaming the
+        observations so the raw JSON tree is never materialized.
+        """
+        return FREDSeries.from_observations(
+            series_id, self.iter_observations(series_id, **params)
+        )
+
+
+@instrumented("fred")
+class AsyncFREDClient(FREDClient):
+    """
+    Asyncio variant of FREDClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(api_key=api_key)
+        self.transport = transport
+
+    async def _get(  # type: ignore[override]
+        self, path: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
+        return await async_http_get(url, params=params, transport=self.transport)
+
+    async def get_series(self, series_id: str) -> Dict[str, Any]:  # type: ignore[override]
+        return await self._get("/series/observations", {"series_id": series_id})
+
+    async def iter_observations(  # type: ignore[override]
+        self, series_id: str, **params: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        A series' observations one dict at a time. The async transport
+        reads whole bodies, so the response is fetched in full first.
+        """
+        data = await self._get("/series/observations", {"series_id": series_id, **params})
+        for observation in data.get("observations", []):
+            yield observation
+
+    async def get_series_columnar(  # type: ignore[override]
+        self, series_id: str, **params: Any
+    ) -> FREDSeries:
+        data = await self._get("/series/observations", {"series_id": series_id, **params})
+        return FREDSeries.from_observations(series_id, data.get("observations", []))
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NAN = float("nan")
+
+DateLike = date | str | int
+
+
+def to_epoch_day(value: DateLike) -> int:
+    """
+    Convert a date, "YYYY-MM-DD" string or epoch-day int to epoch days.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def from_epoch_day(day: int) -> date:
+    return date.fromordinal(day + _EPOCH_ORDINAL)
+
+
+def parse_value(raw: Any) -> float:
+    """
+    FRED encodes missing observations as "."; map those to NaN.
+    """
+    if raw is None or raw == ".":
+        return _NAN
+    return float(raw)
+
+
+def _period_key(day: int, freq: str) -> int:
+    d = from_epoch_day(day)
+    if freq == "W":
+        # Weeks ending Friday, FRED's default weekly convention.
+        return day + (4 - d.weekday()) % 7
+    if freq == "M":
+        return d.year * 12 + d.month - 1
+    if freq == "Q":
+        return d.year * 4 + (d.month - 1) // 3
+    if freq == "A":
+        return d.year
+    raise ValueError(f"Unsupported frequency: {freq!r} (use W, M, Q or A)")
+
+
+def _period_start(key: int, freq: str) -> int:
+    if freq == "W":
+        return key - 4
+    if freq == "M":
+        return to_epoch_day(date(key // 12, key % 12 + 1, 1))
+    if freq == "Q":
+        return to_epoch_day(date(key // 4, (key % 4) * 3 + 1, 1))
+    return to_epoch_day(date(key, 1, 1))
+
+
+def _agg_last(values: Sequence[float]) -> float:
+    for v in reversed(values):
+        if not math.isnan(v):
+            return v
+    return _NAN
+
+
+def _agg_first(values: Sequence[float]) -> float:
+    for v in values:
+        if not math.isnan(v):
+            return v
+    return _NAN
+
+
+def _agg_mean(values: Sequence[float]) -> float:
+    present = [v for v in values if not math.isnan(v)]
+    return math.fsum(present) / len(present) if present else _NAN
+
+
+def _agg_sum(values: Sequence[float]) -> float:
+    present = [v for v in values if not math.isnan(v)]
+    return math.fsum(present) if present else _NAN
+
+
+_AGGREGATORS: Dict[str, Callable[[Sequence[float]], float]] = {
+    "last": _agg_last,
+    "first": _agg_first,
+    "mean": _agg_mean,
+    "sum": _agg_sum,
+}
+
+
+class FREDRevisions:
+    """
+    Superseded FRED values: parallel arrays of observation date, value and
+    the inclusive real-time period (`realtime_start`..`realtime_end`, all
+    epoch days) during which FRED reported that value. `index_as_of`
+    expects them sorted by date, as `FREDStore.revisions` returns them.
+    """
+
+    __slots__ = ("dates", "values", "realtime_start", "realtime_end")
+
+    def __init__(self) -> None:
+        self.dates = array("q")
+        self.values = array("d")
+        self.realtime_start = array("q")
+        self.realtime_end = array("q")
+
+    def append(self, day: int, value: float, start: int, end: int) -> None:
+        self.dates.append(day)
+        self.values.append(value)
+        self.realtime_start.append(start)
+        self.realtime_end.append(end)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __iter__(self) -> Iterator[Tuple[int, float, int, int]]:
+        return zip(self.dates, self.values, self.realtime_start, self.realtime_end)
+
+    def index_as_of(self, day: int, when: int) -> int | None:
+        """
+        Position of the revision FRED reported for observation `day` on
+        `when`, if any.
+        """
+        lo = bisect_left(self.dates, day)
+        hi = bisect_right(self.dates, day)
+        for k in range(lo, hi):
+            if self.realtime_start[k] <= when <= self.realtime_end[k]:
+                return k
+        return None
+
+
+class FREDSeries:
+    """
+    Compact observation series: dates as int64 epoch days and values as
+    float64 in two parallel `array` buffers (16 bytes per observation
+    instead of a dict of strings). Missing values are NaN.
+
+    Dates are kept sorted, so date-range slicing and as-of lookups are
+    binary searches. `vintages` optionally holds, per observation, the
+    `realtime_start` (epoch days) of its current value: the day FRED began
+    reporting it, clipped to the start of the requested real-time period.
+    """
+
+    __slots__ = ("series_id", "dates", "values", "vintages")
+
+    def __init__(
+        self,
+        series_id: str,
+        dates: Iterable[int] = (),
+        values: Iterable[float] = (),
+        vintages: Iterable[int] | None = None,
+    ) -> None:
+        self.series_id = series_id
+        self.dates = dates if isinstance(dates, array) else array("q", dates)
+        self.values = values if isinstance(values, array) else array("d", values)
+        if vintages is not None and not isinstance(vintages, array):
+            vintages = array("q", vintages)
+        self.vintages = vintages
+        if len(self.dates) != len(self.values):
+            raise ValueError("dates and values must have the same length")
+        if self.vintages is not None and len(self.vintages) != len(self.dates):
+            raise ValueError("vintages must have the same length as dates")
+
+    @classmethod
+    def from_observations(
+        cls,
+        series_id: str,
+        observations: Iterable[Mapping[str, Any]],
+        revisions: FREDRevisions | None = None,
+    ) -> "FREDSeries":
+        """
+        Build from FRED `observations` dicts (as returned by the API).
+        Responses for a real-time period (`realtime_start`/`realtime_end`)
+        carry one row per vintage, oldest first; the latest row of each date
+        is kept and the earlier ones are appended to `revisions`, if given.
+        """
+        dates = array("q")
+        values = array("d")
+        vintages = array("q")
+        ends: List[int] = []
+        dated = True
+        for obs in observations:
+            day = to_epoch_day(obs["date"])
+            value = parse_value(obs.get("value"))
+            realtime_start = obs.get("realtime_start")
+            dated = dated and bool(realtime_start)
+            if dates and dates[-1] == day:
+                if dated:
+                    if revisions is not None:
+                        revisions.append(day, values[-1], vintages[-1], ends[-1])
+                    vintages[-1] = to_epoch_day(realtime_start)
+                    ends[-1] = to_epoch_day(obs.get("realtime_end") or "9999-12-31")
+                values[-1] = value
+                continue
+            dates.append(day)
+            values.append(value)
+            if dated:
+                vintages.append(to_epoch_day(realtime_start))
+                ends.append(to_epoch_day(obs.get("realtime_end") or "9999-12-31"))
+        if not dated:
+            return cls(series_id, dates, values)
+        return cls(series_id, dates, values, vintages)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        if not self.dates:
+            return f"FREDSeries({self.series_id!r}, empty)"
+        return (
+            f"FREDSeries({self.series_id!r}, {len(self)} obs, "
+            f"{from_epoch_day(self.dates[0])}..{from_epoch_day(self.dates[-1])})"
+        )
+
+    def __getitem__(self, index: int) -> Tuple[date, float]:
+        return from_epoch_day(self.dates[index]), self.values[index]
+
+    @property
+    def nbytes(self) -> int:
+        total = len(self.dates) * self.dates.itemsize + len(self.values) * self.values.itemsize
+        if self.vintages is not None:
+            total += len(self.vintages) * self.vintages.itemsize
+        return total
+
+    def slice(self, start: DateLike | None = None, end: DateLike | None = None) -> "FREDSeries":
+        """
+        Observations with start <= date <= end (either bound optional).
+        """
+        lo = 0 if start is None else bisect_left(self.dates, to_epoch_day(start))
+        hi = len(self.dates) if end is None else bisect_right(self.dates, to_epoch_day(end))
+        vintages = None if self.vintages is None else self.vintages[lo:hi]
+        return FREDSeries(self.series_id, self.dates[lo:hi], self.values[lo:hi], vintages)
+
+    def value_at(self, when: DateLike) -> float:
+        """
+        As-of lookup: the value of the latest observation on or before `when`.
+        """
+        idx = bisect_right(self.dates, to_epoch_day(when)) - 1
+        return self.values[idx] if idx >= 0 else _NAN
+
+    def dropna(self) -> "FREDSeries":
+        keep = [i for i, v in enumerate(self.values) if not math.isnan(v)]
+        vintages = None
+        if self.vintages is not None:
+            vintages = array("q", (self.vintages[i] for i in keep))
+        return FREDSeries(
+            self.series_id,
+            array("q", (self.dates[i] for i in keep)),
+            array("d", (self.values[i] for i in keep)),
+            vintages,
+        )
+
+    def resample(self, freq: str, how: str = "last") -> "FREDSeries":
+        """
+        Downsample to weekly ("W"), monthly ("M"), quarterly ("Q") or
+        annual ("A") periods, labelled by period start (weeks: Monday of
+        the Friday-ending week). `how` is last, first, mean or sum;
+        NaN observations are ignored.
+        """
+        agg = _AGGREGATORS.get(how)
+        if agg is None:
+            raise ValueError(f"Unsupported aggregation: {how!r}")
+        out_dates = array("q")
+        out_values = array("d")
+        bucket: List[float] = []
+        current: int | None = None
+        for day, value in zip(self.dates, self.values):
+            key = _period_key(day, freq)
+            if key != current:
+                if current is not None:
+                    out_dates.append(_period_start(current, freq))
+                    out_values.append(agg(bucket))
+                current, bucket = key, []
+            bucket.append(value)
+        if current is not None:
+            out_dates.append(_period_start(current, freq))
+            out_values.append(agg(bucket))
+        return FREDSeries(self.series_id, out_dates, out_values)
+
+    def to_observations(self) -> List[Dict[str, Any]]:
+        """
+        Back to FRED-style dicts (missing values as ".").
+        """
+        return [
+            {
+                "date": from_epoch_day(d).isoformat(),
+                "value": "." if math.isnan(v) else repr(v),
+            }
+            for d, v in zip(self.dates, self.values)
+        ]
+
+
+def align(
+    series: Sequence[FREDSeries], how: str = "inner"
+) -> Tuple[array, List[array]]:
+    """
+    Join several series on date.
+
+    "inner" keeps dates present in every series; "outer" keeps dates present
+    in any series and fills gaps with NaN. Returns the shared date array and
+    one value array per input series, in order.
+    """
+    if how not in ("inner", "outer"):
+        raise ValueError(f"Unsupported join: {how!r}")
+    if not series:
+        return array("q"), []
+
+    if how == "inner":
+        common = set(series[0].dates)
+        for s in series[1:]:
+            common.intersection_update(s.dates)
+        dates = array("q", sorted(common))
+    else:
+        merged = set()
+        for s in series:
+            merged.update(s.dates)
+        dates = array("q", sorted(merged))
+
+    columns: List[array] = []
+    for s in series:
+        col = array("d", [_NAN]) * len(dates)
+        i = 0
+        n = len(s.dates)
+        # Both date arrays are sorted, so one forward merge pass suffices.
+        for j, day in enumerate(dates):
+            while i < n and s.dates[i] < day:
+                i += 1
+            if i < n and s.dates[i] == day:
+                col[j] = s.values[i]
+        columns.append(col)
+    return dates, columns
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable
+
+from aurora_apis.fred_series import (
+    DateLike,
+    FREDRevisions,
+    FREDSeries,
+    from_epoch_day,
+    to_epoch_day,
+)
+
+if TYPE_CHECKING:
+    from aurora_apis.fred_client import FREDClient
+
+
+_MAGIC = b"FRD1"
+# magic, observation count, has-vintages flag
+_HEADER = struct.Struct("<4sQB")
+# date, value, realtime_start, realtime_end
+_REVISION = struct.Struct("<qdqq")
+# FRED's realtime_start for "every vintage ever published".
+_FULL_HISTORY = "1776-07-04"
+_LATEST = "9999-12-31"
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class FREDStore:
+    """
+    Local on-disk store of FRED series for incremental refreshes.
+
+    Each series is one binary file (header + int64 dates + float64 values
+    + optional int64 vintage column, native byte order) next to a small
+    JSON sidecar with sync metadata. `sync` asks FRED only for observations
+    from the last stored date onwards (minus `lookback_days`, to pick up
+    revisions of recent points) and splices them in, so a routine refresh
+    moves a handful of observations instead of the full history.
+
+    Vintages are tracked from the first sync on: each sync requests the
+    real-time period since the previous one, so every value FRED reported
+    in between is seen with its real `realtime_start`. A revised value is
+    appended to a `.rev` file with the period it was current for, and
+    `as_of` rebuilds the series as FRED reported it on a given day. Pass
+    `full_history=True` to the first sync to pull the complete vintage
+    history instead of starting from today.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _paths(self, series_id: str) -> tuple[Path, Path]:
+        if not _SAFE_ID.match(series_id):
+            raise ValueError(f"Invalid FRED series id: {series_id!r}")
+        return self.directory / f"{series_id}.fred", self.directory / f"{series_id}.json"
+
+    def _revisions_path(self, series_id: str) -> Path:
+        data_path, _ = self._paths(series_id)
+        return data_path.with_suffix(".rev")
+
+    def series_ids(self) -> Iterable[str]:
+        for path in sorted(self.directory.glob("*.fred")):
+            yield path.stem
+
+    def load(self, series_id: str) -> FREDSeries | None:
+        data_path, _ = self._paths(series_id)
+        if not data_path.exists():
+            return None
+        with open(data_path, "rb") as fh:
+            magic, count, has_vintages = _HEADER.unpack(fh.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{data_path} is not a FRED store file")
+            dates = array("q")
+            values = array("d")
+            dates.fromfile(fh, count)
+            values.fromfile(fh, count)
+            vintages = None
+            if has_vintages:
+                vintages = array("q")
+                vintages.fromfile(fh, count)
+        return FREDSeries(series_id, dates, values, vintages)
+
+    def metadata(self, series_id: str) -> Dict[str, object]:
+        _, meta_path = self._paths(series_id)
+        if not meta_path.exists():
+            return {}
+        with open(meta_path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def save(self, series: FREDSeries, **meta: object) -> None:
+        data_path, meta_path = self._paths(series.series_id)
+        header = _HEADER.pack(_MAGIC, len(series), series.vintages is not None)
+        with self._lock:
+            self._atomic_write(data_path, header, series.dates, series.values, series.vintages)
+            info = {
+                "series_id": series.series_id,
+                "count": len(series),
+                "last_date": from_epoch_day(series.dates[-1]).isoformat() if len(series) else None,
+                **meta,
+            }
+            self._atomic_write(meta_path, json.dumps(info).encode())
+
+    def _atomic_write(self, path: Path, *parts: bytes | array | None) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                for part in parts:
+                    if isinstance(part, array):
+                        part.tofile(fh)
+                    elif part is not None:
+                        fh.write(part)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def revisions(self, series_id: str) -> FREDRevisions:
+        """
+        Every superseded value recorded for `series_id`.
+        """
+        out = FREDRevisions()
+        path = self._revisions_path(series_id)
+        if not path.exists():
+            return out
+        # A sync interrupted before its save may have appended twice.
+        records = dict.fromkeys(_REVISION.iter_unpack(path.read_bytes()))
+        for record in sorted(records, key=lambda r: (r[0], r[2])):
+            out.append(*record)
+        return out
+
+    def _append_revisions(self, series_id: str, revisions: FREDRevisions) -> None:
+        if not len(revisions):
+            return
+        with open(self._revisions_path(series_id), "ab") as fh:
+            fh.write(b"".join(_REVISION.pack(*record) for record in revisions))
+
+    def as_of(self, series_id: str, when: DateLike) -> FREDSeries | None:
+        """
+        The series as FRED reported it on `when`: observations not yet
+        published then are left out, revised ones take their old value.
+        Requires vintages.
+        """
+        current = self.load(series_id)
+        if current is None:
+            return None
+        if current.vintages is None:
+            raise ValueError(f"{series_id} has no vintages")
+        day = to_epoch_day(when)
+        revisions = self.revisions(series_id)
+        dates = array("q")
+        values = array("d")
+        vintages = array("q")
+        for obs_day, value, vintage in zip(current.dates, current.values, current.vintages):
+            if vintage > day:
+                k = revisions.index_as_of(obs_day, day)
+                if k is None:
+                    continue
+                value, vintage = revisions.values[k], revisions.realtime_start[k]
+            dates.append(obs_day)
+            values.append(value)
+            vintages.append(vintage)
+        return FREDSeries(series_id, dates, values, vintages)
+
+    @staticmethod
+    def merge(
+        stored: FREDSeries,
+        update: FREDSeries,
+        revisions: FREDRevisions | None = None,
+    ) -> FREDSeries:
+        """
+        Splice `update` over `stored`: everything from the first updated
+        date onwards is replaced by the (complete, as FRED returns it) tail.
+
+        With vintages, `revisions` holds the superseded rows parsed from
+        `update` itself (see `FREDSeries.from_observations`). A stored value
+        FRED still reports keeps its earlier vintage; one it no longer
+        reports is appended to `revisions`, current until the day before
+        its replacement.
+        """
+        if not len(update):
+            return stored
+        if len(stored) and (stored.vintages is None) != (update.vintages is None):
+            raise ValueError(
+                f"Cannot merge {update.series_id} with and without vintages"
+            )
+        cut = bisect_left(stored.dates, update.dates[0])
+        dates = stored.dates[:cut] + update.dates
+        values = stored.values[:cut] + update.values
+        if update.vintages is None:
+            return FREDSeries(stored.series_id, dates, values)
+        vintages = (stored.vintages or array("q"))[:cut] + update.vintages
+        if stored.vintages is None:
+            return FREDSeries(stored.series_id, dates, values, vintages)
+
+        first: Dict[int, int] = {}
+        if revisions is not None:
+            for k, day in enumerate(revisions.dates):
+                first.setdefault(day, k)
+        positions = {day: cut + j for j, day in enumerate(update.dates)}
+        for i in range(cut, len(stored)):
+            day = stored.dates[i]
+            pos = positions.get(day)
+            if pos is None:
+                continue
+            k = first.get(day)
+            if k is not None:
+                first_value, first_start = revisions.values[k], revisions.realtime_start[k]  # type: ignore[union-attr]
+            else:
+                first_value, first_start = values[pos], vintages[pos]
+            old = stored.values[i]
+            if first_value == old or (math.isnan(first_value) and math.isnan(old)):
+                if k is not None:
+                    revisions.realtime_start[k] = stored.vintages[i]  # type: ignore[union-attr]
+                else:
+                    vintages[pos] = stored.vintages[i]
+            elif revisions is not None:
+                revisions.append(day, old, stored.vintages[i], first_start - 1)
+        return FREDSeries(stored.series_id, dates, values, vintages)
+
+    def sync(
+        self,
+        client: "FREDClient",
+        series_id: str,
+        lookback_days: int = 0,
+        full_history: bool = False,
+    ) -> int:
+        """
+        Bring `series_id` up to date and return the number of observation
+        rows received from FRED (one per vintage).
+        """
+        stored = self.load(series_id)
+        meta = self.metadata(series_id)
+        today = date.today().isoformat()
+        params: Dict[str, str] = {"realtime_end": _LATEST}
+        if stored is not None and len(stored):
+            start = from_epoch_day(stored.dates[-1]) - timedelta(days=lookback_days)
+            params["observation_start"] = start.isoformat()
+            params["realtime_start"] = str(meta.get("realtime_through") or today)
+        else:
+            params["realtime_start"] = _FULL_HISTORY if full_history else today
+
+        revisions = FREDRevisions()
+        update = FREDSeries.from_observations(
+            series_id, client.iter_observations(series_id, **params), revisions
+        )
+        rows = len(update) + len(revisions)
+        merged = update if stored is None else self.merge(stored, update, revisions)
+        with self._lock:
+            self._append_revisions(series_id, revisions)
+        self.save(merged, last_sync=time.time(), last_received=rows, realtime_through=today)
+        return rows
+
+    def sync_many(
+        self,
+        client: "FREDClient",
+        series_ids: Iterable[str],
+        lookback_days: int = 0,
+        full_history: bool = False,
+    ) -> Dict[str, int]:
+        return {
+            series_id: self.sync(
+                client, series_id, lookback_days=lookback_days, full_history=full_history
+            )
+            for series_id in series_ids
+        }
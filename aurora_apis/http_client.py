@@ -1,9 +1,124 @@
 from __future__ import annotations
 
 import base64
-import json
-from typing import Any, Dict, Mapping, MutableMapping, Tuple
-from urllib import parse, request
+import email.message
+import io
+import threading
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, MutableMapping, Sequence, Tuple
+from urllib import error, parse
+
+from aurora_apis.json_stream import iter_items
+from aurora_apis.metrics import Sample, add_collector, get_metrics
+from aurora_apis.resilience import CLOSED, HALF_OPEN, OPEN, Resilience
+from aurora_apis.response_cache import ResponseCache
+from aurora_apis.transport import HTTPResponse, PooledTransport, StreamingResponse, Transport
+
+
+# Called with the full URL before every request; may block (e.g. to wait
+# for a rate-limit token) or raise to reject the request.
+RequestGate = Callable[[str], None]
+
+_transport: Transport | None = None
+_transport_lock = threading.Lock()
+_request_gate: RequestGate | None = None
+_response_cache: ResponseCache | None = None
+_resilience: Resilience | None = None
+
+
+def get_transport() -> Transport:
+    """
+    Return the process-wide transport, creating a pooled one on first use.
+    """
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = PooledTransport()
+    return _transport
+
+
+def set_transport(transport: Transport | None) -> Transport | None:
+    """
+    Replace the process-wide transport and return the previous one.
+
+    Passing None resets to a fresh default `PooledTransport` on next use.
+    The previous transport is not closed; callers own its lifecycle.
+    """
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous
+
+
+def set_request_gate(gate: RequestGate | None) -> RequestGate | None:
+    """
+    Install a gate that every `http_request` passes through, returning the
+    previously installed one.
+    """
+    global _request_gate
+    previous, _request_gate = _request_gate, gate
+    return previous
+
+
+def set_response_cache(cache: ResponseCache | None) -> ResponseCache | None:
+    """
+    Serve `http_get` through `cache` (None disables caching), returning the
+    previously installed cache.
+    """
+    global _response_cache
+    previous, _response_cache = _response_cache, cache
+    return previous
+
+
+def get_response_cache() -> ResponseCache | None:
+    return _response_cache
+
+
+def set_resilience(resilience: Resilience | None) -> Resilience | None:
+    """
+    Apply retries and per-host circuit breakers to every `http_request`
+    (None disables them), returning the previously installed policy.
+    """
+    global _resilience
+    previous, _resilience = _resilience, resilience
+    return previous
+
+
+def get_resilience() -> Resilience | None:
+    return _resilience
+
+
+_CIRCUIT_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def _collect_http_state() -> Iterable[Sample]:
+    """
+    Response cache and circuit-breaker counters for metrics export.
+    """
+    cache = _response_cache
+    if cache is not None:
+        stats = cache.stats()
+        for name in ("hits", "misses", "coalesced", "evictions", "expirations"):
+            yield f"aurora_cache_{name}_total", "counter", {}, stats[name]
+        yield "aurora_cache_bytes", "gauge", {}, stats["bytes"]
+        yield "aurora_cache_entries", "gauge", {}, stats["entries"]
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        ratio = (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        yield "aurora_cache_hit_ratio", "gauge", {}, ratio
+    resilience = _resilience
+    if resilience is not None:
+        for host, stats in resilience.stats().items():
+            labels = {"host": host}
+            yield "aurora_circuit_state", "gauge", labels, _CIRCUIT_STATES[stats["state"]]
+            yield "aurora_circuit_opened_total", "counter", labels, stats["times_opened"]
+            yield "aurora_circuit_rejected_total", "counter", labels, stats["short_circuited"]
+            yield "aurora_http_retries_total", "counter", labels, stats["retries"]
+            yield "aurora_http_failures_total", "counter", labels, stats["failures"]
+
+
+add_collector(_collect_http_state)
 
 
 def _build_url(url: str, params: Mapping[str, Any] | None) -> str:
@@ -13,16 +128,153 @@ def _build_url(url: str, params: Mapping[str, Any] | None) -> str:
     return f"{url}?{query}" if query else url
 
 
+def _raise_for_status(resp: HTTPResponse) -> None:
+    if resp.status < 400:
+        return
+    hdrs = email.message.Message()
+    for key, value in resp.headers.items():
+        hdrs[key] = value
+    raise error.HTTPError(resp.url, resp.status, resp.reason, hdrs, io.BytesIO(resp.body))
+
+
+def http_request(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    body: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10,
+) -> HTTPResponse:
+    """
+    Send a request through the configured transport and return the raw
+    response. Raises `urllib.error.HTTPError` for 4xx/5xx statuses.
+    """
+    full_url = _build_url(url, params)
+
+    def send() -> HTTPResponse:
+        transport = get_transport()
+        metrics = get_metrics()
+        if metrics is None:
+            resp = transport.request(method, full_url, body=body, headers=headers, timeout=timeout)
+        else:
+            with metrics.time_request(method, full_url, len(body or b"")) as timer:
+                resp = transport.request(
+                    method, full_url, body=body, headers=headers, timeout=timeout
+                )
+                timer.done(resp.status, len(resp.body))
+        _raise_for_status(resp)
+        return resp
+
+    # The rate limiter runs outside the breaker: waiting on it says nothing
+    # about the host and must not hold a half-open probe slot.
+    request_gate = _request_gate
+    gate = None if request_gate is None else partial(request_gate, full_url)
+    resilience = _resilience
+    if resilience is None:
+        if gate is not None:
+            gate()
+        return send()
+    return resilience.call(method, full_url, send, gate=gate)
+
+
+@contextmanager
+def http_stream(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    body: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10,
+) -> Iterator[StreamingResponse]:
+    """
+    Like `http_request`, but the body is left unread for incremental
+    consumption. Raises `urllib.error.HTTPError` for 4xx/5xx statuses.
+
+    Circuit breakers apply, but a stream is never retried.
+    """
+    full_url = _build_url(url, params)
+    # Wait for the rate limiter before a half-open breaker hands out its
+    # single probe slot, so a gate failure cannot strand the probe.
+    gate = _request_gate
+    if gate is not None:
+        gate(full_url)
+    resilience = _resilience
+    host = ""
+    if resilience is not None:
+        host = resilience.host_of(full_url)
+        resilience.before_call(host)
+    metrics = get_metrics()
+    with ExitStack() as stack:
+        try:
+            with ExitStack() as timing:
+                # Times the request up to the response headers.
+                timer = None
+                if metrics is not None:
+                    timer = timing.enter_context(
+                        metrics.time_request(method, full_url, len(body or b""))
+                    )
+                resp = stack.enter_context(
+                    get_transport().stream(
+                        method, full_url, body=body, headers=headers, timeout=timeout
+                    )
+                )
+                if timer is not None:
+                    timer.done(resp.status, 0)
+            if resp.status >= 400:
+                _raise_for_status(
+                    HTTPResponse(resp.status, resp.reason, resp.headers, resp.read(), full_url)
+                )
+        except BaseException as exc:
+            if resilience is not None:
+                # Streams are not retried; this only updates the breaker.
+                resilience.on_error(host, method, exc, resilience.retry.max_retries)
+            raise
+        if resilience is not None:
+            resilience.breaker(host).record_success()
+        try:
+            yield resp
+        finally:
+            if metrics is not None and resp.bytes_read:
+                metrics.inc(
+                    "aurora_http_received_bytes_total",
+                    resp.bytes_read,
+                    host=parse.urlsplit(full_url).netloc,
+                )
+
+
+def http_get_items(
+    url: str,
+    path: Sequence[Any] = (),
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10,
+    chunk_size: int = 65536,
+) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """
+    GET a JSON document and yield the items of the container(s) at `path`
+    as they are decoded (see `json_stream.iter_items`). The connection is
+    held until the generator is exhausted or closed.
+    """
+    with http_stream("GET", url, params=params, headers=headers, timeout=timeout) as resp:
+        yield from iter_items(resp.iter_bytes(chunk_size), path)
+
+
 def http_get(
     url: str,
     params: Mapping[str, Any] | None = None,
     headers: Mapping[str, str] | None = None,
     timeout: float = 10,
 ) -> Dict[str, Any]:
+    cache = _response_cache
+    if cache is None:
+        resp = http_request("GET", url, params=params, headers=headers, timeout=timeout)
+        return resp.json()
+
     full_url = _build_url(url, params)
-    req = request.Request(full_url, headers=dict(headers or {}))
-    with request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
-        return json.load(resp)
+    return cache.get_or_fetch(
+        full_url,
+        lambda: http_request("GET", full_url, headers=headers, timeout=timeout),
+    )
 
 
 def http_post(
@@ -33,13 +285,15 @@ def http_post(
     timeout: float = 10,
 ) -> Dict[str, Any]:
     body = parse.urlencode(data or {}).encode()
-    req_headers: Dict[str, str] = dict(headers or {})
+    req_headers: Dict[str, str] = {
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
+    req_headers.update(headers or {})
 
     if auth_basic:
         user, password = auth_basic
         token = base64.b64encode(f"{user}:{password}".encode()).decode()
         req_headers["Authorization"] = f"Basic {token}"
 
-    req = request.Request(url, data=body, headers=req_headers)
-    with request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
-        return json.load(resp)
+    resp = http_request("POST", url, body=body, headers=req_headers, timeout=timeout)
+    return resp.json()
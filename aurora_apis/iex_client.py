@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("iex")
 class IEXClient:
     """
     Minimal IEX Cloud client.
@@ -18,14 +22,41 @@ class IEXClient:
     def __init__(self, api_token: str | None = None) -> None:
         self.api_token = api_token or os.getenv("IEX_API_TOKEN")
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare(self, path: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         if not self.api_token:
             raise RuntimeError("IEX_API_TOKEN is not set")
 
         params = dict(params)
         params["token"] = self.api_token
-        url = f"{self.BASE_URL}{path}"
+        return f"{self.BASE_URL}{path}", params
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
         return http_get(url, params=params)
 
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         return self._get(f"/stock/{symbol}/quote", {})
+
+
+@instrumented("iex")
+class AsyncIEXClient(IEXClient):
+    """
+    Asyncio variant of IEXClient.
+    """
+
+    def __init__(
+        self,
+        api_token: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(api_token=api_token)
+        self.transport = transport
+
+    async def _get(  # type: ignore[override]
+        self, path: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
+        return await async_http_get(url, params=params, transport=self.transport)
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:  # type: ignore[override]
+        return await self._get(f"/stock/{symbol}/quote", {})
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import codecs
+import json
+from json.decoder import scanstring
+from typing import Any, Iterable, Iterator, Sequence, Tuple
+
+# Path element that matches every member of an object or array.
+WILDCARD = "*"
+
+_WHITESPACE = " \t\n\r"
+_COMPACT_AFTER = 1 << 16
+
+
+class _StreamReader:
+    """
+    Cursor over a JSON document arriving as byte chunks.
+
+    Only the unconsumed tail of the document is buffered; consumed text is
+    dropped as the cursor advances.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_AFTER:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of JSON stream")
+        self.pos += 1
+
+    def read_string(self) -> str:
+        self.expect('"')
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self.pos = end
+            return value
+
+    def read_value(self) -> Any:
+        self.peek()
+        min_len = len(self.buf)
+        while True:
+            if len(self.buf) >= min_len or self.eof:
+                try:
+                    value, end = self._json.raw_decode(self.buf, self.pos)
+                except json.JSONDecodeError:
+                    end = -1
+                # A value that runs to the end of the buffer (e.g. a number)
+                # may continue in the next chunk.
+                if end != -1 and (end < len(self.buf) or self.eof):
+                    self.pos = end
+                    return value
+                if self.eof:
+                    raise ValueError(f"Invalid JSON value at offset {self.pos}")
+                # Grow geometrically so a large value is re-scanned O(log n) times.
+                min_len = len(self.buf) + max(len(self.buf) - self.pos, 1)
+            self._fill()
+
+    def members(self) -> Iterator[Any]:
+        """
+        Iterate the container at the cursor, yielding each member's key (or
+        index) with the cursor positioned on its value. The caller must
+        consume the value before advancing.
+        """
+        opener = self.peek()
+        if opener not in ("[", "{"):
+            raise ValueError(f"Expected an object or array at offset {self.pos}")
+        is_object = opener == "{"
+        closer = "}" if is_object else "]"
+        self.pos += 1
+        index = 0
+        if self.peek() == closer:
+            self.pos += 1
+            return
+        while True:
+            if is_object:
+                key: Any = self.read_string()
+                self.expect(":")
+            else:
+                key = index
+            yield key
+            index += 1
+            sep = self.peek()
+            self.pos += 1
+            if sep == closer:
+                return
+            if sep != ",":
+                raise ValueError(f"Expected ',' or {closer!r} at offset {self.pos - 1}")
+
+
+def _walk(
+    reader: _StreamReader, path: Sequence[Any], depth: int, prefix: Tuple[Any, ...]
+) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    if depth == len(path):
+        for key in reader.members():
+            yield prefix + (key,), reader.read_value()
+        return
+
+    want = path[depth]
+    if reader.peek() not in ("[", "{"):
+        reader.read_value()
+        return
+    for key in reader.members():
+        if want == WILDCARD or key == want:
+            if reader.peek() in ("[", "{"):
+                yield from _walk(reader, path, depth + 1, prefix + (key,))
+                continue
+        reader.read_value()
+
+
+def iter_items(
+    chunks: Iterable[bytes], path: Sequence[Any] = ()
+) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """
+    Incrementally decode the members of the container(s) at `path`.
+
+    Yields `(key_path, value)` for every element of an array or member of an
+    object found at `path`, where `key_path` is the concrete path of the
+    item (object keys and array indexes). `path` elements may be
+    `WILDCARD` to descend into every member at that level. Members outside
+    `path` are skipped (each is decoded and dropped). Memory use is bounded
+    by the largest single item or skipped member, not by the document.
+
+    >>> list(iter_items([b'{"a": [1, ', b'2]}'], ["a"]))
+    [(('a', 0), 1), (('a', 1), 2)]
+    """
+    reader = _StreamReader(chunks)
+    yield from _walk(reader, list(path), 0, ())
+
+
+def iter_values(chunks: Iterable[bytes], path: Sequence[Any] = ()) -> Iterator[Any]:
+    """
+    Like `iter_items`, but yields only the values.
+    """
+    for _, value in iter_items(chunks, path):
+        yield value
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+
+from aurora_apis.websocket import WebSocket, connect
+
+
+@dataclass
+class Tick:
+    """
+    Normalized streaming trade or quote. `timestamp` is exchange time in
+    epoch seconds; fields that do not apply to `kind` are None.
+    """
+
+    symbol: str
+    kind: str  # "trade" or "quote"
+    timestamp: float
+    source: str
+    price: float | None = None
+    size: float | None = None
+    bid: float | None = None
+    ask: float | None = None
+    bid_size: float | None = None
+    ask_size: float | None = None
+
+
+TickHandler = Callable[[Tick], None]
+DisconnectHandler = Callable[["MarketStream", BaseException], None]
+
+
+class MarketStream:
+    """
+    Long-lived WebSocket subscription with automatic reconnect.
+
+    `run()` connects, authenticates, subscribes to every symbol in
+    `symbols` and feeds parsed ticks to `on_tick` until `close()` is called.
+    A dropped connection is retried with jittered exponential backoff
+    (reset after a successful connect) and the full subscription set is
+    replayed, so callers never resubscribe by hand. `subscribe` and
+    `unsubscribe` may be called at any time, connected or not.
+
+    Authentication must finish within `connect_timeout`. Once connected, a
+    watchdog pings the server after `idle_timeout` seconds without any
+    frame and drops the connection (counted in `stats["timeouts"]`) if
+    nothing arrives within `pong_timeout` more, so a half-open connection
+    reconnects instead of blocking forever. `idle_timeout=None` disables it.
+    """
+
+    provider = ""
+
+    def __init__(
+        self,
+        url: str,
+        on_tick: TickHandler,
+        on_disconnect: DisconnectHandler | None = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        connect_timeout: float = 10.0,
+        idle_timeout: float | None = 30.0,
+        pong_timeout: float = 10.0,
+    ) -> None:
+        self.url = url
+        self.on_tick = on_tick
+        self.on_disconnect = on_disconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        self.pong_timeout = pong_timeout
+        self.symbols: set[str] = set()
+        self.connected = asyncio.Event()
+        self.stats: Dict[str, int] = {"connects": 0, "messages": 0, "ticks": 0, "timeouts": 0}
+        self._ws: WebSocket | None = None
+        self._closing = False
+
+    # Provider hooks.
+
+    async def _authenticate(self, ws: WebSocket) -> None:
+        pass
+
+    def _subscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _unsubscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _parse(self, payload: Any) -> Iterable[Tick]:
+        raise NotImplementedError
+
+    # Subscription management.
+
+    async def _send_all(self, messages: List[Dict[str, Any]]) -> None:
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+        for message in messages:
+            await ws.send(json.dumps(message))
+
+    async def subscribe(self, symbols: Iterable[str]) -> None:
+        new = sorted({s.upper() for s in symbols} - self.symbols)
+        self.symbols.update(new)
+        if new:
+            await self._send_all(self._subscribe_messages(new))
+
+    async def unsubscribe(self, symbols: Iterable[str]) -> None:
+        gone = sorted({s.upper() for s in symbols} & self.symbols)
+        self.symbols.difference_update(gone)
+        if gone:
+            await self._send_all(self._unsubscribe_messages(gone))
+
+    # Connection loop.
+
+    async def run(self) -> None:
+        delay = self.reconnect_delay
+        while not self._closing:
+            try:
+                ws = await connect(self.url, timeout=self.connect_timeout)
+                self._ws = ws
+                await asyncio.wait_for(self._authenticate(ws), self.connect_timeout)
+                if self.symbols:
+                    await self._send_all(self._subscribe_messages(sorted(self.symbols)))
+                self.stats["connects"] += 1
+                self.connected.set()
+                delay = self.reconnect_delay
+                await self._consume(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - any failure means reconnect
+                if self._closing:
+                    break
+                if self.on_disconnect is not None:
+                    self.on_disconnect(self, exc)
+            finally:
+                self.connected.clear()
+                if self._ws is not None:
+                    await self._ws.close()
+                    self._ws = None
+            if self._closing:
+                break
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _consume(self, ws: WebSocket) -> None:
+        watchdog = None
+        if self.idle_timeout is not None:
+            watchdog = asyncio.create_task(self._watchdog(ws, self.idle_timeout))
+        try:
+            while True:
+                try:
+                    raw = await ws.recv()
+                except ConnectionError:
+                    if watchdog is not None and watchdog.done() and watchdog.result():
+                        raise TimeoutError(
+                            f"{self.provider} stream silent for "
+                            f"{self.idle_timeout + self.pong_timeout:g}s"
+                        ) from None
+                    raise
+                self.stats["messages"] += 1
+                for tick in self._parse(json.loads(raw)):
+                    self.stats["ticks"] += 1
+                    self.on_tick(tick)
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+    async def _watchdog(self, ws: WebSocket, idle_timeout: float) -> bool:
+        """
+        Ping an idle connection and abort it if the server stays silent.
+        True if the connection was aborted.
+        """
+        while not ws.closed:
+            idle = time.monotonic() - ws.last_received
+            if idle < idle_timeout:
+                await asyncio.sleep(idle_timeout - idle)
+                continue
+            pinged = time.monotonic()
+            try:
+                await asyncio.wait_for(ws.ping(), self.pong_timeout)
+                await asyncio.sleep(self.pong_timeout)
+            except (ConnectionError, OSError, asyncio.TimeoutError):
+                pass
+            if ws.last_received < pinged and not ws.closed:
+                self.stats["timeouts"] += 1
+                ws.abort()
+                return True
+        return False
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._ws is not None:
+            await self._ws.close()
+
+
+class PolygonStream(MarketStream):
+    """
+    Polygon stocks feed: `T.<sym>` trades and `Q.<sym>` NBBO quotes.
+    """
+
+    provider = "polygon"
+    URL = "wss://socket.polygon.io/stocks"
+
+    def __init__(
+        self,
+        api_key: str,
+        on_tick: TickHandler,
+        url: str | None = None,
+        channels: Iterable[str] = ("T", "Q"),
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(url or self.URL, on_tick, **kwargs)
+        self.api_key = api_key
+        self.channels = tuple(channels)
+
+    async def _authenticate(self, ws: WebSocket) -> None:
+        await ws.send(json.dumps({"action": "auth", "params": self.api_key}))
+        while True:
+            for event in json.loads(await ws.recv()):
+                status = event.get("status")
+                if status == "auth_success":
+                    return
+                if status == "auth_failed":
+                    raise PermissionError(f"Polygon stream auth failed: {event.get('message')}")
+
+    def _params(self, symbols: Iterable[str]) -> str:
+        return ",".join(f"{ch}.{s}" for s in symbols for ch in self.channels)
+
+    def _subscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        return [{"action": "subscribe", "params": self._params(symbols)}]
+
+    def _unsubscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        return [{"action": "unsubscribe", "params": self._params(symbols)}]
+
+    def _parse(self, payload: Any) -> Iterable[Tick]:
+        for event in payload if isinstance(payload, list) else [payload]:
+            ev = event.get("ev")
+            if ev == "T":
+                yield Tick(
+                    symbol=event["sym"],
+                    kind="trade",
+                    timestamp=event.get("t", 0) / 1000.0,
+                    source=self.provider,
+                    price=event.get("p"),
+                    size=event.get("s"),
+                )
+            elif ev == "Q":
+                yield Tick(
+                    symbol=event["sym"],
+                    kind="quote",
+                    timestamp=event.get("t", 0) / 1000.0,
+                    source=self.provider,
+                    bid=event.get("bp"),
+                    ask=event.get("ap"),
+                    bid_size=event.get("bs"),
+                    ask_size=event.get("as"),
+                )
+
+
+class FinnhubStream(MarketStream):
+    """
+    Finnhub trade feed. Finnhub's WebSocket only carries trades, so ticks
+    from this stream never have bid/ask.
+    """
+
+    provider = "finnhub"
+    URL = "wss://ws.finnhub.io"
+
+    def __init__(
+        self,
+        api_key: str,
+        on_tick: TickHandler,
+        url: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(f"{url or self.URL}?token={api_key}", on_tick, **kwargs)
+
+    def _subscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        return [{"type": "subscribe", "symbol": s} for s in symbols]
+
+    def _unsubscribe_messages(self, symbols: Iterable[str]) -> List[Dict[str, Any]]:
+        return [{"type": "unsubscribe", "symbol": s} for s in symbols]
+
+    def _parse(self, payload: Any) -> Iterable[Tick]:
+        if payload.get("type") != "trade":
+            return
+        for trade in payload.get("data") or []:
+            yield Tick(
+                symbol=trade["s"],
+                kind="trade",
+                timestamp=trade.get("t", 0) / 1000.0,
+                source=self.provider,
+                price=trade.get("p"),
+                size=trade.get("v"),
+            )
+
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from urllib import parse
+
+# Upper bounds in seconds; the implicit last bucket is +Inf.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# (name, kind, labels, value) - what collectors yield at export time.
+Sample = Tuple[str, str, Dict[str, str], float]
+Collector = Callable[[], Iterable[Sample]]
+
+HELP: Dict[str, str] = {
+    "aurora_http_request_seconds": "Upstream HTTP request latency, per attempt.",
+    "aurora_http_requests_total": "Upstream HTTP requests by status ('error' if none).",
+    "aurora_http_sent_bytes_total": "Request body bytes sent upstream.",
+    "aurora_http_received_bytes_total": "Response body bytes received from upstream.",
+    "aurora_http_in_flight": "Upstream HTTP requests currently in progress.",
+    "aurora_client_call_seconds": "API client method latency, including retries.",
+    "aurora_client_errors_total": "API client method calls that raised.",
+    "aurora_client_in_flight": "API client method calls currently in progress.",
+    "aurora_snapshot_seconds": "DataFusionBus snapshot build time.",
+    "aurora_snapshot_source_seconds": "Time spent fetching one snapshot source.",
+    "aurora_snapshot_live_hits_total": "Snapshot sources served from streamed data.",
+    "aurora_cache_hit_ratio": "Share of cacheable GETs answered without a new upstream call.",
+    "aurora_circuit_state": "Circuit breaker state per host (0 closed, 1 half-open, 2 open).",
+    "aurora_http_retries_total": "Retried upstream attempts per host.",
+}
+
+
+def _key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: Tuple[str, str] | None = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram; quantiles are interpolated within the
+    bucket that contains them.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i else 0.0
+                if i == len(self.bounds):
+                    return lower
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        out = []
+        total = 0
+        for bound, n in zip((*self.bounds, math.inf), self.counts):
+            total += n
+            out.append((bound, total))
+        return out
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters, gauges and histograms keyed by name + labels,
+    exportable as Prometheus text (`to_prometheus`) or JSON (`to_json`).
+
+    Collectors registered with `add_collector` are polled at export time
+    for values that live elsewhere (cache hit counts, breaker states).
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = _key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def add_gauge(self, name: str, delta: float, **labels: Any) -> None:
+        key = _key(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + delta
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram(self.buckets)
+            hist.observe(value)
+
+    def histogram(self, name: str, **labels: Any) -> Histogram | None:
+        with self._lock:
+            return self._histograms.get(name, {}).get(_key(labels))
+
+    def value(self, name: str, **labels: Any) -> float:
+        """
+        Current value of a counter or gauge (0 if never touched).
+        """
+        key = _key(labels)
+        with self._lock:
+            for table in (self._counters, self._gauges):
+                if key in table.get(name, {}):
+                    return table[name][key]
+        return 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def _collected(self) -> Tuple[Dict[str, Dict[LabelKey, float]], Dict[str, Dict[LabelKey, float]]]:
+        with self._lock:
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            gauges = {n: dict(s) for n, s in self._gauges.items()}
+        for collector in list(_collectors):
+            for name, kind, labels, value in collector():
+                table = counters if kind == "counter" else gauges
+                table.setdefault(name, {})[_key(labels)] = value
+        return counters, gauges
+
+    def _histogram_copies(self) -> Dict[str, Dict[LabelKey, Histogram]]:
+        out: Dict[str, Dict[LabelKey, Histogram]] = {}
+        with self._lock:
+            for name, series in self._histograms.items():
+                out[name] = {}
+                for key, hist in series.items():
+                    copy = Histogram(hist.bounds)
+                    copy.counts = list(hist.counts)
+                    copy.sum = hist.sum
+                    copy.count = hist.count
+                    out[name][key] = copy
+        return out
+
+    def to_prometheus(self) -> str:
+        counters, gauges = self._collected()
+        lines: List[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for kind, table in (("counter", counters), ("gauge", gauges)):
+            for name in sorted(table):
+                header(name, kind)
+                for key, value in sorted(table[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        for name, series in sorted(self._histogram_copies().items()):
+            header(name, "histogram")
+            for key, hist in sorted(series.items()):
+                for bound, total in hist.cumulative():
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{name}_bucket{_format_labels(key, le)} {total}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(hist.sum)}")
+                lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        JSON-ready view; histograms are summarized as count/sum/p50/p95/p99.
+        """
+        counters, gauges = self._collected()
+
+        def plain(table: Dict[str, Dict[LabelKey, float]]) -> Dict[str, List[Dict[str, Any]]]:
+            return {
+                name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                for name, series in sorted(table.items())
+            }
+
+        histograms = {
+            name: [
+                {
+                    "labels": dict(key),
+                    "count": hist.count,
+                    "sum": hist.sum,
+                    "mean": hist.sum / hist.count if hist.count else None,
+                    **{
+                        f"p{int(q * 100)}": hist.quantile(q) if hist.count else None
+                        for q in (0.5, 0.95, 0.99)
+                    },
+                }
+                for key, hist in sorted(series.items())
+            ]
+            for name, series in sorted(self._histogram_copies().items())
+        }
+        return {"counters": plain(counters), "gauges": plain(gauges), "histograms": histograms}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def time_request(self, method: str, url: str, sent: int = 0) -> "RequestTimer":
+        return RequestTimer(self, method, parse.urlsplit(url).netloc, sent)
+
+    def time_call(
+        self, name: str, in_flight: str | None = None, errors: str | None = None, **labels: Any
+    ) -> "CallTimer":
+        return CallTimer(self, name, in_flight, errors, labels)
+
+
+class RequestTimer:
+    """
+    Times one upstream HTTP attempt; call `done(status, received)` on
+    completion. Exiting without `done` records the attempt as an error.
+    """
+
+    __slots__ = ("registry", "method", "host", "sent", "status", "received", "start")
+
+    def __init__(self, registry: MetricsRegistry, method: str, host: str, sent: int) -> None:
+        self.registry = registry
+        self.method = method
+        self.host = host
+        self.sent = sent
+        self.status = "error"
+        self.received = 0
+        self.start = 0.0
+
+    def done(self, status: int, received: int) -> None:
+        self.status = str(status)
+        self.received = received
+
+    def __enter__(self) -> "RequestTimer":
+        self.registry.add_gauge("aurora_http_in_flight", 1, host=self.host)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        registry = self.registry
+        registry.add_gauge("aurora_http_in_flight", -1, host=self.host)
+        registry.observe("aurora_http_request_seconds", elapsed, host=self.host, method=self.method)
+        registry.inc(
+            "aurora_http_requests_total", host=self.host, method=self.method, status=self.status
+        )
+        if self.sent:
+            registry.inc("aurora_http_sent_bytes_total", self.sent, host=self.host)
+        if self.received:
+            registry.inc("aurora_http_received_bytes_total", self.received, host=self.host)
+
+
+class CallTimer:
+    """
+    Times a block into histogram `name`, counting `errors` if it raises
+    and tracking the gauge `in_flight` while it runs.
+    """
+
+    __slots__ = ("registry", "name", "in_flight", "errors", "labels", "start")
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        in_flight: str | None,
+        errors: str | None,
+        labels: Dict[str, Any],
+    ) -> None:
+        self.registry = registry
+        self.name = name
+        self.in_flight = in_flight
+        self.errors = errors
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self) -> "CallTimer":
+        if self.in_flight:
+            self.registry.add_gauge(self.in_flight, 1, **self.labels)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        if self.in_flight:
+            self.registry.add_gauge(self.in_flight, -1, **self.labels)
+        self.registry.observe(self.name, elapsed, **self.labels)
+        if exc_type is not None and self.errors:
+            self.registry.inc(self.errors, **self.labels)
+
+
+_metrics: MetricsRegistry | None = MetricsRegistry()
+_collectors: List[Collector] = []
+
+
+def get_metrics() -> MetricsRegistry | None:
+    return _metrics
+
+
+def set_metrics(registry: MetricsRegistry | None) -> MetricsRegistry | None:
+    """
+    Replace the process-wide registry (None disables instrumentation) and
+    return the previous one.
+    """
+    global _metrics
+    previous, _metrics = _metrics, registry
+    return previous
+
+
+def add_collector(collector: Collector) -> None:
+    """
+    Poll `collector` for extra samples whenever any registry is exported.
+    """
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+def instrumented(provider: str) -> Callable[[type], type]:
+    """
+    Class decorator timing every public method defined on the class into
+    `aurora_client_call_seconds{provider, method}`. Coroutine methods are
+    timed until they complete; generator methods are left alone since
+    their work happens while the caller iterates. Calls that raise also
+    count towards `aurora_client_errors_total`.
+    """
+
+    def wrap(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        labels = {"provider": provider, "method": name}
+        names = ("aurora_client_call_seconds", "aurora_client_in_flight", "aurora_client_errors_total")
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                registry = _metrics
+                if registry is None:
+                    return await func(*args, **kwargs)
+                with registry.time_call(*names, **labels):
+                    return await func(*args, **kwargs)
+
+            return timed_async
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            registry = _metrics
+            if registry is None:
+                return func(*args, **kwargs)
+            with registry.time_call(*names, **labels):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def decorate(cls: type) -> type:
+        for name, attr in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(attr):
+                continue
+            inner = inspect.unwrap(attr)
+            # Generators (and @contextmanager methods) do their work later.
+            if inspect.isgeneratorfunction(inner) or inspect.isasyncgenfunction(inner):
+                continue
+            setattr(cls, name, wrap(name, attr))
+        return cls
+
+    return decorate
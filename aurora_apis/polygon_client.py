@@ -1,38 +1,108 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.market_stream import PolygonStream, TickHandler
+from aurora_apis.metrics import instrumented
+from aurora_apis.polygon_flatfiles import PolygonFlatFiles
+from aurora_apis.s3_client import S3Client
 
 
+@instrumented("polygon")
 class PolygonClient:
     """
     Minimal Polygon client for last trade / quote.
     """
 
     BASE_URL = "https://api.polygon.io"
+    S3_ENDPOINT = "https://files.polygon.io"
 
     def __init__(
         self,
         api_key: str | None = None,
         access_key_id: str | None = None,
         secret_access_key: str | None = None,
+        s3_endpoint: str | None = None,
     ) -> None:
         self.api_key = api_key or os.getenv("POLYGON_API_KEY")
         self.access_key_id = access_key_id or os.getenv("POLYGON_ACCESS_KEY_ID")
         self.secret_access_key = (
             secret_access_key or os.getenv("POLYGON_SECRET_ACCESS_KEY")
         )
+        self.s3_endpoint = (
+            s3_endpoint or os.getenv("POLYGON_S3_ENDPOINT") or self.S3_ENDPOINT
+        )
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def stream(self, on_tick: TickHandler, **kwargs: Any) -> PolygonStream:
+        """
+        WebSocket trade/quote stream; run it with `await stream.run()`.
+        """
+        if not self.api_key:
+            raise RuntimeError("POLYGON_API_KEY is not set")
+        return PolygonStream(self.api_key, on_tick, **kwargs)
+
+    def flat_files(self) -> PolygonFlatFiles:
+        """
+        Bulk loader for the flat files on Polygon's S3-compatible endpoint.
+        """
+        if not self.access_key_id or not self.secret_access_key:
+            raise RuntimeError(
+                "POLYGON_ACCESS_KEY_ID / POLYGON_SECRET_ACCESS_KEY are not set"
+            )
+        return PolygonFlatFiles(
+            S3Client(self.s3_endpoint, self.access_key_id, self.secret_access_key)
+        )
+
+    def _prepare(self, path: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         if not self.api_key:
             raise RuntimeError("POLYGON_API_KEY is not set")
 
         params = dict(params)
         params["apiKey"] = self.api_key
-        url = f"{self.BASE_URL}{path}"
+        return f"{self.BASE_URL}{path}", params
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
         return http_get(url, params=params)
 
     def get_last_trade(self, symbol: str) -> Dict[str, Any]:
         return self._get(f"/v2/last/trade/{symbol}", {})
+
+
+@instrumented("polygon")
+class AsyncPolygonClient(PolygonClient):
+    """
+    Asyncio variant of PolygonClient.
+
+    `stream()` is already asyncio-native. `flat_files()` returns the same
+    blocking bulk loader as the sync client; run it outside the event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        access_key_id: str | None = None,
+        secret_access_key: str | None = None,
+        s3_endpoint: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(
+            api_key=api_key,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            s3_endpoint=s3_endpoint,
+        )
+        self.transport = transport
+
+    async def _get(  # type: ignore[override]
+        self, path: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        url, params = self._prepare(path, params)
+        return await async_http_get(url, params=params, transport=self.transport)
+
+    async def get_last_trade(self, symbol: str) -> Dict[str, Any]:  # type: ignore[override]
+        return await self._get(f"/v2/last/trade/{symbol}", {})
@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import shutil
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Sequence
+from urllib import error
+
+from aurora_apis.s3_client import S3Client
+
+
+# Stored for integer cells that are empty in the CSV (e.g. trf_timestamp).
+MISSING_INT = -(2**63)
+_TEXT = "s"
+
+
+@dataclass(frozen=True)
+class FlatFileDataset:
+    """
+    A Polygon flat-file family: S3 prefix plus the storage type of each CSV
+    column ("q" int64, "d" float64, "s" text). The `ticker` column is the
+    row index key and is not stored as a column.
+    """
+
+    name: str
+    prefix: str
+    columns: Dict[str, str] = field(default_factory=dict)
+
+    def key_for(self, day: date) -> str:
+        return f"{self.prefix}/{day:%Y}/{day:%m}/{day.isoformat()}.csv.gz"
+
+
+_AGG_COLUMNS = {
+    "volume": "d",
+    "open": "d",
+    "close": "d",
+    "high": "d",
+    "low": "d",
+    "window_start": "q",
+    "transactions": "q",
+}
+
+DATASETS: Dict[str, FlatFileDataset] = {
+    "trades": FlatFileDataset(
+        "trades",
+        "us_stocks_sip/trades_v1",
+        {
+            "conditions": _TEXT,
+            "correction": "q",
+            "exchange": "q",
+            "id": _TEXT,
+            "participant_timestamp": "q",
+            "price": "d",
+            "sequence_number": "q",
+            "sip_timestamp": "q",
+            "size": "d",
+            "tape": "q",
+            "trf_id": "q",
+            "trf_timestamp": "q",
+        },
+    ),
+    "quotes": FlatFileDataset(
+        "quotes",
+        "us_stocks_sip/quotes_v1",
+        {
+            "ask_exchange": "q",
+            "ask_price": "d",
+            "ask_size": "d",
+            "bid_exchange": "q",
+            "bid_price": "d",
+            "bid_size": "d",
+            "conditions": _TEXT,
+            "indicators": _TEXT,
+            "participant_timestamp": "q",
+            "sequence_number": "q",
+            "sip_timestamp": "q",
+            "tape": "q",
+            "trf_timestamp": "q",
+        },
+    ),
+    "minute_aggs": FlatFileDataset("minute_aggs", "us_stocks_sip/minute_aggs_v1", _AGG_COLUMNS),
+    "day_aggs": FlatFileDataset("day_aggs", "us_stocks_sip/day_aggs_v1", _AGG_COLUMNS),
+}
+
+
+def iter_gzip_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decompress a gzip stream chunk by chunk and yield decoded text lines.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pending = b""
+    for chunk in chunks:
+        data = pending + decompressor.decompress(chunk)
+        lines = data.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8")
+    pending += decompressor.flush()
+    if pending:
+        yield pending.decode("utf-8")
+
+
+def _convert(typecode: str, cell: str) -> object:
+    if typecode == _TEXT:
+        return cell
+    if cell == "":
+        return MISSING_INT if typecode == "q" else float("nan")
+    return int(cell) if typecode == "q" else float(cell)
+
+
+class FlatFileStore:
+    """
+    Local columnar store with one partition per dataset and day:
+    `<root>/<dataset>/date=YYYY-MM-DD/` holding a single `data.col` file
+    and its `_index.json`.
+
+    `data.col` is the day's columns back to back, rows in file order:
+    numeric columns as raw int64/float64 arrays (native byte order), text
+    columns as concatenated UTF-8 plus an int64 array of end offsets. The
+    index records where each column starts and, per ticker, the row runs
+    it occupies (one run per ticker, as Polygon files are sorted by
+    ticker). Loading a symbol's column is a seek and a read per run.
+
+    Columns are spooled to one open file each while the day streams in and
+    concatenated at the end; the day is built in a temporary directory and
+    renamed into place, so a partition either exists in full or not at
+    all. Days with no file upstream get a `_MISSING` marker instead.
+    """
+
+    DATA_FILE = "data.col"
+    INDEX_FILE = "_index.json"
+    MISSING_FILE = "_MISSING"
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def day_dir(self, dataset: str, day: date) -> Path:
+        return self.root / dataset / f"date={day.isoformat()}"
+
+    def has_day(self, dataset: str, day: date) -> bool:
+        return (self.day_dir(dataset, day) / self.INDEX_FILE).exists()
+
+    def is_missing(self, dataset: str, day: date) -> bool:
+        """
+        True if upstream was known to have no file for the day.
+        """
+        return (self.day_dir(dataset, day) / self.MISSING_FILE).exists()
+
+    def mark_missing(self, dataset: str, day: date, status: int) -> None:
+        target = self.day_dir(dataset, day)
+        target.mkdir(parents=True, exist_ok=True)
+        (target / self.MISSING_FILE).write_text(json.dumps({"status": status}))
+
+    def _index(self, dataset: str, day: date) -> Dict[str, Any]:
+        with open(self.day_dir(dataset, day) / self.INDEX_FILE) as fh:
+            return json.load(fh)
+
+    def symbols(self, dataset: str, day: date) -> List[str]:
+        if not self.has_day(dataset, day):
+            return []
+        return sorted(self._index(dataset, day)["symbols"])
+
+    def write_day(
+        self,
+        dataset: FlatFileDataset,
+        day: date,
+        rows: Iterable[Sequence[str]],
+        symbols: Iterable[str] | None = None,
+        flush_rows: int = 100_000,
+    ) -> Dict[str, int]:
+        """
+        Write CSV rows (header first) for one day, indexed by ticker.
+        Returns rows written per symbol.
+        """
+        wanted = set(symbols) if symbols is not None else None
+        # Pull the header first: a missing file (HTTP 404) or a bad header
+        # fails here, before anything is created on disk.
+        row_iter = iter(rows)
+        header = next(row_iter, None)
+        if header is None:
+            raise ValueError(f"Empty flat file for {dataset.name} {day}")
+        if "ticker" not in header:
+            raise ValueError(f"No ticker column in flat file for {dataset.name} {day}")
+        ticker_idx = header.index("ticker")
+        layout = [
+            (i, name, dataset.columns.get(name, _TEXT))
+            for i, name in enumerate(header)
+            if i != ticker_idx
+        ]
+
+        # symbol -> [[first row, row count], ...]
+        runs: Dict[str, List[List[int]]] = {}
+        buffers: Dict[str, array | List[str]] = {
+            name: ([] if code == _TEXT else array(code)) for _, name, code in layout
+        }
+        text_end = {name: 0 for _, name, code in layout if code == _TEXT}
+        spools: Dict[str, BinaryIO] = {}
+        current: str | None = None
+        written = 0
+
+        def flush() -> None:
+            for _, name, code in layout:
+                values = buffers[name]
+                if code == _TEXT:
+                    encoded = [v.encode("utf-8") for v in values]
+                    ends = array("q")
+                    end = text_end[name]
+                    for item in encoded:
+                        end += len(item)
+                        ends.append(end)
+                    text_end[name] = end
+                    spools[name].write(b"".join(encoded))
+                    ends.tofile(spools[f"{name}.ends"])
+                    values.clear()  # type: ignore[union-attr]
+                else:
+                    values.tofile(spools[name])  # type: ignore[union-attr]
+                    del values[:]
+
+        final_dir = self.day_dir(dataset.name, day)
+        tmp_dir = final_dir.with_name(f".tmp-{final_dir.name}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        try:
+            # (spool key, column, index field); text end offsets go last.
+            segments = [(name, name, "offset") for _, name, _ in layout] + [
+                (f"{name}.ends", name, "ends") for _, name, code in layout if code == _TEXT
+            ]
+            for n, (segment, _, _) in enumerate(segments):
+                spools[segment] = open(tmp_dir / f"spool-{n}", "wb")
+
+            for row in row_iter:
+                if not row:
+                    continue
+                symbol = row[ticker_idx]
+                if wanted is not None and symbol not in wanted:
+                    continue
+                if symbol != current:
+                    runs.setdefault(symbol, []).append([written, 0])
+                    current = symbol
+                runs[symbol][-1][1] += 1
+                for i, name, code in layout:
+                    buffers[name].append(_convert(code, row[i]))  # type: ignore[arg-type]
+                written += 1
+                if written % flush_rows == 0:
+                    flush()
+            flush()
+            for fh in spools.values():
+                fh.close()
+
+            columns: Dict[str, Dict[str, Any]] = {
+                name: {"type": code} for _, name, code in layout
+            }
+            offset = 0
+            with open(tmp_dir / self.DATA_FILE, "wb") as out:
+                for n, (_, name, part) in enumerate(segments):
+                    path = tmp_dir / f"spool-{n}"
+                    columns[name][part] = offset
+                    offset += path.stat().st_size
+                    with open(path, "rb") as fh:
+                        shutil.copyfileobj(fh, out, 1 << 20)
+                    path.unlink()
+            index = {"rows": written, "columns": columns, "symbols": runs}
+            with open(tmp_dir / self.INDEX_FILE, "w") as fh:
+                json.dump(index, fh, separators=(",", ":"))
+
+            shutil.rmtree(final_dir, ignore_errors=True)
+            os.replace(tmp_dir, final_dir)
+        except BaseException:
+            for fh in spools.values():
+                fh.close()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return {symbol: sum(n for _, n in spans) for symbol, spans in runs.items()}
+
+    def load(
+        self,
+        dataset: str,
+        day: date,
+        symbol: str,
+        columns: Iterable[str] | None = None,
+    ) -> Dict[str, array | List[str]]:
+        """
+        Read the requested columns (default: all) for one symbol-day.
+        """
+        index = self._index(dataset, day)
+        spans = index["symbols"].get(symbol)
+        if spans is None:
+            raise ValueError(f"No {symbol!r} rows in {dataset} {day}")
+        schema: Dict[str, Dict[str, Any]] = index["columns"]
+        out: Dict[str, array | List[str]] = {}
+        with open(self.day_dir(dataset, day) / self.DATA_FILE, "rb") as fh:
+            for name in columns or schema:
+                column = schema[name]
+                code = column["type"]
+                if code == _TEXT:
+                    out[name] = self._read_text(fh, column, spans)
+                    continue
+                values = array(code)
+                for start, count in spans:
+                    fh.seek(column["offset"] + start * values.itemsize)
+                    values.fromfile(fh, count)
+                out[name] = values
+        return out
+
+    @staticmethod
+    def _read_text(fh: BinaryIO, column: Dict[str, Any], spans: List[List[int]]) -> List[str]:
+        out: List[str] = []
+        for start, count in spans:
+            ends = array("q")
+            first = max(start - 1, 0)
+            fh.seek(column["ends"] + first * ends.itemsize)
+            ends.fromfile(fh, count + (start - first))
+            if start == 0:
+                ends.insert(0, 0)
+            fh.seek(column["offset"] + ends[0])
+            blob = fh.read(ends[-1] - ends[0])
+            base = ends[0]
+            out.extend(
+                blob[a - base:b - base].decode("utf-8") for a, b in zip(ends, ends[1:])
+            )
+        return out
+
+
+class PolygonFlatFiles:
+    """
+    Bulk historical loader for Polygon flat files on the S3 endpoint.
+
+    Each file is streamed, gunzipped and parsed incrementally, then written
+    into a `FlatFileStore`; nothing holds a whole day in memory.
+    """
+
+    BUCKET = "flatfiles"
+    MISSING_AFTER_DAYS = 3
+
+    def __init__(self, s3: S3Client, bucket: str = BUCKET) -> None:
+        self.s3 = s3
+        self.bucket = bucket
+
+    @staticmethod
+    def dataset(name: str) -> FlatFileDataset:
+        try:
+            return DATASETS[name]
+        except KeyError:
+            raise ValueError(f"Unknown flat-file dataset: {name!r}")
+
+    def available_days(self, dataset: str, year: int, month: int) -> List[date]:
+        prefix = f"{self.dataset(dataset).prefix}/{year:04d}/{month:02d}/"
+        days = []
+        for obj in self.s3.list_objects(self.bucket, prefix):
+            name = str(obj["key"]).rsplit("/", 1)[-1]
+            days.append(date.fromisoformat(name[:10]))
+        return sorted(days)
+
+    def iter_rows(self, dataset: str, day: date) -> Iterator[List[str]]:
+        """
+        Yield CSV rows (header first) of one day's file as it downloads.
+        """
+        key = self.dataset(dataset).key_for(day)
+        with self.s3.get_object(self.bucket, key) as resp:
+            yield from csv.reader(iter_gzip_lines(resp.iter_raw()))
+
+    def load_day(
+        self,
+        store: FlatFileStore,
+        dataset: str,
+        day: date,
+        symbols: Iterable[str] | None = None,
+    ) -> Dict[str, int] | None:
+        """
+        Load one day into `store`. Returns None if there is no file for the
+        day (market holidays). Such days are marked missing in the store
+        once they are `MISSING_AFTER_DAYS` old, so backfills stop asking;
+        recent days may simply not be published yet.
+        """
+        try:
+            return store.write_day(
+                self.dataset(dataset), day, self.iter_rows(dataset, day), symbols=symbols
+            )
+        except error.HTTPError as exc:
+            if exc.code not in (403, 404):
+                raise
+            if (date.today() - day).days >= self.MISSING_AFTER_DAYS:
+                store.mark_missing(dataset, day, exc.code)
+            return None
+
+    def backfill(
+        self,
+        store: FlatFileStore,
+        dataset: str,
+        start: date,
+        end: date,
+        symbols: Iterable[str] | None = None,
+        skip_existing: bool = True,
+        max_workers: int = 4,
+    ) -> Dict[date, int]:
+        """
+        Load every weekday in [start, end]; days already in the store or
+        marked missing are skipped. Returns total rows loaded per day that
+        had a file.
+        """
+        wanted = list(symbols) if symbols is not None else None
+        days = []
+        day = start
+        while day <= end:
+            known = store.has_day(dataset, day) or store.is_missing(dataset, day)
+            if day.weekday() < 5 and not (skip_existing and known):
+                days.append(day)
+            day += timedelta(days=1)
+
+        results: Dict[date, int] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aurora-flatfiles") as pool:
+            futures = {
+                pool.submit(self.load_day, store, dataset, d, wanted): d for d in days
+            }
+            for fut, d in futures.items():
+                counts = fut.result()
+                if counts is not None:
+                    results[d] = sum(counts.values())
+        return results
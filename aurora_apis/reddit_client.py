@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Tuple
+from urllib import error
 
+from aurora_apis.async_http_client import async_http_get, async_http_post
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get, http_post
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("reddit")
 class RedditClient:
     """
     Minimal Reddit client for ticker mention scraping using OAuth2.
@@ -15,10 +21,16 @@ class RedditClient:
     - REDDIT_CLIENT_ID
     - REDDIT_CLIENT_SECRET
     - REDDIT_USER_AGENT
+
+    The access token is reused until shortly before its `expires_in`
+    lapses; a request rejected with 401 fetches a new one and is retried
+    once.
     """
 
     TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
     BASE_URL = "https://oauth.reddit.com"
+    # Refresh this many seconds before the token actually expires.
+    TOKEN_EXPIRY_MARGIN = 60.0
 
     def __init__(
         self,
@@ -30,34 +42,156 @@ class RedditClient:
         self.client_secret = client_secret or os.getenv("REDDIT_CLIENT_SECRET")
         self.user_agent = user_agent or os.getenv("REDDIT_USER_AGENT")
         self._access_token: str | None = None
+        self._token_expires = 0.0
 
-    def _get_token(self) -> str:
-        if self._access_token:
-            return self._access_token
-
+    def _token_request(self) -> Tuple[Dict[str, str], Dict[str, str], Tuple[str, str]]:
         if not (self.client_id and self.client_secret and self.user_agent):
             raise RuntimeError("Reddit credentials are not fully configured")
 
         data = {"grant_type": "client_credentials"}
         headers = {"User-Agent": self.user_agent}
+        return data, headers, (self.client_id, self.client_secret)
+
+    def _cached_token(self) -> str | None:
+        if self._access_token and time.monotonic() < self._token_expires:
+            return self._access_token
+        return None
+
+    def _store_token(self, payload: Dict[str, Any]) -> str:
+        token = payload["access_token"]
+        lifetime = float(payload.get("expires_in") or 3600)
+        self._access_token = token
+        self._token_expires = time.monotonic() + max(0.0, lifetime - self.TOKEN_EXPIRY_MARGIN)
+        return token
+
+    def _get_token(self) -> str:
+        token = self._cached_token()
+        if token:
+            return token
+
+        data, headers, auth = self._token_request()
         payload = http_post(
             self.TOKEN_URL,
             data=data,
             headers=headers,
-            auth_basic=(self.client_id, self.client_secret),
+            auth_basic=auth,
         )
-        token = payload["access_token"]
-        self._access_token = token
-        return token
+        return self._store_token(payload)
+
+    def _get(self, url: str, params: Dict[str, Any]) -> Any:
+        try:
+            return http_get(url, headers=self._auth_headers(self._get_token()), params=params)
+        except error.HTTPError as exc:
+            if exc.code != 401:
+                raise
+        # Revoked or expired early: retry once with a fresh token.
+        self._access_token = None
+        return http_get(url, headers=self._auth_headers(self._get_token()), params=params)
 
-    def search_subreddit(self, subreddit: str, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        token = self._get_token()
-        headers = {
+    def _auth_headers(self, token: str) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {token}",
             "User-Agent": self.user_agent or "aurora-reddit-client",
         }
-        params = {"q": query, "limit": limit, "sort": "new", "restrict_sr": True}
-        url = f"{self.BASE_URL}/r/{subreddit}/search"
-        data = http_get(url, headers=headers, params=params)
+
+    @staticmethod
+    def _children(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         children = data.get("data", {}).get("children", [])
         return [c.get("data", {}) for c in children]
+
+    @staticmethod
+    def _search_params(query: str, limit: int, before: str | None) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"q": query, "limit": limit, "sort": "new", "restrict_sr": True}
+        if before:
+            params["before"] = before
+        return params
+
+    @staticmethod
+    def _listing_params(limit: int, before: str | None) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit}
+        if before:
+            params["before"] = before
+        return params
+
+    def search_subreddit(
+        self, subreddit: str, query: str, limit: int = 10, before: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest posts matching `query`. With `before` (a fullname such as
+        "t3_abc123") only posts newer than that one are returned.
+        """
+        url = f"{self.BASE_URL}/r/{subreddit}/search"
+        data = self._get(url, self._search_params(query, limit, before))
+        return self._children(data)
+
+    def get_new(
+        self, subreddit: str, limit: int = 100, before: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest posts in `subreddit` (at most 100 per request), optionally
+        only those newer than the `before` fullname.
+        """
+        url = f"{self.BASE_URL}/r/{subreddit}/new"
+        data = self._get(url, self._listing_params(limit, before))
+        return self._children(data)
+
+
+@instrumented("reddit")
+class AsyncRedditClient(RedditClient):
+    """
+    Asyncio variant of RedditClient.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        user_agent: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(
+            client_id=client_id,
+            client_secret=client_secret,
+            user_agent=user_agent,
+        )
+        self.transport = transport
+
+    async def _get_token(self) -> str:  # type: ignore[override]
+        token = self._cached_token()
+        if token:
+            return token
+
+        data, headers, auth = self._token_request()
+        payload = await async_http_post(
+            self.TOKEN_URL,
+            data=data,
+            headers=headers,
+            auth_basic=auth,
+            transport=self.transport,
+        )
+        return self._store_token(payload)
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> Any:  # type: ignore[override]
+        try:
+            headers = self._auth_headers(await self._get_token())
+            return await async_http_get(url, headers=headers, params=params, transport=self.transport)
+        except error.HTTPError as exc:
+            if exc.code != 401:
+                raise
+        self._access_token = None
+        headers = self._auth_headers(await self._get_token())
+        return await async_http_get(url, headers=headers, params=params, transport=self.transport)
+
+    async def search_subreddit(  # type: ignore[override]
+        self, subreddit: str, query: str, limit: int = 10, before: str | None = None
+    ) -> List[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/r/{subreddit}/search"
+        data = await self._get(url, self._search_params(query, limit, before))
+        return self._children(data)
+
+    async def get_new(  # type: ignore[override]
+        self, subreddit: str, limit: int = 100, before: str | None = None
+    ) -> List[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/r/{subreddit}/new"
+        data = await self._get(url, self._listing_params(limit, before))
+        return self._children(data)
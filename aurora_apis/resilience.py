@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, TypeVar
+from urllib import error, parse
+
+T = TypeVar("T")
+
+# Network-level failures worth retrying. HTTPError is an OSError too and is
+# handled separately, by status code.
+TRANSIENT_ERRORS = (OSError, EOFError, http.client.HTTPException)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of calling a host whose circuit breaker is open.
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    `max_retries` extra attempts for idempotent methods on transient
+    network errors and `retry_statuses`, sleeping a full-jitter exponential
+    backoff - or the server's Retry-After, if it sent one. A Retry-After
+    longer than `max_retry_after` is not waited out; the error is raised.
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.25
+    backoff_max: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    max_retry_after: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """
+        Sleep before retry number `attempt + 1`, or None to give up.
+        """
+        if attempt >= self.max_retries:
+            return None
+        hinted = parse_retry_after(retry_after)
+        if hinted is not None:
+            return hinted if hinted <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `failure_threshold` consecutive failures the
+    circuit opens and calls fail fast for `recovery_timeout` seconds. Then
+    one probe is let through (half-open); its outcome closes or reopens
+    the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self, host: str) -> None:
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            wait = self.opened_at + self.recovery_timeout - now
+            if self.state == OPEN and wait <= 0:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(host, max(wait, 0.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def release(self) -> None:
+        """
+        End a probe whose outcome says nothing about the host's health.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.times_opened += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._probing = False
+
+
+@dataclass
+class _HostStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    short_circuited: int = 0
+
+
+@dataclass
+class Resilience:
+    """
+    Retry policy plus one circuit breaker per host, applied to every
+    `http_request` and `async_http_request` once installed with
+    `http_client.set_resilience`.
+
+    Breakers count connection errors, timeouts and 5xx responses; 4xx
+    responses (including 429) prove the host is up and do not trip them.
+    """
+
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    _breakers: Dict[str, CircuitBreaker] = field(default_factory=dict, repr=False)
+    _stats: Dict[str, _HostStats] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+                self._breakers[host] = breaker
+                self._stats[host] = _HostStats()
+            return breaker
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return parse.urlsplit(url).netloc
+
+    def before_call(self, host: str) -> CircuitBreaker:
+        breaker = self.breaker(host)
+        stats = self._stats[host]
+        stats.requests += 1
+        try:
+            breaker.before_call(host)
+        except CircuitOpenError:
+            stats.short_circuited += 1
+            raise
+        return breaker
+
+    def on_error(self, host: str, method: str, exc: BaseException, attempt: int) -> float | None:
+        """
+        Record a failed attempt; return the delay before retrying, or None
+        if the error should propagate.
+        """
+        breaker = self.breaker(host)
+        stats = self._stats[host]
+        if isinstance(exc, error.HTTPError):
+            if exc.code >= 500:
+                breaker.record_failure()
+                stats.failures += 1
+            else:
+                breaker.record_success()
+            if exc.code not in self.retry.retry_statuses:
+                return None
+            retry_after = exc.headers.get("Retry-After") if exc.headers else None
+        elif isinstance(exc, TRANSIENT_ERRORS) and not isinstance(exc, CircuitOpenError):
+            breaker.record_failure()
+            stats.failures += 1
+            retry_after = None
+        else:
+            breaker.release()
+            return None
+        if method.upper() not in self.retry.retry_methods:
+            return None
+        delay = self.retry.delay(attempt, retry_after)
+        if delay is not None:
+            stats.retries += 1
+        return delay
+
+    def call(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], T],
+        gate: Callable[[], None] | None = None,
+    ) -> T:
+        """
+        Run `send` with retries. `gate` (e.g. a rate limiter) runs before
+        each attempt and outside the breaker: its failures propagate
+        without counting against the host or holding a half-open probe.
+        """
+        host = self.host_of(url)
+        attempt = 0
+        while True:
+            if gate is not None:
+                gate()
+            breaker = self.before_call(host)
+            try:
+                result = send()
+            except BaseException as exc:
+                delay = self.on_error(host, method, exc, attempt)
+                if delay is None:
+                    raise
+            else:
+                breaker.record_success()
+                return result
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable[T]],
+        gate: Callable[[], Awaitable[None]] | None = None,
+    ) -> T:
+        host = self.host_of(url)
+        attempt = 0
+        while True:
+            if gate is not None:
+                await gate()
+            breaker = self.before_call(host)
+            try:
+                result = await send()
+            except asyncio.CancelledError:
+                # A cancelled probe says nothing about the host; free the slot.
+                breaker.release()
+                raise
+            except BaseException as exc:
+                delay = self.on_error(host, method, exc, attempt)
+                if delay is None:
+                    raise
+            else:
+                breaker.record_success()
+                return result
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def open_circuits(self) -> Dict[str, float]:
+        """
+        Hosts currently failing fast, with seconds until the next probe.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: max(0.0, b.opened_at + b.recovery_timeout - now)
+                for host, b in self._breakers.items()
+                if b.state == OPEN
+            }
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            items = list(self._breakers.items())
+        return {
+            host: {
+                "state": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "times_opened": breaker.times_opened,
+                **vars(self._stats[host]),
+            }
+            for host, breaker in items
+        }
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from aurora_apis.transport import HTTPResponse
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    Cache responses whose URL matches `pattern` (regex search) for `ttl`
+    seconds. A ttl of 0 disables caching for matching URLs.
+    """
+
+    pattern: str
+    ttl: float
+
+    def matches(self, url: str) -> bool:
+        return re.search(self.pattern, url) is not None
+
+
+# First matching rule wins. URLs that match no rule are not cached.
+DEFAULT_CACHE_RULES: Tuple[CacheRule, ...] = (
+    CacheRule(r"alphavantage\.co/query\?.*function=GLOBAL_QUOTE", 5),
+    CacheRule(r"finnhub\.io/api/v1/quote\?", 5),
+    CacheRule(r"iexapis\.com/stable/stock/[^/]+/quote", 5),
+    CacheRule(r"api\.polygon\.io/v2/last/", 1),
+    # Incremental pollers must always see the latest revisions.
+    CacheRule(r"api\.benzinga\.com/api/v2/news\?.*updatedSince=", 0),
+    CacheRule(r"api\.benzinga\.com/api/v2/news\?", 30),
+    CacheRule(r"data\.sec\.gov/api/xbrl/companyfacts/", 24 * 3600),
+    CacheRule(r"data\.sec\.gov/submissions/", 3600),
+    CacheRule(r"api\.stlouisfed\.org/fred/series/observations\?", 3600),
+    CacheRule(r"api\.tradingeconomics\.com/calendar", 300),
+)
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    expires: float
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    body: bytes = b""
+    error: BaseException | None = None
+
+
+class ResponseCache:
+    """
+    In-memory TTL cache for `http_get` responses.
+
+    - TTLs are chosen per endpoint from `rules`
+    - entries are evicted least-recently-used once the summed response
+      body sizes exceed `max_bytes`
+    - concurrent misses for the same URL are coalesced: one caller goes
+      upstream and the others wait for its result (single-flight)
+
+    Entries hold the raw JSON body, so `max_bytes` bounds the real memory
+    used, and every caller decodes its own copy: a caller mutating its
+    result cannot corrupt what others get.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        rules: Iterable[CacheRule] = DEFAULT_CACHE_RULES,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.rules = tuple(rules)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, url: str) -> float:
+        for rule in self.rules:
+            if rule.matches(url):
+                return rule.ttl
+        return 0.0
+
+    def _lookup(self, key: str, now: float) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= now:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry.body
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+
+    def _store(self, key: str, body: bytes, ttl: float) -> None:
+        if len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(body, time.monotonic() + ttl)
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def get_or_fetch(self, url: str, fetch: Callable[[], HTTPResponse]) -> Any:
+        """
+        Return the decoded JSON for `url`, calling `fetch` only on a miss.
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return fetch().json()
+
+        with self._lock:
+            body = self._lookup(url, time.monotonic())
+            if body is not None:
+                self.hits += 1
+            else:
+                flight = self._flights.get(url)
+                leader = flight is None
+                if leader:
+                    flight = _Flight()
+                    self._flights[url] = flight
+                    self.misses += 1
+                else:
+                    self.coalesced += 1
+        if body is not None:
+            return json.loads(body)
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return json.loads(flight.body)
+
+        try:
+            resp = fetch()
+            value = resp.json()
+            flight.body = resp.body
+            with self._lock:
+                self._store(url, resp.body, ttl)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(url, None)
+            flight.done.set()
+        return value
+
+    def invalidate(self, url: str | None = None) -> None:
+        """
+        Drop one URL, or everything when `url` is None.
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif url in self._entries:
+                self._remove(url)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
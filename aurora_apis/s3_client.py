@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Mapping
+from urllib import parse
+
+from aurora_apis.http_client import http_request, http_stream
+from aurora_apis.metrics import instrumented
+from aurora_apis.transport import StreamingResponse
+
+
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+_S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+
+def _quote(value: str, safe: str = "-_.~") -> str:
+    return parse.quote(value, safe=safe)
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+@instrumented("s3")
+class S3Client:
+    """
+    Minimal S3-compatible client (path-style, AWS Signature V4).
+
+    Only what bulk downloads need: signed GETs streamed through the shared
+    transport and ListObjectsV2. Works against any S3-compatible endpoint,
+    including a local stand-in for tests.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str = "us-east-1",
+        timeout: float = 60,
+    ) -> None:
+        self.endpoint = endpoint.rstrip("/")
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+        self.timeout = timeout
+
+    def _host_header(self) -> str:
+        # Must match the Host header http.client sends, or the signature fails.
+        parts = parse.urlsplit(self.endpoint)
+        default = 443 if parts.scheme == "https" else 80
+        host = parts.hostname or ""
+        if parts.port and parts.port != default:
+            return f"{host}:{parts.port}"
+        return host
+
+    def sign(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str] | None = None,
+        now: datetime | None = None,
+    ) -> Dict[str, str]:
+        """
+        Return the headers that authenticate `method path?query`.
+        """
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = amz_date[:8]
+        host = self._host_header()
+
+        canonical_query = "&".join(
+            f"{_quote(k)}={_quote(v)}" for k, v in sorted((query or {}).items())
+        )
+        canonical_headers = (
+            f"host:{host}\nx-amz-content-sha256:{_EMPTY_SHA256}\nx-amz-date:{amz_date}\n"
+        )
+        signed_headers = "host;x-amz-content-sha256;x-amz-date"
+        canonical_request = "\n".join(
+            [
+                method,
+                _quote(path, safe="/-_.~"),
+                canonical_query,
+                canonical_headers,
+                signed_headers,
+                _EMPTY_SHA256,
+            ]
+        )
+        scope = f"{datestamp}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            ]
+        )
+        key = _hmac(f"AWS4{self.secret_access_key}".encode(), datestamp)
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+        signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+        return {
+            "Authorization": (
+                f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{scope}, "
+                f"SignedHeaders={signed_headers}, Signature={signature}"
+            ),
+            "x-amz-content-sha256": _EMPTY_SHA256,
+            "x-amz-date": amz_date,
+        }
+
+    def _url(self, path: str, query: Mapping[str, str] | None = None) -> str:
+        url = f"{self.endpoint}{_quote(path, safe='/-_.~')}"
+        if query:
+            # Encode exactly as signed; urlencode's "+" for spaces would not match.
+            url += "?" + "&".join(f"{_quote(k)}={_quote(v)}" for k, v in sorted(query.items()))
+        return url
+
+    @contextmanager
+    def get_object(self, bucket: str, key: str) -> Iterator[StreamingResponse]:
+        """
+        Stream an object's body. Raises `urllib.error.HTTPError` (e.g. 404).
+        """
+        path = f"/{bucket}/{key}"
+        headers = self.sign("GET", path)
+        # Objects are fetched byte-for-byte; compression is handled by callers.
+        headers["Accept-Encoding"] = "identity"
+        with http_stream("GET", self._url(path), headers=headers, timeout=self.timeout) as resp:
+            yield resp
+
+    def list_objects(self, bucket: str, prefix: str = "") -> List[Dict[str, object]]:
+        """
+        List every object under `prefix` (follows continuation tokens).
+        """
+        path = f"/{bucket}"
+        out: List[Dict[str, object]] = []
+        token: str | None = None
+        while True:
+            query = {"list-type": "2", "prefix": prefix}
+            if token:
+                query["continuation-token"] = token
+            headers = self.sign("GET", path, query)
+            resp = http_request(
+                "GET", self._url(path, query), headers=headers, timeout=self.timeout
+            )
+            root = ET.fromstring(resp.body)
+            for item in root.iter(f"{_S3_NS}Contents"):
+                out.append(
+                    {
+                        "key": item.findtext(f"{_S3_NS}Key"),
+                        "size": int(item.findtext(f"{_S3_NS}Size") or 0),
+                        "etag": item.findtext(f"{_S3_NS}ETag"),
+                    }
+                )
+            if root.findtext(f"{_S3_NS}IsTruncated") != "true":
+                return out
+            token = root.findtext(f"{_S3_NS}NextContinuationToken")
@@ -1,40 +1,270 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, Dict
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Tuple
 
-from aurora_apis.http_client import http_get
+from aurora_apis.async_http_client import async_http_get, async_http_request
+from aurora_apis.async_transport import AsyncTransport
+from aurora_apis.cik_index import CIKIndex
+from aurora_apis.edgar_cache import CompanyFactsDiskCache
+from aurora_apis.http_client import http_get, http_request, http_stream
+from aurora_apis.json_stream import WILDCARD, iter_items
+from aurora_apis.metrics import instrumented
+from aurora_apis.transport import HTTPResponse
 
 
+@instrumented("sec_edgar")
 class SECEdgarClient:
     """
     Minimal SEC EDGAR client using the official SEC API.
 
     You must set SEC_EDGAR_USER_AGENT to a descriptive user agent string,
     e.g., "AuroraQuant/0.1 (contact@example.com)".
+
+    If `cache_dir` (or SEC_EDGAR_CACHE_DIR) is set, company facts are kept
+    on disk per CIK and revalidated with a conditional GET, so unchanged
+    files are not downloaded again. Within `revalidate_after` seconds of
+    the last check the disk copy is served without contacting the SEC.
+
+    Ticker symbols are resolved to CIKs through a local `CIKIndex` loaded
+    from `tickers_path` (default: `company_tickers.json` in the cache
+    directory) and refreshed from the SEC once a day in the background.
     """
 
     SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik:010d}.json"
     COMPANY_FACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{cik:010d}.json"
 
-    def __init__(self, user_agent: str | None = None) -> None:
+    def __init__(
+        self,
+        user_agent: str | None = None,
+        cache_dir: str | None = None,
+        revalidate_after: float = 0.0,
+        tickers_path: str | None = None,
+    ) -> None:
         self.user_agent = user_agent or os.getenv("SEC_EDGAR_USER_AGENT")
+        cache_dir = cache_dir or os.getenv("SEC_EDGAR_CACHE_DIR")
+        self.cache = CompanyFactsDiskCache(cache_dir) if cache_dir else None
+        self.revalidate_after = revalidate_after
+        if tickers_path is None and cache_dir:
+            tickers_path = os.path.join(cache_dir, "company_tickers.json")
+        self.cik_index = CIKIndex(path=tickers_path, fetch=self._fetch_tickers)
 
     def _headers(self) -> Dict[str, str]:
         if not self.user_agent:
             raise RuntimeError("SEC_EDGAR_USER_AGENT is not set")
         return {"User-Agent": self.user_agent}
 
+    def _fetch_tickers(self) -> Dict[str, Any]:
+        return http_get(CIKIndex.TICKERS_URL, headers=self._headers())
+
+    def _resolve_cik(self, cik_or_symbol: str | int) -> int:
+        try:
+            return int(cik_or_symbol)
+        except ValueError:
+            pass
+        self.cik_index.ensure_loaded()
+        cik = self.cik_index.lookup(str(cik_or_symbol))
+        if cik is None:
+            raise ValueError(f"Unknown ticker symbol: {cik_or_symbol!r}")
+        return cik
+
+    def resolve_cik(self, symbol: str) -> int | None:
+        """
+        Map a ticker to its CIK from the local index, or None if unknown.
+        Only a cold, empty index is fetched before answering.
+        """
+        self.cik_index.ensure_loaded()
+        return self.cik_index.lookup(symbol)
+
+    def _is_fresh(self, cik: int) -> bool:
+        if self.cache is None or self.revalidate_after <= 0:
+            return False
+        meta = self.cache.meta(cik)
+        return meta is not None and time.time() - meta.validated_at <= self.revalidate_after
+
+    def _cached_if_fresh(self, cik: int) -> Dict[str, Any] | None:
+        if not self._is_fresh(cik):
+            return None
+        assert self.cache is not None
+        return self.cache.load(cik)
+
+    def _conditional_headers(self, cik: int) -> Dict[str, str]:
+        headers = self._headers()
+        if self.cache is not None:
+            headers.update(self.cache.conditional_headers(cik))
+        return headers
+
+    def _from_conditional_response(self, cik: int, resp: HTTPResponse) -> Dict[str, Any]:
+        assert self.cache is not None
+        if resp.status == 304:
+            self.cache.touch(cik)
+            return self.cache.load(cik)
+        self.cache.store(cik, resp.body, resp.headers)
+        return resp.json()
+
     def get_company_facts(self, cik_or_symbol: str | int) -> Dict[str, Any]:
         """
-        Fetch basic company facts using a numeric CIK. If a symbol string is
-        passed, it is assumed to already be a CIK or pre-mapped upstream.
+        Fetch company facts by numeric CIK or ticker symbol. Symbols are
+        mapped to CIKs through the local ticker index.
+        """
+        cik = self._resolve_cik(cik_or_symbol)
+        url = self.COMPANY_FACTS_URL.format(cik=cik)
+        if self.cache is None:
+            return http_get(url, headers=self._headers())
+
+        cached = self._cached_if_fresh(cik)
+        if cached is not None:
+            return cached
+        resp = http_request("GET", url, headers=self._conditional_headers(cik))
+        return self._from_conditional_response(cik, resp)
+
+    @staticmethod
+    def _facts_from(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        chunks = iter(chunks)
+        for (_, taxonomy, concept), fact in iter_items(chunks, ["facts", WILDCARD]):
+            yield taxonomy, concept, fact
+        # Drain to EOF so a spooling cache writer sees the end of the body.
+        for _ in chunks:
+            pass
+
+    def iter_company_facts(
+        self, cik_or_symbol: str | int
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Stream company facts as `(taxonomy, concept, fact)` tuples, decoding
+        one concept at a time instead of the whole companyfacts document.
+        With a disk cache the body is spooled to disk while it streams.
+        """
+        cik = self._resolve_cik(cik_or_symbol)
+        if self.cache is not None and self._is_fresh(cik):
+            yield from self._facts_from(self.cache.iter_chunks(cik))
+            return
+
+        url = self.COMPANY_FACTS_URL.format(cik=cik)
+        with http_stream("GET", url, headers=self._conditional_headers(cik)) as resp:
+            if resp.status != 304:
+                chunks = resp.iter_bytes()
+                if self.cache is not None:
+                    chunks = self.cache.store_stream(cik, chunks, resp.headers)
+                yield from self._facts_from(chunks)
+                return
+
+        assert self.cache is not None
+        self.cache.touch(cik)
+        yield from self._facts_from(self.cache.iter_chunks(cik))
+
+
+@instrumented("sec_edgar")
+class AsyncSECEdgarClient(SECEdgarClient):
+    """
+    Asyncio variant of SECEdgarClient.
+
+    The ticker index is refreshed with an awaited request, in a background
+    task once it has been loaded, never with a blocking call on the event
+    loop.
+    """
+
+    def __init__(
+        self,
+        user_agent: str | None = None,
+        cache_dir: str | None = None,
+        revalidate_after: float = 0.0,
+        tickers_path: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(
+            user_agent=user_agent,
+            cache_dir=cache_dir,
+            revalidate_after=revalidate_after,
+            tickers_path=tickers_path,
+        )
+        self.transport = transport
+        # Refreshes go through `refresh_cik_index`, never the sync fetcher.
+        self.cik_index.fetch = None
+        self._cik_lock = asyncio.Lock()
+        self._cik_refresh: asyncio.Future[None] | None = None
+
+    async def refresh_cik_index(self) -> None:
         """
+        Reload the ticker index from the SEC if it is due. A failed refresh
+        keeps a non-empty index and waits for the next interval.
+        """
+        index = self.cik_index
+        if not index.is_stale():
+            return
+        async with self._cik_lock:
+            if not index.is_stale():
+                return
+            try:
+                payload = await async_http_get(
+                    CIKIndex.TICKERS_URL, headers=self._headers(), transport=self.transport
+                )
+            except Exception:
+                if not len(index):
+                    raise
+                index.defer_refresh()
+                return
+            await asyncio.to_thread(index.store_payload, payload)
+
+    async def _ensure_cik_index(self) -> None:
+        # Only an empty index is awaited; a stale one keeps serving while a
+        # background task refreshes it.
+        if not len(self.cik_index):
+            await self.refresh_cik_index()
+        elif self.cik_index.is_stale() and (
+            self._cik_refresh is None or self._cik_refresh.done()
+        ):
+            self._cik_refresh = asyncio.ensure_future(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh_cik_index()
+        except Exception:
+            self.cik_index.defer_refresh()
+
+    async def _resolve_cik(self, cik_or_symbol: str | int) -> int:  # type: ignore[override]
         try:
-            cik = int(cik_or_symbol)
+            return int(cik_or_symbol)
         except ValueError:
-            # In a more complete system you'd symbol->CIK map here.
-            raise ValueError("get_company_facts currently expects a numeric CIK")
+            pass
+        await self._ensure_cik_index()
+        cik = self.cik_index.lookup(str(cik_or_symbol))
+        if cik is None:
+            raise ValueError(f"Unknown ticker symbol: {cik_or_symbol!r}")
+        return cik
 
+    async def resolve_cik(self, symbol: str) -> int | None:  # type: ignore[override]
+        await self._ensure_cik_index()
+        return self.cik_index.lookup(symbol)
+
+    async def get_company_facts(  # type: ignore[override]
+        self, cik_or_symbol: str | int
+    ) -> Dict[str, Any]:
+        cik = await self._resolve_cik(cik_or_symbol)
         url = self.COMPANY_FACTS_URL.format(cik=cik)
-        return http_get(url, headers=self._headers())
+        if self.cache is None:
+            return await async_http_get(url, headers=self._headers(), transport=self.transport)
+
+        # The disk cache mmaps, parses and atomically rewrites multi-MB
+        # files; keep that off the event loop.
+        cached = await asyncio.to_thread(self._cached_if_fresh, cik)
+        if cached is not None:
+            return cached
+        headers = await asyncio.to_thread(self._conditional_headers, cik)
+        resp = await async_http_request("GET", url, headers=headers, transport=self.transport)
+        return await asyncio.to_thread(self._from_conditional_response, cik, resp)
+
+    async def iter_company_facts(  # type: ignore[override]
+        self, cik_or_symbol: str | int
+    ) -> AsyncIterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Company facts as `(taxonomy, concept, fact)` tuples. The async
+        transport reads whole bodies, so the document is fetched in full
+        first.
+        """
+        data = await self.get_company_facts(cik_or_symbol)
+        for taxonomy, concepts in (data.get("facts") or {}).items():
+            for concept, fact in concepts.items():
+                yield taxonomy, concept, fact
@@ -3,9 +3,13 @@ from __future__ import annotations
 import os
 from typing import Any, Dict
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("stocktwits")
 class StockTwitsClient:
     """
     Minimal StockTwits client for symbol streams.
@@ -19,10 +23,45 @@ class StockTwitsClient:
     def __init__(self, access_token: str | None = None) -> None:
         self.access_token = access_token or os.getenv("STOCKTWITS_ACCESS_TOKEN")
 
-    def get_symbol_stream(self, symbol: str) -> Dict[str, Any]:
+    def _params(self, since: int | None = None, max_id: int | None = None) -> Dict[str, Any]:
         params: Dict[str, Any] = {}
         if self.access_token:
             params["access_token"] = self.access_token
+        if since is not None:
+            params["since"] = since
+        if max_id is not None:
+            params["max"] = max_id
+        return params
 
+    def get_symbol_stream(
+        self, symbol: str, since: int | None = None, max_id: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Latest messages for `symbol`, newest first. `since` returns only
+        messages with a greater id, `max_id` only those at or below it.
+        """
         url = f"{self.BASE_URL}/streams/symbol/{symbol}.json"
-        return http_get(url, params=params)
+        return http_get(url, params=self._params(since, max_id))
+
+
+@instrumented("stocktwits")
+class AsyncStockTwitsClient(StockTwitsClient):
+    """
+    Asyncio variant of StockTwitsClient.
+    """
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(access_token=access_token)
+        self.transport = transport
+
+    async def get_symbol_stream(  # type: ignore[override]
+        self, symbol: str, since: int | None = None, max_id: int | None = None
+    ) -> Dict[str, Any]:
+        url = f"{self.BASE_URL}/streams/symbol/{symbol}.json"
+        return await async_http_get(
+            url, params=self._params(since, max_id), transport=self.transport
+        )
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from urllib.parse import quote
 
+from aurora_apis.async_http_client import async_http_get
+from aurora_apis.async_transport import AsyncTransport
 from aurora_apis.http_client import http_get
+from aurora_apis.metrics import instrumented
 
 
+@instrumented("tradingeconomics")
 class TradingEconomicsClient:
     """
     Minimal TradingEconomics client using the free tier.
@@ -32,9 +38,73 @@ class TradingEconomicsClient:
             raise RuntimeError("TradingEconomics credentials are not set")
         return {"client": f"{self.client_key}:{self.client_secret}"}
 
-    def get_calendar(self, country: str | None = None) -> List[Dict[str, Any]]:
+    def _calendar_params(self, country: str | None) -> Dict[str, Any]:
         params: Dict[str, Any] = self._auth_params()
         if country:
             params["country"] = country
+        return params
+
+    def get_calendar(self, country: str | None = None) -> List[Dict[str, Any]]:
         url = f"{self.BASE_URL}/calendar"
+        return http_get(url, params=self._calendar_params(country))
+
+    def _range_request(
+        self,
+        start: date | str,
+        end: date | str,
+        country: str | None,
+        importance: int | None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        url = f"{self.BASE_URL}/calendar/country/{quote(country or 'All')}/{start}/{end}"
+        params: Dict[str, Any] = self._auth_params()
+        if importance is not None:
+            params["importance"] = importance
+        return url, params
+
+    def get_calendar_range(
+        self,
+        start: date | str,
+        end: date | str,
+        country: str | None = None,
+        importance: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Calendar events dated `start`..`end` (inclusive, YYYY-MM-DD), for
+        one country or all of them, optionally only at `importance` (1-3).
+        """
+        url, params = self._range_request(start, end, country, importance)
         return http_get(url, params=params)
+
+
+@instrumented("tradingeconomics")
+class AsyncTradingEconomicsClient(TradingEconomicsClient):
+    """
+    Asyncio variant of TradingEconomicsClient.
+    """
+
+    def __init__(
+        self,
+        client_key: str | None = None,
+        client_secret: str | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        super().__init__(client_key=client_key, client_secret=client_secret)
+        self.transport = transport
+
+    async def get_calendar(  # type: ignore[override]
+        self, country: str | None = None
+    ) -> List[Dict[str, Any]]:
+        url = f"{self.BASE_URL}/calendar"
+        return await async_http_get(
+            url, params=self._calendar_params(country), transport=self.transport
+        )
+
+    async def get_calendar_range(  # type: ignore[override]
+        self,
+        start: date | str,
+        end: date | str,
+        country: str | None = None,
+        importance: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        url, params = self._range_request(start, end, country, importance)
+        return await async_http_get(url, params=params, transport=self.transport)
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import http.client
+import io
+import json
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
+from urllib import error, parse, request
+
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+@dataclass
+class HTTPResponse:
+    """
+    Fully-read HTTP response returned by a transport.
+
+    Header names are lower-cased. The body is already content-decoded.
+    """
+
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+    url: str = ""
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+def decode_body(body: bytes, content_encoding: str | None) -> bytes:
+    """
+    Undo gzip/deflate content encoding. Unknown encodings are returned as-is.
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate streams without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class StreamingResponse:
+    """
+    HTTP response whose body is read incrementally.
+
+    `iter_bytes` undoes gzip/deflate content encoding chunk by chunk, so the
+    compressed and decompressed bodies are never held in memory at once.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        reason: str,
+        headers: Dict[str, str],
+        url: str,
+        read: Callable[[int], bytes],
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.url = url
+        self._read = read
+        self.bytes_read = 0
+
+    def iter_raw(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        while True:
+            chunk = self._read(chunk_size)
+            if not chunk:
+                return
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def iter_bytes(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        encoding = self.headers.get("content-encoding", "").strip().lower()
+        if encoding in ("gzip", "x-gzip"):
+            decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            # 32 + MAX_WBITS auto-detects a zlib or gzip header.
+            decoder = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        else:
+            yield from self.iter_raw(chunk_size)
+            return
+        for chunk in self.iter_raw(chunk_size):
+            out = decoder.decompress(chunk)
+            if out:
+                yield out
+        tail = decoder.flush()
+        if tail:
+            yield tail
+
+    def read(self) -> bytes:
+        return b"".join(self.iter_bytes())
+
+
+class Transport:
+    """
+    Interface for the object that actually moves bytes for `http_client`.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> HTTPResponse:
+        raise NotImplementedError
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> Iterator[StreamingResponse]:
+        """
+        Default streaming implementation: buffer the response via `request`.
+        Transports that can do better override this.
+        """
+        resp = self.request(method, url, body=body, headers=headers, timeout=timeout)
+        resp_headers = {k: v for k, v in resp.headers.items() if k != "content-encoding"}
+        yield StreamingResponse(
+            resp.status, resp.reason, resp_headers, url, io.BytesIO(resp.body).read
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class UrllibTransport(Transport):
+    """
+    One connection per request via `urllib.request.urlopen`.
+
+    Kept for environments where persistent connections are undesirable.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> HTTPResponse:
+        req = request.Request(url, data=body, headers=dict(headers or {}), method=method)
+        try:
+            with request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
+                raw = resp.read()
+                status, reason = resp.status, resp.reason
+                resp_headers = {k.lower(): v for k, v in resp.headers.items()}
+        except error.HTTPError as exc:
+            raw = exc.read()
+            status, reason = exc.code, str(exc.reason)
+            resp_headers = {k.lower(): v for k, v in (exc.headers or {}).items()}
+
+        body_out = decode_body(raw, resp_headers.get("content-encoding"))
+        return HTTPResponse(status, reason, resp_headers, body_out, url)
+
+
+@dataclass
+class _HostPool:
+    slots: threading.BoundedSemaphore
+    idle: List[Tuple[http.client.HTTPConnection, float]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class PooledTransport(Transport):
+    """
+    Keep-alive transport with a persistent connection pool per host.
+
+    - at most `max_connections_per_host` sockets are open or in use for any
+      (scheme, host, port); extra callers wait for a free slot
+    - connections idle for longer than `idle_timeout` seconds are closed
+      instead of being reused
+    - gzip/deflate responses are requested and transparently decoded
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 8,
+        idle_timeout: float = 30.0,
+        accept_encoding: str = "gzip, deflate",
+    ) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be >= 1")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.accept_encoding = accept_encoding
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, key: Tuple[str, str, int]) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(threading.BoundedSemaphore(self.max_connections_per_host))
+                self._pools[key] = pool
+            return pool
+
+    def _new_connection(
+        self, scheme: str, host: str, port: int, timeout: float
+    ) -> http.client.HTTPConnection:
+        proxy = _proxy_for(scheme, host)
+        if scheme == "https":
+            if proxy:
+                conn = http.client.HTTPSConnection(proxy[0], proxy[1], timeout=timeout)
+                conn.set_tunnel(host, port)
+                return conn
+            return http.client.HTTPSConnection(host, port, timeout=timeout)
+        if proxy:
+            # Plain HTTP goes to the forward proxy with absolute-URL targets.
+            return http.client.HTTPConnection(proxy[0], proxy[1], timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _checkout(
+        self, pool: _HostPool, key: Tuple[str, str, int], timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with pool.lock:
+            while pool.idle:
+                conn, last_used = pool.idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self._new_connection(*key, timeout=timeout), False
+
+    def _checkin(self, pool: _HostPool, conn: http.client.HTTPConnection) -> None:
+        with pool.lock:
+            pool.idle.append((conn, time.monotonic()))
+
+    def _prepare(
+        self, url: str, headers: Mapping[str, str] | None
+    ) -> Tuple[Tuple[str, str, int], str, Dict[str, str]]:
+        parts = parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        if scheme == "http" and _proxy_for(scheme, host):
+            target = url
+
+        req_headers = {"Connection": "keep-alive", "User-Agent": "aurora-http"}
+        if self.accept_encoding:
+            req_headers["Accept-Encoding"] = self.accept_encoding
+        req_headers.update(headers or {})
+        return (scheme, host, port), target, req_headers
+
+    def _acquire_slot(self, pool: _HostPool, host: str, timeout: float) -> None:
+        if not pool.slots.acquire(timeout=timeout):
+            raise TimeoutError(f"Timed out waiting for a connection to {host}")
+
+    def _exchange(
+        self,
+        pool: _HostPool,
+        key: Tuple[str, str, int],
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        conn, reused = self._checkout(pool, key, timeout)
+        try:
+            try:
+                resp = self._start(conn, method, target, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive socket; retry once on
+                # a fresh connection before surfacing the error.
+                conn = self._new_connection(*key, timeout=timeout)
+                resp = self._start(conn, method, target, body, headers)
+        except BaseException:
+            conn.close()
+            raise
+        return conn, resp
+
+    def _release(
+        self,
+        pool: _HostPool,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+    ) -> None:
+        # Only a fully consumed response leaves the socket reusable.
+        if resp.isclosed() and not resp.will_close:
+            self._checkin(pool, conn)
+        else:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> HTTPResponse:
+        key, target, req_headers = self._prepare(url, headers)
+        pool = self._pool(key)
+        self._acquire_slot(pool, key[1], timeout)
+        try:
+            conn, resp = self._exchange(pool, key, method, target, body, req_headers, timeout)
+            try:
+                raw = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+            self._release(pool, conn, resp)
+        finally:
+            pool.slots.release()
+
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        body_out = decode_body(raw, resp_headers.get("content-encoding"))
+        return HTTPResponse(resp.status, resp.reason, resp_headers, body_out, url)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 10,
+    ) -> Iterator[StreamingResponse]:
+        key, target, req_headers = self._prepare(url, headers)
+        pool = self._pool(key)
+        self._acquire_slot(pool, key[1], timeout)
+        try:
+            conn, resp = self._exchange(pool, key, method, target, body, req_headers, timeout)
+            try:
+                yield StreamingResponse(
+                    resp.status,
+                    resp.reason,
+                    {k.lower(): v for k, v in resp.getheaders()},
+                    url,
+                    resp.read,
+                )
+            finally:
+                self._release(pool, conn, resp)
+        finally:
+            pool.slots.release()
+
+    @staticmethod
+    def _start(
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: Mapping[str, str],
+    ) -> http.client.HTTPResponse:
+        conn.request(method, target, body=body, headers=dict(headers))
+        return conn.getresponse()
+
+    def idle_connections(self) -> Dict[str, int]:
+        """
+        Number of pooled idle connections per `scheme://host:port`.
+        """
+        with self._lock:
+            pools = dict(self._pools)
+        return {
+            f"{scheme}://{host}:{port}": len(pool.idle)
+            for (scheme, host, port), pool in pools.items()
+        }
+
+    def evict_idle(self) -> int:
+        """
+        Close every pooled connection that exceeded `idle_timeout`.
+        """
+        now = time.monotonic()
+        closed = 0
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            with pool.lock:
+                keep = []
+                for conn, last_used in pool.idle:
+                    if now - last_used > self.idle_timeout:
+                        conn.close()
+                        closed += 1
+                    else:
+                        keep.append((conn, last_used))
+                pool.idle = keep
+        return closed
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            with pool.lock:
+                for conn, _ in pool.idle:
+                    conn.close()
+                pool.idle = []
+
+
+def _proxy_for(scheme: str, host: str) -> Tuple[str, int] | None:
+    proxies = request.getproxies()
+    proxy_url = proxies.get(scheme)
+    if not proxy_url or request.proxy_bypass(host):
+        return None
+    parts = parse.urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+    if not parts.hostname:
+        return None
+    return parts.hostname, parts.port or 80
+
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import os
+import ssl
+import struct
+import time
+from typing import Mapping, Tuple
+from urllib import parse
+
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class WebSocketError(ConnectionError):
+    """
+    Handshake or protocol failure.
+    """
+
+
+class ConnectionClosed(ConnectionError):
+    """
+    The peer closed the connection (close frame or EOF).
+    """
+
+    def __init__(self, code: int | None = None, reason: str = "") -> None:
+        super().__init__(f"WebSocket closed (code={code}, reason={reason!r})")
+        self.code = code
+        self.reason = reason
+
+
+def accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1(key.encode() + _GUID).digest()).decode()
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    # Whole-buffer XOR via big ints; much faster than a per-byte loop.
+    n = len(payload)
+    if not n:
+        return payload
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool) -> bytes:
+    """
+    A single final frame. Clients must mask, servers must not.
+    """
+    head = bytes([0x80 | opcode])
+    bit = 0x80 if mask else 0
+    n = len(payload)
+    if n < 126:
+        head += bytes([bit | n])
+    elif n < 1 << 16:
+        head += bytes([bit | 126]) + struct.pack("!H", n)
+    else:
+        head += bytes([bit | 127]) + struct.pack("!Q", n)
+    if mask:
+        key = os.urandom(4)
+        return head + key + _apply_mask(payload, key)
+    return head + payload
+
+
+async def read_frame(
+    reader: asyncio.StreamReader, max_size: int
+) -> Tuple[bool, int, bytes]:
+    """
+    Read one frame and return (fin, opcode, unmasked payload).
+    """
+    try:
+        b1, b2 = await reader.readexactly(2)
+        n = b2 & 0x7F
+        if n == 126:
+            (n,) = struct.unpack("!H", await reader.readexactly(2))
+        elif n == 127:
+            (n,) = struct.unpack("!Q", await reader.readexactly(8))
+        if n > max_size:
+            raise WebSocketError(f"Frame of {n} bytes exceeds max_size={max_size}")
+        mask = await reader.readexactly(4) if b2 & 0x80 else None
+        payload = await reader.readexactly(n)
+    except asyncio.IncompleteReadError:
+        raise ConnectionClosed(None, "connection lost")
+    if mask is not None:
+        payload = _apply_mask(payload, mask)
+    return bool(b1 & 0x80), b1 & 0x0F, payload
+
+
+class WebSocket:
+    """
+    Client side of an open WebSocket (RFC 6455) on asyncio streams.
+
+    `recv` answers pings and reassembles fragmented messages, returning
+    `str` for text and `bytes` for binary messages. `last_received` is the
+    monotonic time of the last frame of any kind, for idle detection.
+    Extensions (e.g. permessage-deflate) are not negotiated.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_size: int = 16 << 20,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.max_size = max_size
+        self.closed = False
+        self.last_received = time.monotonic()
+
+    async def _send_frame(self, opcode: int, payload: bytes) -> None:
+        if self.closed:
+            raise ConnectionClosed(None, "connection already closed")
+        self.writer.write(encode_frame(opcode, payload, mask=True))
+        await self.writer.drain()
+
+    async def send(self, message: str | bytes) -> None:
+        if isinstance(message, str):
+            await self._send_frame(OP_TEXT, message.encode())
+        else:
+            await self._send_frame(OP_BINARY, message)
+
+    async def ping(self, payload: bytes = b"") -> None:
+        await self._send_frame(OP_PING, payload)
+
+    async def recv(self) -> str | bytes:
+        parts: list[bytes] = []
+        message_op: int | None = None
+        while True:
+            fin, opcode, payload = await read_frame(self.reader, self.max_size)
+            self.last_received = time.monotonic()
+            if opcode == OP_PING:
+                await self._send_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                code = struct.unpack("!H", payload[:2])[0] if len(payload) >= 2 else None
+                reason = payload[2:].decode("utf-8", "replace")
+                if not self.closed:
+                    try:
+                        await self._send_frame(OP_CLOSE, payload[:2])
+                    except ConnectionError:
+                        pass
+                await self._shutdown()
+                raise ConnectionClosed(code, reason)
+            if opcode != OP_CONTINUATION:
+                message_op = opcode
+            parts.append(payload)
+            if not fin:
+                if sum(map(len, parts)) > self.max_size:
+                    raise WebSocketError(f"Message exceeds max_size={self.max_size}")
+                continue
+            data = b"".join(parts)
+            return data.decode("utf-8") if message_op == OP_TEXT else data
+
+    async def close(self, code: int = 1000) -> None:
+        if self.closed:
+            return
+        try:
+            await self._send_frame(OP_CLOSE, struct.pack("!H", code))
+        except (ConnectionError, OSError):
+            pass
+        await self._shutdown()
+
+    def abort(self) -> None:
+        """
+        Drop the connection without a closing handshake, e.g. when the peer
+        has stopped responding. A pending `recv` raises `ConnectionClosed`.
+        """
+        self.closed = True
+        self.writer.transport.abort()
+
+    async def _shutdown(self) -> None:
+        self.closed = True
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def connect(
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 10.0,
+    ssl_context: ssl.SSLContext | None = None,
+    max_size: int = 16 << 20,
+) -> WebSocket:
+    """
+    Open a `ws://` or `wss://` URL and perform the opening handshake.
+    """
+    parts = parse.urlsplit(url)
+    if parts.scheme not in ("ws", "wss"):
+        raise ValueError(f"Unsupported WebSocket URL: {url}")
+    secure = parts.scheme == "wss"
+    host = parts.hostname or ""
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
+    ctx = (ssl_context or ssl.create_default_context()) if secure else None
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port, ssl=ctx, limit=max_size), timeout
+    )
+    try:
+        key = base64.b64encode(os.urandom(16)).decode()
+        host_header = host if parts.port is None else f"{host}:{port}"
+        lines = [
+            f"GET {path} HTTP/1.1",
+            f"Host: {host_header}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key}",
+            "Sec-WebSocket-Version: 13",
+        ]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        status = status_line.split(" ", 2)
+        if len(status) < 2 or status[1] != "101":
+            raise WebSocketError(f"WebSocket handshake failed: {status_line}")
+        response_headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                response_headers[name.strip().lower()] = value.strip()
+        if response_headers.get("sec-websocket-accept") != accept_key(key):
+            raise WebSocketError("WebSocket handshake failed: bad Sec-WebSocket-Accept")
+    except BaseException:
+        writer.close()
+        raise
+    return WebSocket(reader, writer, max_size=max_size)
@@ -1,77 +1,360 @@
+import importlib
+import threading
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
 
 from aurora_core.config import APIConfig, load_api_config
 from aurora_core.logging_utils import get_logger
-from aurora_apis.alpha_vantage_client import AlphaVantageClient
-from aurora_apis.benzinga_client import BenzingaClient
-from aurora_apis.finnhub_client import FinnhubClient
-from aurora_apis.polygon_client import PolygonClient
-from aurora_apis.schwab_client import SchwabClient
-from aurora_apis.sec_edgar_client import SECEdgarClient
-from aurora_apis.fred_client import FREDClient
-from aurora_apis.reddit_client import RedditClient
-from aurora_apis.stocktwits_client import StockTwitsClient
-from aurora_apis.iex_client import IEXClient
-from aurora_apis.tradingeconomics_client import TradingEconomicsClient
+
+# Provider modules (and the HTTP stack behind them) are imported only when a
+# client is first used, so importing this module stays cheap.
+if TYPE_CHECKING:
+    from aurora_apis.alpha_vantage_client import AlphaVantageClient, AsyncAlphaVantageClient
+    from aurora_apis.async_transport import AsyncTransport
+    from aurora_apis.benzinga_client import AsyncBenzingaClient, BenzingaClient
+    from aurora_apis.finnhub_client import AsyncFinnhubClient, FinnhubClient
+    from aurora_apis.fred_client import AsyncFREDClient, FREDClient
+    from aurora_apis.iex_client import AsyncIEXClient, IEXClient
+    from aurora_apis.polygon_client import AsyncPolygonClient, PolygonClient
+    from aurora_apis.reddit_client import AsyncRedditClient, RedditClient
+    from aurora_apis.resilience import Resilience
+    from aurora_apis.schwab_client import SchwabClient
+    from aurora_apis.sec_edgar_client import AsyncSECEdgarClient, SECEdgarClient
+    from aurora_apis.stocktwits_client import AsyncStockTwitsClient, StockTwitsClient
+    from aurora_core.request_scheduler import RequestScheduler
+    from aurora_apis.tradingeconomics_client import (
+        AsyncTradingEconomicsClient,
+        TradingEconomicsClient,
+    )
 
 
 logger = get_logger(__name__)
 
 
-@dataclass
-class AuroraClients:
-    alpha_vantage: AlphaVantageClient
-    benzinga: BenzingaClient
-    finnhub: FinnhubClient
-    polygon: PolygonClient
-    schwab: SchwabClient
-    sec_edgar: SECEdgarClient
-    fred: FREDClient
-    reddit: RedditClient
-    stocktwits: StockTwitsClient
-    iex: IEXClient
-    tradingeconomics: TradingEconomicsClient
+@dataclass(frozen=True)
+class ProviderSpec:
+    """
+    Where a provider's client lives and how to build it from `APIConfig`.
+    `async_class` is None for clients that have no asyncio variant.
+    """
+
+    module: str
+    sync_class: str
+    async_class: str | None
+    kwargs: Callable[[APIConfig], Dict[str, Any]]
+
+
+PROVIDERS: Dict[str, ProviderSpec] = {
+    "alpha_vantage": ProviderSpec(
+        "aurora_apis.alpha_vantage_client",
+        "AlphaVantageClient",
+        "AsyncAlphaVantageClient",
+        lambda c: {"api_key": c.alpha_vantage_api_key},
+    ),
+    "benzinga": ProviderSpec(
+        "aurora_apis.benzinga_client",
+        "BenzingaClient",
+        "AsyncBenzingaClient",
+        lambda c: {"api_key": c.benzinga_api_key},
+    ),
+    "finnhub": ProviderSpec(
+        "aurora_apis.finnhub_client",
+        "FinnhubClient",
+        "AsyncFinnhubClient",
+        lambda c: {
+            "api_key": c.finnhub_api_key,
+            "api_secret": c.finnhub_secret,
+            "proxy_url": c.finnhub_proxy_url,
+        },
+    ),
+    "polygon": ProviderSpec(
+        "aurora_apis.polygon_client",
+        "PolygonClient",
+        "AsyncPolygonClient",
+        lambda c: {
+            "api_key": c.polygon_api_key,
+            "access_key_id": c.polygon_access_key_id,
+            "secret_access_key": c.polygon_secret_access_key,
+            "s3_endpoint": c.polygon_s3_endpoint,
+        },
+    ),
+    "schwab": ProviderSpec(
+        "aurora_apis.schwab_client",
+        "SchwabClient",
+        None,
+        lambda c: {"api_key": c.schwab_api_key, "app_secret": c.schwab_app_secret},
+    ),
+    "sec_edgar": ProviderSpec(
+        "aurora_apis.sec_edgar_client",
+        "SECEdgarClient",
+        "AsyncSECEdgarClient",
+        lambda c: {"user_agent": c.sec_edgar_user_agent, "cache_dir": c.sec_edgar_cache_dir},
+    ),
+    "fred": ProviderSpec(
+        "aurora_apis.fred_client",
+        "FREDClient",
+        "AsyncFREDClient",
+        lambda c: {"api_key": c.fred_api_key},
+    ),
+    "reddit": ProviderSpec(
+        "aurora_apis.reddit_client",
+        "RedditClient",
+        "AsyncRedditClient",
+        lambda c: {
+            "client_id": c.reddit_client_id,
+            "client_secret": c.reddit_client_secret,
+            "user_agent": c.reddit_user_agent,
+        },
+    ),
+    "stocktwits": ProviderSpec(
+        "aurora_apis.stocktwits_client",
+        "StockTwitsClient",
+        "AsyncStockTwitsClient",
+        lambda c: {"access_token": c.stocktwits_access_token},
+    ),
+    "iex": ProviderSpec(
+        "aurora_apis.iex_client",
+        "IEXClient",
+        "AsyncIEXClient",
+        lambda c: {"api_token": c.iex_api_token},
+    ),
+    "tradingeconomics": ProviderSpec(
+        "aurora_apis.tradingeconomics_client",
+        "TradingEconomicsClient",
+        "AsyncTradingEconomicsClient",
+        lambda c: {
+            "client_key": c.tradingeconomics_client_key,
+            "client_secret": c.tradingeconomics_client_secret,
+        },
+    ),
+}
+
 
+def _select(providers: Iterable[str] | None) -> Tuple[str, ...]:
+    if providers is None:
+        return tuple(PROVIDERS)
+    selected = tuple(dict.fromkeys(providers))
+    unknown = [p for p in selected if p not in PROVIDERS]
+    if unknown:
+        raise ValueError(f"Unknown providers: {unknown}")
+    return selected
 
-def build_clients(config: APIConfig | None = None) -> AuroraClients:
+
+class _LazyClients:
     """
-    Build all Aurora API clients from the loaded configuration.
+    Clients by provider name, each imported and built on first attribute
+    access. Clients passed as keyword arguments are used as-is.
+    """
+
+    _async = False
+
+    def __init__(
+        self,
+        config: APIConfig | None = None,
+        providers: Iterable[str] | None = None,
+        **clients: Any,
+    ) -> None:
+        self._config = config
+        self._providers = _select(providers)
+        self._lock = threading.Lock()
+        for name, client in clients.items():
+            if name not in PROVIDERS:
+                raise TypeError(f"Unknown provider client: {name!r}")
+            self.__dict__[name] = client
+
+    @property
+    def providers(self) -> Tuple[str, ...]:
+        return self._providers
+
+    @property
+    def loaded(self) -> List[str]:
+        """
+        Providers whose clients have been built so far.
+        """
+        return [name for name in PROVIDERS if name in self.__dict__]
+
+    def _kwargs(self, name: str, config: APIConfig) -> Dict[str, Any]:
+        return PROVIDERS[name].kwargs(config)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when `name` is not yet in the instance __dict__.
+        if name.startswith("_") or name not in PROVIDERS:
+            raise AttributeError(f"{type(self).__name__!s} has no attribute {name!r}")
+        if name not in self._providers:
+            raise AttributeError(f"Provider {name!r} was not selected for these clients")
+        with self._lock:
+            client = self.__dict__.get(name)
+            if client is None:
+                if self._config is None:
+                    self._config = load_api_config()
+                spec = PROVIDERS[name]
+                class_name = spec.sync_class
+                if self._async and spec.async_class is not None:
+                    class_name = spec.async_class
+                cls = getattr(importlib.import_module(spec.module), class_name)
+                client = cls(**self._kwargs(name, self._config))
+                self.__dict__[name] = client
+        return client
+
+    def __dir__(self) -> List[str]:
+        return sorted({*super().__dir__(), *self._providers})
+
+
+class AuroraClients(_LazyClients):
+    alpha_vantage: "AlphaVantageClient"
+    benzinga: "BenzingaClient"
+    finnhub: "FinnhubClient"
+    polygon: "PolygonClient"
+    schwab: "SchwabClient"
+    sec_edgar: "SECEdgarClient"
+    fred: "FREDClient"
+    reddit: "RedditClient"
+    stocktwits: "StockTwitsClient"
+    iex: "IEXClient"
+    tradingeconomics: "TradingEconomicsClient"
+
+
+def resilience_from_config(config: APIConfig) -> "Resilience | None":
+    """
+    Retry/circuit-breaker policy from AURORA_HTTP_RETRIES (extra attempts)
+    and AURORA_CIRCUIT_BREAKER ("failures/seconds"), or None if neither is
+    set.
+    """
+    if config.http_retries is None and config.circuit_breaker is None:
+        return None
+    from aurora_apis.resilience import Resilience, RetryPolicy
+
+    retry = RetryPolicy()
+    if config.http_retries is not None:
+        retry = RetryPolicy(max_retries=int(config.http_retries))
+    resilience = Resilience(retry=retry)
+    if config.circuit_breaker:
+        try:
+            failures, _, seconds = config.circuit_breaker.partition("/")
+            resilience.failure_threshold = int(failures)
+            resilience.recovery_timeout = float(seconds or resilience.recovery_timeout)
+        except ValueError:
+            raise ValueError(f"Invalid AURORA_CIRCUIT_BREAKER: {config.circuit_breaker!r}")
+    return resilience
+
+
+def install_resilience(config: APIConfig | None = None) -> "Resilience | None":
+    """
+    Install the configured retry/circuit-breaker policy for all HTTP calls.
     """
     if config is None:
         config = load_api_config()
+    resilience = resilience_from_config(config)
+    if resilience is not None:
+        from aurora_apis.http_client import set_resilience
 
-    logger.info("Building Aurora API clients")
-
-    return AuroraClients(
-        alpha_vantage=AlphaVantageClient(api_key=config.alpha_vantage_api_key),
-        benzinga=BenzingaClient(api_key=config.benzinga_api_key),
-        finnhub=FinnhubClient(
-            api_key=config.finnhub_api_key,
-            api_secret=config.finnhub_secret,
-            proxy_url=config.finnhub_proxy_url,
-        ),
-        polygon=PolygonClient(
-            api_key=config.polygon_api_key,
-            access_key_id=config.polygon_access_key_id,
-            secret_access_key=config.polygon_secret_access_key,
-        ),
-        schwab=SchwabClient(
-            api_key=config.schwab_api_key,
-            app_secret=config.schwab_app_secret,
-        ),
-        sec_edgar=SECEdgarClient(user_agent=config.sec_edgar_user_agent),
-        fred=FREDClient(api_key=config.fred_api_key),
-        reddit=RedditClient(
-            client_id=config.reddit_client_id,
-            client_secret=config.reddit_client_secret,
-            user_agent=config.reddit_user_agent,
-        ),
-        stocktwits=StockTwitsClient(
-            access_token=config.stocktwits_access_token
-        ),
-        iex=IEXClient(api_token=config.iex_api_token),
-        tradingeconomics=TradingEconomicsClient(
-            client_key=config.tradingeconomics_client_key,
-            client_secret=config.tradingeconomics_client_secret,
-        ),
-    )
+        set_resilience(resilience)
+        logger.info(
+            "HTTP retries=%d, circuit breaker %d failures/%.0fs",
+            resilience.retry.max_retries,
+            resilience.failure_threshold,
+            resilience.recovery_timeout,
+        )
+    return resilience
+
+
+def install_scheduler(config: APIConfig | None = None) -> "RequestScheduler | None":
+    """
+    Install the per-provider rate limiter (built-in quotas overridden by
+    AURORA_RATE_LIMITS) for all HTTP calls. AURORA_RATE_LIMITS=off leaves
+    requests unthrottled.
+    """
+    if config is None:
+        config = load_api_config()
+    if (config.rate_limits or "").strip().lower() == "off":
+        return None
+    from aurora_core.request_scheduler import RequestScheduler
+
+    scheduler = RequestScheduler.from_config(config)
+    scheduler.install()
+    return scheduler
+
+
+def build_clients(
+    config: APIConfig | None = None,
+    providers: Iterable[str] | None = None,
+) -> AuroraClients:
+    """
+    Build Aurora API clients from the loaded configuration.
+
+    Each client is imported and constructed on first use; `providers`
+    restricts the set to the named ones (see `PROVIDERS`).
+    """
+    if config is None:
+        config = load_api_config()
+
+    clients = AuroraClients(config, providers)
+    logger.info("Building Aurora API clients: %s", ", ".join(clients.providers))
+    install_resilience(config)
+    install_scheduler(config)
+    return clients
+
+
+class AsyncAuroraClients(_LazyClients):
+    """
+    Asyncio variants of the Aurora clients, built lazily like
+    `AuroraClients` and all sharing `transport`.
+    """
+
+    _async = True
+
+    alpha_vantage: "AsyncAlphaVantageClient"
+    benzinga: "AsyncBenzingaClient"
+    finnhub: "AsyncFinnhubClient"
+    polygon: "AsyncPolygonClient"
+    schwab: "SchwabClient"
+    sec_edgar: "AsyncSECEdgarClient"
+    fred: "AsyncFREDClient"
+    reddit: "AsyncRedditClient"
+    stocktwits: "AsyncStockTwitsClient"
+    iex: "AsyncIEXClient"
+    tradingeconomics: "AsyncTradingEconomicsClient"
+
+    def __init__(
+        self,
+        transport: "AsyncTransport",
+        config: APIConfig | None = None,
+        providers: Iterable[str] | None = None,
+        **clients: Any,
+    ) -> None:
+        super().__init__(config, providers, **clients)
+        self.transport = transport
+
+    def _kwargs(self, name: str, config: APIConfig) -> Dict[str, Any]:
+        kwargs = super()._kwargs(name, config)
+        if PROVIDERS[name].async_class is not None:
+            kwargs["transport"] = self.transport
+        return kwargs
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+async def build_async_clients(
+    config: APIConfig | None = None,
+    transport: "AsyncTransport | None" = None,
+    providers: Iterable[str] | None = None,
+) -> AsyncAuroraClients:
+    """
+    Build asyncio variants of the Aurora API clients sharing one transport,
+    lazily and optionally restricted to `providers` as in `build_clients`.
+
+    Must be awaited inside the event loop that will run the requests.
+    """
+    if config is None:
+        config = load_api_config()
+    install_resilience(config)
+    install_scheduler(config)
+    if transport is None:
+        from aurora_apis.async_transport import AsyncPooledTransport
+
+        transport = AsyncPooledTransport()
+
+    clients = AsyncAuroraClients(transport, config, providers)
+    logger.info("Building async Aurora API clients: %s", ", ".join(clients.providers))
+    return clients
@@ -19,6 +19,7 @@ class APIConfig:
     schwab_api_key: Optional[str] = None
     schwab_app_secret: Optional[str] = None
     sec_edgar_user_agent: Optional[str] = None
+    sec_edgar_cache_dir: Optional[str] = None
     fred_api_key: Optional[str] = None
     reddit_client_id: Optional[str] = None
     reddit_client_secret: Optional[str] = None
@@ -27,6 +28,10 @@ class APIConfig:
     iex_api_token: Optional[str] = None
     tradingeconomics_client_key: Optional[str] = None
     tradingeconomics_client_secret: Optional[str] = None
+    rate_limits: Optional[str] = None
+    http_retries: Optional[str] = None
+    circuit_breaker: Optional[str] = None
+    metrics_addr: Optional[str] = None
 
 
 def load_api_config() -> APIConfig:
@@ -48,6 +53,7 @@ def load_api_config() -> APIConfig:
         schwab_api_key=os.getenv("SCHWAB_API_KEY"),
         schwab_app_secret=os.getenv("SCHWAB_APP_SECRET"),
         sec_edgar_user_agent=os.getenv("SEC_EDGAR_USER_AGENT"),
+        sec_edgar_cache_dir=os.getenv("SEC_EDGAR_CACHE_DIR"),
         fred_api_key=os.getenv("FRED_API_KEY"),
         reddit_client_id=os.getenv("REDDIT_CLIENT_ID"),
         reddit_client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
@@ -56,4 +62,8 @@ def load_api_config() -> APIConfig:
         iex_api_token=os.getenv("IEX_API_TOKEN"),
         tradingeconomics_client_key=os.getenv("TRADINGECONOMICS_CLIENT_KEY"),
         tradingeconomics_client_secret=os.getenv("TRADINGECONOMICS_CLIENT_SECRET"),
+        rate_limits=os.getenv("AURORA_RATE_LIMITS"),
+        http_retries=os.getenv("AURORA_HTTP_RETRIES"),
+        circuit_breaker=os.getenv("AURORA_CIRCUIT_BREAKER"),
+        metrics_addr=os.getenv("AURORA_METRICS_ADDR"),
     )
@@ -1,8 +1,22 @@
-from dataclasses import dataclass
-from typing import Any, Dict
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from threading import Condition, Lock, Thread
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, Mapping, Tuple
 
 from aurora_core.api_manager import AuroraClients
+from aurora_core.event_bus import EventBus, Topic
 from aurora_core.logging_utils import get_logger
+from aurora_core.request_scheduler import Priority, deadline, priority
+from aurora_core.snapshot_models import CompactSnapshot, Quote, quote_from_payload
+from aurora_apis.market_stream import Tick
+from aurora_apis.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from aurora_core.news_feed import NewsStore
+    from aurora_core.quote_router import QuoteRouter
 
 
 logger = get_logger(__name__)
@@ -10,10 +24,97 @@ logger = get_logger(__name__)
 
 @dataclass
 class TickerSnapshot:
+    """
+    `quote` is always a normalized `Quote` as a dict (see
+    `aurora_core.snapshot_models`), whichever provider or stream it came
+    from, or empty when missing.
+    """
+
     symbol: str
     quote: Dict[str, Any]
     news: list[Dict[str, Any]]
     fundamentals: Dict[str, Any]
+    missing: list[str] = field(default_factory=list)
+    stale: list[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_partial(self) -> bool:
+        return bool(self.missing or self.stale)
+
+    def normalized(self) -> CompactSnapshot:
+        """
+        Provider-neutral, parsed and slotted form of this snapshot.
+        """
+        return CompactSnapshot.from_snapshot(self)
+
+
+SourceFetcher = Callable[[AuroraClients, str], Any]
+
+
+@dataclass
+class _SourceCall:
+    """
+    One symbol x source call scheduled by `snapshot_many`. `started` is
+    set by the worker thread when the call begins.
+    """
+
+    symbol: str
+    name: str
+    provider: str
+    timeout: float
+    started: float | None = None
+    pool: ThreadPoolExecutor | None = None
+
+    @property
+    def deadline(self) -> float:
+        return (self.started or 0.0) + self.timeout
+
+
+# Snapshot field -> upstream call. Order matters only for sequential mode.
+SNAPSHOT_SOURCES: Dict[str, SourceFetcher] = {
+    "quote": lambda clients, symbol: clients.alpha_vantage.get_quote(symbol),
+    "news": lambda clients, symbol: clients.benzinga.get_news(symbol, limit=10),
+    "fundamentals": lambda clients, symbol: clients.sec_edgar.get_company_facts(symbol),
+}
+
+# Snapshot field -> provider whose concurrency cap the call counts against.
+SOURCE_PROVIDERS: Dict[str, str] = {
+    "quote": "alpha_vantage",
+    "news": "benzinga",
+    "fundamentals": "sec_edgar",
+}
+
+# Snapshot field -> scheduler priority: quotes jump the rate-limit queue
+# ahead of slow-moving news and fundamentals.
+SOURCE_PRIORITIES: Dict[str, Priority] = {
+    "quote": Priority.LIVE,
+    "news": Priority.BACKFILL,
+    "fundamentals": Priority.BACKFILL,
+}
+
+DEFAULT_PROVIDER_CONCURRENCY = 4
+
+# How often snapshot_many checks whether a queued call has started.
+_QUEUED_POLL = 0.01
+
+
+def _quote_dict(symbol: str, payload: Any) -> Dict[str, Any]:
+    """
+    Normalize any provider's quote payload to `asdict(Quote)`. A payload
+    without a quote (e.g. a throttle note) is a failed fetch.
+    """
+    quote = payload if isinstance(payload, Quote) else quote_from_payload(symbol, payload)
+    if quote is None:
+        raise ValueError(f"No quote in payload for {symbol}")
+    return asdict(quote)
+
+
+_EMPTY_VALUES: Dict[str, Callable[[], Any]] = {
+    "quote": dict,
+    "news": list,
+    "fundamentals": dict,
+}
 
 
 class DataFusionBus:
@@ -21,21 +122,410 @@ class DataFusionBus:
     Simple data fusion bus that pulls from upstream APIs and returns
     a unified snapshot structure. This is intentionally conservative
     and can be extended by additional Aurora services.
+
+    With `concurrent=True` the sources of a snapshot are fetched in
+    parallel on a shared thread pool. Each source gets `source_timeout`
+    seconds (overridable per field via `source_timeouts`); a source that
+    fails or times out does not fail the snapshot. Its field is filled
+    with the last good value for that symbol and listed in `stale`, or
+    left empty and listed in `missing` if there is none.
+
+    Streaming ticks pushed through `publish_tick` (see `StreamIngestor`)
+    are merged into an in-memory live quote per symbol. While that quote
+    is younger than `tick_max_age` seconds, snapshots use it and skip the
+    REST quote call entirely. Merged quotes are also published on
+    `events` (an `EventBus`) under `Topic.QUOTES`, keyed by symbol, so
+    consumers can react to updates instead of polling snapshots. Publishing
+    happens on a dispatch thread, never on the stream's event loop: the
+    loop only records the symbol's latest quote, and updates that arrive
+    while the dispatcher is busy (e.g. behind a `BLOCK` subscriber) are
+    conflated into the newest one per symbol.
+
+    Pass a `QuoteRouter` to fetch REST quotes across several providers with
+    hedging instead of from Alpha Vantage alone, and a `NewsStore` (kept
+    current by a `NewsPoller`) to read news from memory instead of querying
+    Benzinga per symbol.
+
+    Snapshot build times, per-source fetch times, timeouts and live-quote
+    hits are recorded in the process metrics registry (`aurora_apis.metrics`).
     """
 
-    def __init__(self, clients: AuroraClients) -> None:
+    def __init__(
+        self,
+        clients: AuroraClients,
+        concurrent: bool = False,
+        source_timeout: float = 5.0,
+        source_timeouts: Mapping[str, float] | None = None,
+        max_workers: int = 8,
+        provider_limits: Mapping[str, int] | None = None,
+        tick_max_age: float = 5.0,
+        events: EventBus | None = None,
+        quote_router: "QuoteRouter | None" = None,
+        news_store: "NewsStore | None" = None,
+    ) -> None:
         self.clients = clients
+        self.concurrent = concurrent
+        self.source_timeout = source_timeout
+        self.source_timeouts: Dict[str, float] = dict(source_timeouts or {})
+        self.max_workers = max_workers
+        self.provider_limits: Dict[str, int] = dict(provider_limits or {})
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = Lock()
+        self._last_good: Dict[Tuple[str, str], Any] = {}
+        self.tick_max_age = tick_max_age
+        # symbol -> (monotonic receipt time, merged live quote)
+        self._live: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._live_lock = Lock()
+        # symbol -> newest merged quote not yet published on `events`
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_cond = Condition()
+        self._dispatching = False
+        self._dispatcher: Thread | None = None
+        self._closing = False
+        self.conflated = 0
+        self.events = events if events is not None else EventBus()
+        self.quote_router = quote_router
+        self.sources: Dict[str, SourceFetcher] = dict(SNAPSHOT_SOURCES)
+        self.source_providers: Dict[str, str] = dict(SOURCE_PROVIDERS)
+        if quote_router is not None:
+            self.sources["quote"] = lambda clients, symbol: quote_router.get_quote(symbol)
+            # The router spreads calls over several providers itself.
+            self.source_providers["quote"] = "quote_router"
+        self.news_store = news_store
+        if news_store is not None:
+            self.sources["news"] = lambda clients, symbol: news_store.latest(symbol, 10)
+            self.source_providers["news"] = "news_store"
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="aurora-fusion",
+                )
+            return self._executor
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Tuple[Future, ThreadPoolExecutor]:
+        while True:
+            executor = self._get_executor()
+            try:
+                return executor.submit(fn, *args), executor
+            except RuntimeError:
+                # Retired by another call since we fetched it: use the new pool.
+                with self._executor_lock:
+                    if self._executor is executor:
+                        raise
+
+    def _retire_executor(self, executor: ThreadPoolExecutor) -> None:
+        """
+        Stop handing work to a pool with a thread stuck in a timed-out call;
+        later calls get a fresh pool while the stuck thread finishes.
+        """
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False)
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.inc("aurora_snapshot_pool_retirements_total")
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool and the quote dispatcher. In-flight
+        upstream calls are not awaited; pending quotes are published first.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        with self._pending_cond:
+            dispatcher, self._dispatcher = self._dispatcher, None
+            self._closing = True
+            self._pending_cond.notify_all()
+        if dispatcher is not None:
+            dispatcher.join()
+        with self._pending_cond:
+            self._closing = False
+
+    def publish_tick(self, tick: Tick) -> None:
+        """
+        Merge a streaming trade or quote into the symbol's live quote.
+        """
+        if tick.kind == "trade":
+            update = {"price": tick.price, "size": tick.size, "trade_time": tick.timestamp}
+        else:
+            update = {
+                "bid": tick.bid,
+                "ask": tick.ask,
+                "bid_size": tick.bid_size,
+                "ask_size": tick.ask_size,
+                "quote_time": tick.timestamp,
+            }
+        with self._live_lock:
+            entry = self._live.get(tick.symbol)
+            live = dict(entry[1]) if entry else {"symbol": tick.symbol}
+            live.update(update, source=tick.source)
+            self._live[tick.symbol] = (time.monotonic(), live)
+        with self._pending_cond:
+            if tick.symbol in self._pending:
+                self.conflated += 1
+            self._pending[tick.symbol] = live
+            if self._dispatcher is None:
+                self._dispatcher = Thread(
+                    target=self._dispatch_quotes, name="aurora-fusion-quotes", daemon=True
+                )
+                self._dispatcher.start()
+            self._pending_cond.notify_all()
+
+    def _dispatch_quotes(self) -> None:
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(lambda: self._pending or self._closing)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._dispatching = True
+            try:
+                for symbol, live in batch.items():
+                    self.events.publish(Topic.QUOTES, dict(live), key=symbol)
+            except Exception:  # noqa: BLE001 - keep dispatching later quotes
+                logger.exception("Publishing live quotes failed")
+            finally:
+                with self._pending_cond:
+                    self._dispatching = False
+                    self._pending_cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every merged quote has been published on `events`.
+        """
+        with self._pending_cond:
+            return self._pending_cond.wait_for(
+                lambda: not self._pending and not self._dispatching, timeout
+            )
+
+    def live_quote(self, symbol: str) -> Dict[str, Any] | None:
+        """
+        The streamed quote for `symbol`, or None if absent or older than
+        `tick_max_age`.
+        """
+        with self._live_lock:
+            entry = self._live.get(symbol)
+        if entry is None or time.monotonic() - entry[0] > self.tick_max_age:
+            return None
+        return dict(entry[1])
+
+    def _live_value(self, name: str, symbol: str) -> Any:
+        if name != "quote":
+            return None
+        live = self.live_quote(symbol)
+        if live is None:
+            return None
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.inc("aurora_snapshot_live_hits_total", source=name)
+        return _quote_dict(symbol, live)
+
+    def _fetch(self, name: str, symbol: str) -> Any:
+        value = self._call_source(name, symbol)
+        return _quote_dict(symbol, value) if name == "quote" else value
+
+    def _call_source(self, name: str, symbol: str) -> Any:
+        fetch = self.sources[name]
+        metrics = get_metrics()
+        with priority(SOURCE_PRIORITIES.get(name, Priority.NORMAL)):
+            if metrics is None:
+                return fetch(self.clients, symbol)
+            with metrics.time_call(
+                "aurora_snapshot_source_seconds",
+                errors="aurora_snapshot_source_errors_total",
+                source=name,
+                provider=self.source_providers[name],
+            ):
+                return fetch(self.clients, symbol)
 
     def snapshot(self, symbol: str) -> TickerSnapshot:
         logger.info("Building snapshot for %s", symbol)
+        mode = "concurrent" if self.concurrent else "sequential"
+        metrics = get_metrics()
+        if metrics is None:
+            return self._snapshot(symbol)
+        with metrics.time_call("aurora_snapshot_seconds", mode=mode):
+            return self._snapshot(symbol)
+
+    def _snapshot(self, symbol: str) -> TickerSnapshot:
+        if self.concurrent:
+            return self._snapshot_concurrent(symbol)
+
+        values = {}
+        for name in self.sources:
+            live = self._live_value(name, symbol)
+            values[name] = live if live is not None else self._fetch(name, symbol)
+        return TickerSnapshot(symbol=symbol, **values)
+
+    def _snapshot_concurrent(self, symbol: str) -> TickerSnapshot:
+        return next(self.snapshot_many([symbol]))
+
+    def snapshot_many(
+        self,
+        symbols: Iterable[str],
+        provider_limits: Mapping[str, int] | None = None,
+    ) -> Iterator[TickerSnapshot]:
+        """
+        Build snapshots for many symbols, yielding each one as soon as all
+        of its sources have finished (completion order, not input order).
+
+        Every symbol x source call is scheduled on the shared worker pool.
+        At most `max_workers` calls of one `snapshot_many` run at once, and
+        at most `provider_limits[provider]` against any single provider,
+        with providers served round-robin so a slow one cannot starve the
+        rest. A source's timeout runs from when its call starts, not from
+        when it was queued. A timed-out call keeps its provider slot until
+        its thread returns, but the pool it is stuck in is retired so it
+        does not hold a worker slot. Calls that have not started when the
+        iterator is closed are cancelled. Failures and timeouts are
+        handled as in concurrent `snapshot`.
+        """
+        limits = {**self.provider_limits, **(provider_limits or {})}
+        ordered = list(dict.fromkeys(symbols))
+        if not ordered:
+            return
+
+        results: Dict[str, Dict[str, Any]] = {symbol: {} for symbol in ordered}
+        errors: Dict[str, Dict[str, str]] = {symbol: {} for symbol in ordered}
+        remaining = {symbol: len(self.sources) for symbol in ordered}
+
+        queues: Dict[str, Deque[Tuple[str, str]]] = {}
+        for symbol in ordered:
+            for name in self.sources:
+                live = self._live_value(name, symbol)
+                if live is not None:
+                    results[symbol][name] = live
+                    remaining[symbol] -= 1
+                    continue
+                queues.setdefault(self.source_providers[name], deque()).append((symbol, name))
+        rotation = deque(queues)
+        busy: Dict[str, int] = {provider: 0 for provider in queues}
+        in_flight: Dict[Future, _SourceCall] = {}
+        # Timed-out calls keep their provider slot until the thread returns.
+        abandoned: Dict[Future, str] = {}
+        metrics = get_metrics()
+
+        def dispatch() -> None:
+            progress = True
+            while progress:
+                progress = False
+                for _ in range(len(rotation)):
+                    if len(in_flight) >= self.max_workers:
+                        return
+                    provider = rotation[0]
+                    rotation.rotate(-1)
+                    queue = queues[provider]
+                    limit = limits.get(provider, DEFAULT_PROVIDER_CONCURRENCY)
+                    if not queue or busy[provider] >= limit:
+                        continue
+                    symbol, name = queue.popleft()
+                    call = _SourceCall(
+                        symbol, name, provider, self.source_timeouts.get(name, self.source_timeout)
+                    )
+                    # Run in a copy of the caller's context so contextvars
+                    # set around the call (e.g. scheduler priority) apply.
+                    ctx = contextvars.copy_context()
+                    fut, call.pool = self._submit(ctx.run, self._fetch_started, call, name, symbol)
+                    in_flight[fut] = call
+                    busy[provider] += 1
+                    progress = True
+
+        def settle(symbol: str) -> TickerSnapshot | None:
+            remaining[symbol] -= 1
+            if remaining[symbol]:
+                return None
+            return self._assemble(symbol, results.pop(symbol), errors.pop(symbol))
+
+        try:
+            dispatch()
+            while in_flight or abandoned:
+                now = time.monotonic()
+                ready: list[TickerSnapshot] = []
+                for fut, call in list(in_flight.items()):
+                    if call.started is None or fut.done() or now < call.deadline:
+                        continue
+                    del in_flight[fut]
+                    abandoned[fut] = call.provider
+                    errors[call.symbol][call.name] = "timeout"
+                    if metrics is not None:
+                        metrics.inc("aurora_snapshot_source_timeouts_total", source=call.name)
+                    self._retire_executor(call.pool)
+                    snap = settle(call.symbol)
+                    if snap is not None:
+                        ready.append(snap)
+
+                if not ready:
+                    timeout = None
+                    if in_flight:
+                        started = [c.deadline for c in in_flight.values() if c.started is not None]
+                        if len(started) < len(in_flight):
+                            # A queued call's clock starts when a worker
+                            # picks it up, which does not wake `wait`.
+                            started.append(now + _QUEUED_POLL)
+                        timeout = max(0.0, min(started) - now)
+                    done, _ = wait(
+                        [*in_flight, *abandoned], timeout=timeout, return_when=FIRST_COMPLETED
+                    )
+                    for fut in done:
+                        if fut in abandoned:
+                            busy[abandoned.pop(fut)] -= 1
+                            continue
+                        call = in_flight.pop(fut)
+                        busy[call.provider] -= 1
+                        try:
+                            results[call.symbol][call.name] = fut.result()
+                        except Exception as exc:  # noqa: BLE001 - surfaced via `errors`
+                            errors[call.symbol][call.name] = f"{type(exc).__name__}: {exc}"
+                        snap = settle(call.symbol)
+                        if snap is not None:
+                            ready.append(snap)
+
+                dispatch()
+                yield from ready
+                if not in_flight and not any(queues.values()):
+                    break
+        finally:
+            for fut in in_flight:
+                fut.cancel()
+
+    def _fetch_started(self, call: "_SourceCall", name: str, symbol: str) -> Any:
+        call.started = time.monotonic()
+        # Past the deadline nobody reads the result, so stop waiting for a
+        # rate-limit token instead of spending it.
+        with deadline(call.deadline):
+            return self._fetch(name, symbol)
+
+    def _assemble(
+        self, symbol: str, results: Dict[str, Any], errors: Dict[str, str]
+    ) -> TickerSnapshot:
+        values: Dict[str, Any] = {}
+        missing: list[str] = []
+        stale: list[str] = []
+        for name in self.sources:
+            if name in results:
+                values[name] = results[name]
+                self._last_good[(symbol, name)] = results[name]
+            elif (symbol, name) in self._last_good:
+                values[name] = self._last_good[(symbol, name)]
+                stale.append(name)
+            else:
+                values[name] = _EMPTY_VALUES[name]()
+                missing.append(name)
 
-        quote = self.clients.alpha_vantage.get_quote(symbol)
-        news = self.clients.benzinga.get_news(symbol, limit=10)
-        fundamentals = self.clients.sec_edgar.get_company_facts(symbol)
+        for name, reason in errors.items():
+            logger.warning("Snapshot source %s failed for %s: %s", name, symbol, reason)
 
         return TickerSnapshot(
             symbol=symbol,
-            quote=quote,
-            news=news,
-            fundamentals=fundamentals,
+            missing=missing,
+            stale=stale,
+            errors=errors,
+            **values,
         )
@@ -0,0 +1,300 @@
+import bisect
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from aurora_core.api_manager import AuroraClients
+from aurora_core.event_bus import EventBus, Topic
+from aurora_core.logging_utils import get_logger
+from aurora_core.snapshot_models import _epoch_seconds
+
+
+logger = get_logger(__name__)
+
+# (event time, calendar id): the sort key of every index.
+_Key = Tuple[float, str]
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    id: str
+    time: float
+    country: str
+    category: str
+    event: str
+    importance: int
+    actual: str = ""
+    forecast: str = ""
+    previous: str = ""
+    reference: str = ""
+
+    @property
+    def key(self) -> _Key:
+        return (self.time, self.id)
+
+    @classmethod
+    def from_api(cls, row: Mapping[str, Any]) -> "CalendarEvent":
+        """
+        Parse a TradingEconomics calendar row; its "Date" is in UTC.
+        """
+        return cls(
+            id=str(row["CalendarId"]),
+            time=_epoch_seconds(row.get("Date")),
+            country=row.get("Country") or "",
+            category=row.get("Category") or "",
+            event=row.get("Event") or "",
+            importance=int(row.get("Importance") or 1),
+            actual=str(row.get("Actual") or ""),
+            forecast=str(row.get("Forecast") or ""),
+            previous=str(row.get("Previous") or ""),
+            reference=str(row.get("Reference") or ""),
+        )
+
+
+def _day(ts: float) -> date:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).date()
+
+
+def _day_start(day: date) -> float:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+
+
+class EconomicCalendar:
+    """
+    Local TradingEconomics calendar with time-indexed lookups.
+
+    Events are kept in a list sorted by (time, id), plus one such list per
+    country and per importance level, so range queries ("high-importance
+    US events in the next 30 minutes") are a bisect and a slice.
+
+    `sync(start, end)` refreshes the store one UTC day at a time but only
+    for days that are missing or stale: days within `near_days` of today
+    (where actuals and reschedules land) after `near_refresh` seconds,
+    other days after `far_refresh`. Contiguous stale days are fetched in a
+    single range request. An event that disappears from a refreshed day is
+    dropped; new and changed events are published on `events` under
+    `Topic.MACRO`, keyed by country.
+    """
+
+    def __init__(
+        self,
+        clients: AuroraClients,
+        countries: Iterable[str] | None = None,
+        near_days: int = 1,
+        near_refresh: float = 300.0,
+        far_refresh: float = 6 * 3600.0,
+        events: EventBus | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.clients = clients
+        self.countries = list(countries) if countries is not None else None
+        self.near_days = near_days
+        self.near_refresh = near_refresh
+        self.far_refresh = far_refresh
+        self.events = events
+        self.clock = clock
+        self._by_id: Dict[str, CalendarEvent] = {}
+        self._times: List[_Key] = []
+        self._by_country: Dict[str, List[_Key]] = {}
+        self._by_importance: Dict[int, List[_Key]] = {}
+        self._synced: Dict[date, float] = {}
+        self._lock = threading.RLock()
+        self.requests = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, event_id: str) -> CalendarEvent | None:
+        return self._by_id.get(event_id)
+
+    @staticmethod
+    def _remove_key(keys: List[_Key], key: _Key) -> None:
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+
+    def _unindex(self, event: CalendarEvent) -> None:
+        self._remove_key(self._times, event.key)
+        self._remove_key(self._by_country[event.country.lower()], event.key)
+        self._remove_key(self._by_importance[event.importance], event.key)
+
+    def upsert(self, event: CalendarEvent) -> bool:
+        """
+        Store or replace an event; False if it is unchanged.
+        """
+        with self._lock:
+            old = self._by_id.get(event.id)
+            if old == event:
+                return False
+            if old is not None:
+                self._unindex(old)
+            self._by_id[event.id] = event
+            bisect.insort(self._times, event.key)
+            bisect.insort(self._by_country.setdefault(event.country.lower(), []), event.key)
+            bisect.insort(self._by_importance.setdefault(event.importance, []), event.key)
+            return True
+
+    def remove(self, event_id: str) -> bool:
+        with self._lock:
+            event = self._by_id.pop(event_id, None)
+            if event is None:
+                return False
+            self._unindex(event)
+            return True
+
+    def _stale(self, day: date, today: date, now: float) -> bool:
+        synced = self._synced.get(day)
+        if synced is None:
+            return True
+        near = abs((day - today).days) <= self.near_days
+        return now - synced >= (self.near_refresh if near else self.far_refresh)
+
+    def stale_ranges(self, start: date, end: date) -> List[Tuple[date, date]]:
+        """
+        Inclusive day ranges within `start`..`end` that need fetching.
+        """
+        now = self.clock()
+        today = _day(now)
+        ranges: List[Tuple[date, date]] = []
+        day = start
+        while day <= end:
+            if self._stale(day, today, now):
+                if ranges and ranges[-1][1] == day - timedelta(days=1):
+                    ranges[-1] = (ranges[-1][0], day)
+                else:
+                    ranges.append((day, day))
+            day += timedelta(days=1)
+        return ranges
+
+    def _apply(self, first: date, last: date, rows: Iterable[Mapping[str, Any]]) -> List[CalendarEvent]:
+        lo, hi = _day_start(first), _day_start(last + timedelta(days=1))
+        changed: List[CalendarEvent] = []
+        fetched = set()
+        with self._lock:
+            for row in rows:
+                event = CalendarEvent.from_api(row)
+                fetched.add(event.id)
+                if self.upsert(event):
+                    changed.append(event)
+            i, j = bisect.bisect_left(self._times, (lo,)), bisect.bisect_left(self._times, (hi,))
+            for _, event_id in self._times[i:j]:
+                if event_id not in fetched:
+                    self.remove(event_id)
+        return changed
+
+    def sync(self, start: date, end: date) -> List[CalendarEvent]:
+        """
+        Refresh stale days in `start`..`end`; returns new or changed events.
+        """
+        country = ",".join(self.countries) if self.countries else None
+        changed: List[CalendarEvent] = []
+        for first, last in self.stale_ranges(start, end):
+            fetched_at = self.clock()
+            rows = self.clients.tradingeconomics.get_calendar_range(first, last, country=country)
+            self.requests += 1
+            changed.extend(self._apply(first, last, rows or []))
+            day = first
+            while day <= last:
+                self._synced[day] = fetched_at
+                day += timedelta(days=1)
+        if changed:
+            logger.info("Economic calendar: %d new or changed events", len(changed))
+            if self.events is not None:
+                self.events.publish_many(Topic.MACRO, ((e.country, e) for e in changed))
+        return changed
+
+    def sync_ahead(self, days: int = 7) -> List[CalendarEvent]:
+        """
+        Refresh yesterday through `days` days ahead.
+        """
+        today = _day(self.clock())
+        return self.sync(today - timedelta(days=1), today + timedelta(days=days))
+
+    def between(
+        self,
+        start: float,
+        end: float,
+        country: str | None = None,
+        min_importance: int = 1,
+    ) -> List[CalendarEvent]:
+        """
+        Events with `start` <= time < `end` (Unix seconds), in time order.
+        """
+        lo, hi = (start,), (end,)
+        with self._lock:
+            if country is not None:
+                keys = self._by_country.get(country.lower(), [])
+                found = keys[bisect.bisect_left(keys, lo):bisect.bisect_left(keys, hi)]
+                events = [self._by_id[event_id] for _, event_id in found]
+                return [e for e in events if e.importance >= min_importance]
+            if min_importance <= 1:
+                found = self._times[bisect.bisect_left(self._times, lo):bisect.bisect_left(self._times, hi)]
+            else:
+                found = list(
+                    heapq.merge(
+                        *(
+                            keys[bisect.bisect_left(keys, lo):bisect.bisect_left(keys, hi)]
+                            for level, keys in self._by_importance.items()
+                            if level >= min_importance
+                        )
+                    )
+                )
+            return [self._by_id[event_id] for _, event_id in found]
+
+    def upcoming(
+        self, minutes: float, country: str | None = None, min_importance: int = 1
+    ) -> List[CalendarEvent]:
+        now = self.clock()
+        return self.between(now, now + minutes * 60, country, min_importance)
+
+    def next_event(self, country: str | None = None, min_importance: int = 1) -> CalendarEvent | None:
+        """
+        The first event at or after now.
+        """
+        now = self.clock()
+        with self._lock:
+            if country is not None:
+                keys = self._by_country.get(country.lower(), [])
+            elif min_importance > 1:
+                firsts = [
+                    keys[i]
+                    for level, keys in self._by_importance.items()
+                    if level >= min_importance
+                    for i in [bisect.bisect_left(keys, (now,))]
+                    if i < len(keys)
+                ]
+                return self._by_id[min(firsts)[1]] if firsts else None
+            else:
+                keys = self._times
+            for _, event_id in keys[bisect.bisect_left(keys, (now,)):]:
+                event = self._by_id[event_id]
+                if event.importance >= min_importance:
+                    return event
+        return None
+
+    def blackout(
+        self,
+        before: float = 900.0,
+        after: float = 300.0,
+        country: str | None = None,
+        min_importance: int = 3,
+    ) -> CalendarEvent | None:
+        """
+        Pre-event risk check: the first event at least `min_importance`
+        due within `before` seconds or released within the last `after`
+        seconds, or None if clear.
+        """
+        now = self.clock()
+        hits = self.between(now - after, now + before, country, min_importance)
+        return hits[0] if hits else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "events": len(self._by_id),
+            "countries": len(self._by_country),
+            "days_synced": len(self._synced),
+            "requests": self.requests,
+        }
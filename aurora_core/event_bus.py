@@ -0,0 +1,270 @@
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
+
+from aurora_core.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class Topic(str, Enum):
+    QUOTES = "quotes"
+    NEWS = "news"
+    FILINGS = "filings"
+    MACRO = "macro"
+    SOCIAL = "social"
+
+
+class Overflow(str, Enum):
+    """
+    What a full subscriber queue does with the next event.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+@dataclass(frozen=True)
+class Event:
+    topic: Topic
+    payload: Any
+    key: str | None = None
+    seq: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+
+EventHandler = Callable[[List[Event]], None]
+
+
+class Subscription:
+    """
+    Bounded queue of events for one consumer.
+
+    With `Overflow.DROP_OLDEST` publishing never waits: a full queue
+    discards its oldest event (counted in `dropped`). With `Overflow.BLOCK`
+    the publisher waits for room, up to `block_timeout` seconds if set,
+    after which the new event is dropped instead.
+    """
+
+    def __init__(
+        self,
+        topics: Iterable[Topic],
+        maxsize: int = 1024,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        keys: Iterable[str] | None = None,
+        block_timeout: float | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.topics = frozenset(Topic(t) for t in topics)
+        self.maxsize = maxsize
+        self.overflow = Overflow(overflow)
+        self.keys = frozenset(keys) if keys is not None else None
+        self.block_timeout = block_timeout
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue: Deque[Event] = deque()
+        self._cond = threading.Condition()
+
+    def wants(self, event: Event) -> bool:
+        return self.keys is None or event.key in self.keys
+
+    def _put(self, event: Event) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._queue) >= self.maxsize:
+                if self.overflow is Overflow.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    deadline = (
+                        None if self.block_timeout is None
+                        else time.monotonic() + self.block_timeout
+                    )
+                    while len(self._queue) >= self.maxsize and not self.closed:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.dropped += 1
+                            return
+                        self._cond.wait(remaining)
+                    if self.closed:
+                        return
+            self._queue.append(event)
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None) -> Event | None:
+        """
+        Next event, or None on timeout or once closed and drained.
+        """
+        batch = self.get_batch(1, timeout)
+        return batch[0] if batch else None
+
+    def get_batch(
+        self, max_items: int = 256, timeout: float | None = None, linger: float = 0.0
+    ) -> List[Event]:
+        """
+        Wait up to `timeout` for at least one event, then optionally
+        `linger` seconds for the batch to fill, and return up to
+        `max_items` events in publish order (empty on timeout or close).
+        """
+        with self._cond:
+            if not self._queue and not self.closed:
+                self._cond.wait_for(lambda: self._queue or self.closed, timeout)
+            if linger > 0 and self._queue and len(self._queue) < max_items:
+                self._cond.wait_for(
+                    lambda: len(self._queue) >= max_items or self.closed, linger
+                )
+            n = min(max_items, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(n)]
+            self.delivered += n
+            if n:
+                self._cond.notify_all()
+            return batch
+
+    def __iter__(self) -> Iterator[Event]:
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus with typed topics.
+
+    `publish` hands the event to every matching subscription's bounded
+    queue and returns; consumers pull with `get`/`get_batch` or register a
+    handler with `subscribe_handler`, which runs on its own thread and
+    receives events in batches. The subscriber list per topic is replaced,
+    never mutated, so publishing takes no bus-wide lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Topic, Tuple[Subscription, ...]] = {t: () for t in Topic}
+        self._seq = itertools.count(1)
+        self._published: Dict[Topic, int] = {t: 0 for t in Topic}
+        self._workers: Dict[Subscription, threading.Thread] = {}
+
+    def subscribe(
+        self,
+        topics: Topic | str | Iterable[Topic | str],
+        maxsize: int = 1024,
+        overflow: Overflow | str = Overflow.DROP_OLDEST,
+        keys: Iterable[str] | None = None,
+        block_timeout: float | None = None,
+    ) -> Subscription:
+        """
+        Subscribe to one or more topics, optionally only events whose key
+        (e.g. symbol) is in `keys`.
+        """
+        if isinstance(topics, (str, Topic)):
+            topics = [topics]
+        sub = Subscription(
+            [Topic(t) for t in topics], maxsize, Overflow(overflow), keys, block_timeout
+        )
+        with self._lock:
+            for topic in sub.topics:
+                self._subscribers[topic] = self._subscribers[topic] + (sub,)
+        return sub
+
+    def subscribe_handler(
+        self,
+        topics: Topic | str | Iterable[Topic | str],
+        handler: EventHandler,
+        batch_size: int = 256,
+        linger: float = 0.0,
+        **kwargs: Any,
+    ) -> Subscription:
+        """
+        Deliver events to `handler(batch)` from a dedicated daemon thread.
+        Handler exceptions are logged and do not stop delivery.
+        """
+        sub = self.subscribe(topics, **kwargs)
+
+        def run() -> None:
+            while not (sub.closed and not sub.pending()):
+                batch = sub.get_batch(batch_size, timeout=0.5, linger=linger)
+                if not batch:
+                    continue
+                try:
+                    handler(batch)
+                except Exception:  # noqa: BLE001 - keep the consumer alive
+                    logger.exception("Event handler failed on a batch of %d", len(batch))
+
+        worker = threading.Thread(target=run, name="aurora-events", daemon=True)
+        with self._lock:
+            self._workers[sub] = worker
+        worker.start()
+        return sub
+
+    def unsubscribe(self, sub: Subscription, timeout: float | None = 5.0) -> None:
+        with self._lock:
+            for topic in sub.topics:
+                self._subscribers[topic] = tuple(
+                    s for s in self._subscribers[topic] if s is not sub
+                )
+            worker = self._workers.pop(sub, None)
+        sub.close()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+
+    def publish(self, topic: Topic | str, payload: Any, key: str | None = None) -> Event:
+        topic = Topic(topic)
+        event = Event(topic, payload, key, next(self._seq))
+        self._published[topic] += 1
+        for sub in self._subscribers[topic]:
+            if sub.wants(event):
+                sub._put(event)
+        return event
+
+    def publish_many(
+        self, topic: Topic | str, items: Iterable[Tuple[str | None, Any]]
+    ) -> int:
+        """
+        Publish (key, payload) pairs on one topic; returns the count.
+        """
+        count = 0
+        for key, payload in items:
+            self.publish(topic, payload, key)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            subs = {s for group in self._subscribers.values() for s in group}
+        for sub in subs:
+            self.unsubscribe(sub)
+
+    def stats(self) -> Dict[str, Any]:
+        subs = {s for group in self._subscribers.values() for s in group}
+        return {
+            "published": {t.value: n for t, n in self._published.items()},
+            "subscribers": [
+                {
+                    "topics": sorted(t.value for t in s.topics),
+                    "pending": s.pending(),
+                    "delivered": s.delivered,
+                    "dropped": s.dropped,
+                    "overflow": s.overflow.value,
+                }
+                for s in subs
+            ],
+        }
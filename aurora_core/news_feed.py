@@ -0,0 +1,214 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from aurora_core.api_manager import AuroraClients
+from aurora_core.event_bus import EventBus, Topic
+from aurora_core.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+NewsItem = Dict[str, Any]
+
+
+def _timestamp(value: Any) -> float:
+    """
+    Unix time of a Benzinga "created"/"updated" value (RFC 2822 text).
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return 0.0
+
+
+def news_tickers(item: NewsItem) -> Tuple[str, ...]:
+    return tuple(
+        dict.fromkeys(s["name"].upper() for s in item.get("stocks") or () if s.get("name"))
+    )
+
+
+class NewsStore:
+    """
+    Local news store indexed by story id and by ticker.
+
+    A revised story (same id, new "updated" time) replaces the stored one
+    in place and moves between ticker indexes if its tickers changed. Each
+    ticker keeps its story ids sorted by (created, id), so `latest` is a
+    slice rather than a scan. Beyond `max_items` stories the least
+    recently stored ones are dropped.
+    """
+
+    def __init__(self, max_items: int = 50_000) -> None:
+        self.max_items = max_items
+        self._items: "OrderedDict[int, NewsItem]" = OrderedDict()
+        # id -> (sort key, tickers, updated) as indexed
+        self._meta: Dict[int, Tuple[Tuple[float, int], Tuple[str, ...], float]] = {}
+        self._by_ticker: Dict[str, List[Tuple[float, int]]] = {}
+        self._lock = threading.Lock()
+        self.inserted = 0
+        self.revised = 0
+        self.unchanged = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, story_id: object) -> bool:
+        return story_id in self._items
+
+    def _unindex(self, story_id: int) -> None:
+        key, tickers, _ = self._meta.pop(story_id)
+        for ticker in tickers:
+            ids = self._by_ticker.get(ticker)
+            if not ids:
+                continue
+            i = bisect.bisect_left(ids, key)
+            if i < len(ids) and ids[i] == key:
+                del ids[i]
+            if not ids:
+                del self._by_ticker[ticker]
+
+    def upsert(self, item: NewsItem) -> bool:
+        """
+        Store a story; False if it is already stored at the same revision.
+        """
+        story_id = int(item["id"])
+        updated = _timestamp(item.get("updated") or item.get("created"))
+        with self._lock:
+            meta = self._meta.get(story_id)
+            if meta is not None:
+                if updated <= meta[2]:
+                    self.unchanged += 1
+                    return False
+                self._unindex(story_id)
+                self.revised += 1
+            else:
+                self.inserted += 1
+            key = (_timestamp(item.get("created")), story_id)
+            tickers = news_tickers(item)
+            self._items[story_id] = item
+            self._items.move_to_end(story_id)
+            self._meta[story_id] = (key, tickers, updated)
+            for ticker in tickers:
+                bisect.insort(self._by_ticker.setdefault(ticker, []), key)
+            while len(self._items) > self.max_items:
+                oldest, _ = self._items.popitem(last=False)
+                self._unindex(oldest)
+        return True
+
+    def get(self, story_id: int) -> NewsItem | None:
+        return self._items.get(story_id)
+
+    def latest(self, symbol: str, limit: int = 10) -> List[NewsItem]:
+        """
+        Newest stories for `symbol` by creation time.
+        """
+        with self._lock:
+            keys = self._by_ticker.get(symbol.upper(), ())[-limit:] if limit > 0 else ()
+            return [self._items[story_id] for _, story_id in reversed(keys)]
+
+    def tickers(self) -> List[str]:
+        with self._lock:
+            return list(self._by_ticker)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "stories": len(self._items),
+            "tickers": len(self._by_ticker),
+            "inserted": self.inserted,
+            "revised": self.revised,
+            "unchanged": self.unchanged,
+        }
+
+
+class NewsPoller:
+    """
+    Keeps a `NewsStore` current with Benzinga's `updatedSince` cursor.
+
+    `tickers` is split into batches of `batch_size` (None polls the whole
+    market as one batch). Each batch remembers the latest "updated" time it
+    has stored and asks only for stories updated since then, paging until a
+    short page (at most `max_pages` requests). The cursor is inclusive, so
+    stories revised in the same second are fetched again and skipped by the
+    store. The first poll of a batch reaches back `lookback` seconds.
+
+    New and revised stories are published on `events` under `Topic.NEWS`,
+    keyed by ticker.
+    """
+
+    def __init__(
+        self,
+        clients: AuroraClients,
+        store: NewsStore | None = None,
+        tickers: Iterable[str] | None = None,
+        batch_size: int = 50,
+        page_size: int = 100,
+        max_pages: int = 10,
+        lookback: float = 24 * 3600.0,
+        events: EventBus | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.clients = clients
+        self.store = store if store is not None else NewsStore()
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.lookback = lookback
+        self.events = events
+        self.clock = clock
+        self.batches: List[Tuple[str, ...] | None] = [None]
+        if tickers is not None:
+            symbols = list(dict.fromkeys(t.upper() for t in tickers))
+            self.batches = [
+                tuple(symbols[i:i + batch_size]) for i in range(0, len(symbols), batch_size)
+            ]
+        self.cursors: Dict[Tuple[str, ...] | None, int] = {}
+        self.requests = 0
+
+    def poll_batch(self, batch: Tuple[str, ...] | None) -> List[NewsItem]:
+        """
+        Fetch one batch's updates into the store; returns the stories that
+        were new or revised.
+        """
+        benzinga = self.clients.benzinga
+        since = self.cursors.get(batch)
+        if since is None:
+            since = int(self.clock() - self.lookback)
+        changed: List[NewsItem] = []
+        newest = since
+        for page in range(self.max_pages):
+            items = benzinga.get_news_updates(
+                batch, updated_since=since, page=page, page_size=self.page_size
+            )
+            self.requests += 1
+            for item in items:
+                newest = max(newest, int(_timestamp(item.get("updated") or item.get("created"))))
+                if self.store.upsert(item):
+                    changed.append(item)
+            if len(items) < self.page_size:
+                break
+        else:
+            logger.warning("News batch %s still had more pages after %d", batch, self.max_pages)
+        self.cursors[batch] = newest
+        return changed
+
+    def poll(self) -> List[NewsItem]:
+        """
+        Poll every batch once. A failing batch keeps its cursor and is
+        retried on the next poll.
+        """
+        changed: List[NewsItem] = []
+        for batch in self.batches:
+            try:
+                changed.extend(self.poll_batch(batch))
+            except Exception as exc:  # noqa: BLE001 - keep the other batches fresh
+                logger.warning("News poll failed for %s: %s", batch, exc)
+        if self.events is not None and changed:
+            self.events.publish_many(
+                Topic.NEWS, ((ticker, item) for item in changed for ticker in news_tickers(item))
+            )
+        return changed
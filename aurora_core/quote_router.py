@@ -0,0 +1,227 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, List, Sequence
+
+from aurora_core.api_manager import AuroraClients
+from aurora_core.logging_utils import get_logger
+from aurora_core.snapshot_models import (
+    Quote,
+    quote_from_alpha_vantage,
+    quote_from_finnhub,
+    quote_from_iex,
+    quote_from_polygon,
+)
+
+
+logger = get_logger(__name__)
+
+QuoteFetcher = Callable[[AuroraClients, str], Quote]
+
+QUOTE_PROVIDERS: Dict[str, QuoteFetcher] = {
+    "iex": lambda clients, symbol: quote_from_iex(clients.iex.get_quote(symbol)),
+    "finnhub": lambda clients, symbol: quote_from_finnhub(
+        symbol, clients.finnhub.get_quote(symbol)
+    ),
+    "polygon": lambda clients, symbol: quote_from_polygon(
+        clients.polygon.get_last_trade(symbol)
+    ),
+    "alpha_vantage": lambda clients, symbol: quote_from_alpha_vantage(
+        clients.alpha_vantage.get_quote(symbol)
+    ),
+}
+
+
+class QuoteUnavailable(RuntimeError):
+    def __init__(self, symbol: str, errors: Dict[str, str]) -> None:
+        detail = "; ".join(f"{p}: {e}" for p, e in errors.items()) or "no providers"
+        super().__init__(f"No quote for {symbol}: {detail}")
+        self.symbol = symbol
+        self.errors = errors
+
+
+def _quantile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return math.nan
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+class ProviderProfile:
+    """
+    Rolling latency/error record for one provider over its last `window`
+    calls. Latencies are kept for successful calls only.
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.wins = 0
+        self.hedged = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.outcomes.append(ok)
+            if ok:
+                self.latencies.append(latency)
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            values = sorted(self.latencies)
+        return _quantile(values, q)
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self.outcomes:
+                return 0.0
+            return 1.0 - sum(self.outcomes) / len(self.outcomes)
+
+    @property
+    def samples(self) -> int:
+        return len(self.latencies)
+
+
+class QuoteRouter:
+    """
+    Fetch quotes from whichever provider answers first with a valid price.
+
+    Providers are ranked by expected latency (rolling p50, inflated by the
+    recent error rate). The best one is asked first; if it has not
+    answered by its own p95 a hedge goes to the next one, and so on up to
+    `max_in_flight` concurrent requests. A failure or invalid answer
+    immediately fails over to the next provider. The first valid quote
+    wins; slower requests are left to finish in the background and still
+    feed their provider's profile.
+
+    Until a provider has `min_samples` successes, `default_hedge_delay`
+    stands in for its p95.
+    """
+
+    def __init__(
+        self,
+        clients: AuroraClients,
+        providers: Iterable[str] = ("iex", "finnhub", "polygon", "alpha_vantage"),
+        fetchers: Dict[str, QuoteFetcher] | None = None,
+        timeout: float = 5.0,
+        max_in_flight: int = 2,
+        default_hedge_delay: float = 0.5,
+        min_samples: int = 20,
+        window: int = 256,
+        max_workers: int = 16,
+    ) -> None:
+        fetchers = fetchers or QUOTE_PROVIDERS
+        self.clients = clients
+        self.providers: List[str] = list(providers)
+        unknown = [p for p in self.providers if p not in fetchers]
+        if unknown:
+            raise ValueError(f"Unknown quote providers: {unknown}")
+        self.fetchers = {p: fetchers[p] for p in self.providers}
+        self.timeout = timeout
+        self.max_in_flight = max(1, max_in_flight)
+        self.default_hedge_delay = default_hedge_delay
+        self.min_samples = min_samples
+        self.profiles = {p: ProviderProfile(window) for p in self.providers}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="aurora-quotes"
+        )
+
+    def hedge_delay(self, provider: str) -> float:
+        profile = self.profiles[provider]
+        if profile.samples < self.min_samples:
+            return self.default_hedge_delay
+        return profile.quantile(0.95)
+
+    def ranked(self) -> List[str]:
+        def expected(provider: str) -> float:
+            profile = self.profiles[provider]
+            base = profile.quantile(0.5) if profile.samples else self.default_hedge_delay
+            return base * (1.0 + 4.0 * profile.error_rate)
+
+        # sorted() is stable, so configuration order breaks ties.
+        return sorted(self.providers, key=expected)
+
+    @staticmethod
+    def _valid(quote: Quote | None) -> bool:
+        return (
+            quote is not None
+            and not math.isnan(quote.price)
+            and not math.isinf(quote.price)
+            and quote.price > 0
+        )
+
+    def _call(self, provider: str, symbol: str) -> Quote:
+        start = time.monotonic()
+        ok = False
+        try:
+            quote = self.fetchers[provider](self.clients, symbol)
+            ok = self._valid(quote)
+            if not ok:
+                raise ValueError("no valid price in response")
+            return quote
+        finally:
+            self.profiles[provider].record(time.monotonic() - start, ok)
+
+    def get_quote(self, symbol: str, timeout: float | None = None) -> Quote:
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        queue = deque(self.ranked())
+        in_flight: Dict[Future, str] = {}
+        errors: Dict[str, str] = {}
+        hedge_at = math.inf
+
+        def launch(hedge: bool) -> None:
+            nonlocal hedge_at
+            provider = queue.popleft()
+            if hedge:
+                self.profiles[provider].hedged += 1
+            in_flight[self._executor.submit(self._call, provider, symbol)] = provider
+            hedge_at = time.monotonic() + self.hedge_delay(provider)
+
+        launch(hedge=False)
+        while in_flight:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if queue and len(in_flight) < self.max_in_flight and now >= hedge_at:
+                launch(hedge=True)
+                continue
+            wake = deadline
+            if queue and len(in_flight) < self.max_in_flight:
+                wake = min(wake, hedge_at)
+            done, _ = wait(list(in_flight), timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED)
+            for fut in done:
+                provider = in_flight.pop(fut)
+                try:
+                    quote = fut.result()
+                except Exception as exc:  # noqa: BLE001 - recorded, then fail over
+                    errors[provider] = f"{type(exc).__name__}: {exc}"
+                    if queue and len(in_flight) < self.max_in_flight:
+                        launch(hedge=False)
+                    continue
+                self.profiles[provider].wins += 1
+                return quote
+
+        for provider in in_flight.values():
+            errors[provider] = "timeout"
+        logger.warning("Quote for %s failed on every provider: %s", symbol, errors)
+        raise QuoteUnavailable(symbol, errors)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for provider, profile in self.profiles.items():
+            out[provider] = {
+                "samples": profile.samples,
+                "p50": profile.quantile(0.5),
+                "p95": profile.quantile(0.95),
+                "p99": profile.quantile(0.99),
+                "error_rate": profile.error_rate,
+                "wins": profile.wins,
+                "hedged": profile.hedged,
+            }
+        return out
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,384 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple, TypeVar
+from urllib import parse
+
+from aurora_apis import async_http_client, http_client
+from aurora_core.config import APIConfig, load_api_config
+from aurora_core.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """
+    Lower values are served first when several requests wait on a provider.
+    """
+
+    LIVE = 0
+    NORMAL = 1
+    BACKFILL = 2
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    requests: float
+    per_seconds: float
+    burst: float | None = None
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.per_seconds
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self.requests)
+
+
+# Documented free-tier / fair-access quotas; override via AURORA_RATE_LIMITS.
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    "alpha_vantage": RateLimit(5, 60, burst=1),
+    "finnhub": RateLimit(60, 60, burst=30),
+    "sec_edgar": RateLimit(10, 1),
+    "reddit": RateLimit(100, 60, burst=10),
+}
+
+# Hostname -> provider key used for rate limiting.
+PROVIDER_HOSTS: Dict[str, str] = {
+    "www.alphavantage.co": "alpha_vantage",
+    "api.benzinga.com": "benzinga",
+    "finnhub.io": "finnhub",
+    "api.polygon.io": "polygon",
+    "data.sec.gov": "sec_edgar",
+    "www.sec.gov": "sec_edgar",
+    "api.stlouisfed.org": "fred",
+    "www.reddit.com": "reddit",
+    "oauth.reddit.com": "reddit",
+    "api.stocktwits.com": "stocktwits",
+    "cloud.iexapis.com": "iex",
+    "api.tradingeconomics.com": "tradingeconomics",
+}
+
+_UNITS = {"s": 1.0, "sec": 1.0, "m": 60.0, "min": 60.0, "h": 3600.0, "hour": 3600.0}
+
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "aurora_request_priority", default=Priority.NORMAL
+)
+# time.monotonic() after which the caller no longer wants the result.
+_current_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "aurora_request_deadline", default=None
+)
+
+
+def parse_rate_limits(spec: str | None) -> Dict[str, RateLimit]:
+    """
+    Parse a spec such as "sec_edgar=10/s, alpha_vantage=75/min, finnhub=30/s:60"
+    into rate limits. The optional ":N" suffix sets the burst size.
+    """
+    limits: Dict[str, RateLimit] = {}
+    if not spec:
+        return limits
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            provider, rule = item.split("=", 1)
+            rule, _, burst = rule.partition(":")
+            count, _, unit = rule.partition("/")
+            per_seconds = _UNITS[unit.strip().lower() or "s"]
+            limits[provider.strip()] = RateLimit(
+                float(count),
+                per_seconds,
+                burst=float(burst) if burst else None,
+            )
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid rate limit entry: {item!r}")
+    return limits
+
+
+def _wait_deadline(start: float, timeout: float | None) -> float | None:
+    deadline = _current_deadline.get()
+    if timeout is not None and (deadline is None or start + timeout < deadline):
+        return start + timeout
+    return deadline
+
+
+def _caller_gave_up(now: float) -> bool:
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline <= now
+
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at `rate` tokens/second up to `capacity`.
+    Not thread-safe on its own; `RequestScheduler` guards it.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, now: float | None = None) -> bool:
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def time_until_token(self, now: float | None = None) -> float:
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+@dataclass
+class _ProviderState:
+    bucket: TokenBucket
+    cond: threading.Condition = field(default_factory=threading.Condition)
+    waiters: List[Tuple[int, int]] = field(default_factory=list)
+    granted: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+
+class RequestScheduler:
+    """
+    Central per-provider rate limiter.
+
+    Each provider has a token bucket. Callers that find it empty queue up
+    and are released in priority order (`Priority.LIVE` before
+    `Priority.BACKFILL`, FIFO within a priority), one per token, so the
+    provider is driven at - but never above - its configured rate.
+    Providers without a limit are not throttled.
+
+    `install()` hooks the scheduler into `http_get`/`http_post` and their
+    async counterparts, so every client call is gated by the provider of
+    the URL's host. Use `priority(...)` to tag the calls in a block and
+    `deadline(...)` to drop them from the queue once their caller has
+    given up.
+    """
+
+    def __init__(self, limits: Mapping[str, RateLimit] | None = None) -> None:
+        self._providers: Dict[str, _ProviderState] = {}
+        self._seq = itertools.count()
+        for provider, limit in (limits or {}).items():
+            self.set_limit(provider, limit)
+
+    @classmethod
+    def from_config(cls, config: APIConfig | None = None) -> "RequestScheduler":
+        if config is None:
+            config = load_api_config()
+        limits = dict(DEFAULT_RATE_LIMITS)
+        limits.update(parse_rate_limits(config.rate_limits))
+        return cls(limits)
+
+    def set_limit(self, provider: str, limit: RateLimit) -> None:
+        self._providers[provider] = _ProviderState(TokenBucket(limit.rate, limit.capacity))
+
+    def _enqueue(self, state: _ProviderState, priority: Priority) -> Tuple[int, int]:
+        ticket = (int(priority), next(self._seq))
+        heapq.heappush(state.waiters, ticket)
+        return ticket
+
+    def _try_grant(
+        self, state: _ProviderState, ticket: Tuple[int, int], enqueued: float
+    ) -> float:
+        """
+        Grant `ticket` if it is first in line and a token is available.
+        Returns 0.0 on success, otherwise the suggested delay before retrying.
+        Must be called with `state.cond` held.
+        """
+        now = time.monotonic()
+        if state.waiters[0] != ticket:
+            return max(state.bucket.time_until_token(now), 0.001)
+        if not state.bucket.try_take(now):
+            return state.bucket.time_until_token(now)
+        heapq.heappop(state.waiters)
+        waited = now - enqueued
+        state.granted += 1
+        state.wait_total += waited
+        state.wait_max = max(state.wait_max, waited)
+        state.cond.notify_all()
+        return 0.0
+
+    def _abandon(self, state: _ProviderState, ticket: Tuple[int, int]) -> None:
+        state.waiters.remove(ticket)
+        heapq.heapify(state.waiters)
+        state.cond.notify_all()
+
+    def acquire(
+        self,
+        provider: str,
+        priority: Priority | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Block until `provider` may be called. Raises TimeoutError if no
+        token was granted within `timeout` seconds or by the `deadline(...)`
+        in effect, whichever comes first.
+        """
+        state = self._providers.get(provider)
+        if state is None:
+            return
+        if priority is None:
+            priority = _current_priority.get()
+
+        start = time.monotonic()
+        deadline = _wait_deadline(start, timeout)
+        if _caller_gave_up(start):
+            raise TimeoutError(f"Rate limit wait for {provider} timed out")
+        with state.cond:
+            ticket = self._enqueue(state, priority)
+            while True:
+                delay = self._try_grant(state, ticket, start)
+                if delay == 0.0:
+                    return
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._abandon(state, ticket)
+                        raise TimeoutError(f"Rate limit wait for {provider} timed out")
+                    delay = min(delay, remaining)
+                state.cond.wait(delay)
+
+    async def acquire_async(self, provider: str, priority: Priority | None = None) -> None:
+        """
+        Coroutine counterpart of `acquire`; waits without blocking the loop.
+        """
+        state = self._providers.get(provider)
+        if state is None:
+            return
+        if priority is None:
+            priority = _current_priority.get()
+
+        start = time.monotonic()
+        deadline = _wait_deadline(start, None)
+        if _caller_gave_up(start):
+            raise TimeoutError(f"Rate limit wait for {provider} timed out")
+        with state.cond:
+            ticket = self._enqueue(state, priority)
+        try:
+            while True:
+                with state.cond:
+                    delay = self._try_grant(state, ticket, start)
+                if delay == 0.0:
+                    return
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Rate limit wait for {provider} timed out")
+                    delay = min(delay, remaining)
+                await asyncio.sleep(delay)
+        except BaseException:
+            with state.cond:
+                if ticket in state.waiters:
+                    self._abandon(state, ticket)
+            raise
+
+    def call(
+        self,
+        provider: str,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: Priority | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Acquire a token for `provider`, then run `fn(*args, **kwargs)`.
+        """
+        self.acquire(provider, priority=priority)
+        return fn(*args, **kwargs)
+
+    def provider_for_url(self, url: str) -> str | None:
+        return PROVIDER_HOSTS.get(parse.urlsplit(url).hostname or "")
+
+    def _gate(self, url: str) -> None:
+        provider = self.provider_for_url(url)
+        if provider is not None:
+            self.acquire(provider)
+
+    async def _gate_async(self, url: str) -> None:
+        provider = self.provider_for_url(url)
+        if provider is not None:
+            await self.acquire_async(provider)
+
+    def install(self) -> None:
+        """
+        Route every `aurora_apis` HTTP request through this scheduler.
+        """
+        http_client.set_request_gate(self._gate)
+        async_http_client.set_async_request_gate(self._gate_async)
+        logger.info("Request scheduler installed for %s", ", ".join(sorted(self._providers)))
+
+    def uninstall(self) -> None:
+        http_client.set_request_gate(None)
+        async_http_client.set_async_request_gate(None)
+
+    def queue_depth(self, provider: str) -> int:
+        state = self._providers.get(provider)
+        if state is None:
+            return 0
+        with state.cond:
+            return len(state.waiters)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-provider queue depth, grants and wait times (seconds).
+        """
+        out: Dict[str, Dict[str, float]] = {}
+        for provider, state in self._providers.items():
+            with state.cond:
+                out[provider] = {
+                    "rate_per_second": state.bucket.rate,
+                    "queue_depth": len(state.waiters),
+                    "granted": state.granted,
+                    "wait_total": state.wait_total,
+                    "wait_avg": state.wait_total / state.granted if state.granted else 0.0,
+                    "wait_max": state.wait_max,
+                }
+        return out
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """
+    Tag every scheduled request made inside the block with `level`.
+    """
+    token = _current_priority.set(level)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@contextmanager
+def deadline(at: float) -> Iterator[None]:
+    """
+    Give up waiting on the rate limiter at `time.monotonic()` value `at`
+    for every scheduled request made inside the block.
+    """
+    token = _current_deadline.set(at)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,398 @@
+import json
+import struct
+import threading
+from dataclasses import asdict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+from aurora_core.data_fusion_bus import DataFusionBus, TickerSnapshot
+from aurora_core.event_bus import Event, Subscription, Topic
+from aurora_core.logging_utils import get_logger
+from aurora_apis.market_stream import Tick
+
+
+logger = get_logger(__name__)
+
+_MAGIC = b"ARNG"
+_VERSION = 1
+# magic, version, reserved, slot size, capacity, last written seq
+_HEADER = struct.Struct("<4sHHIIQ")
+_HEADER_SIZE = 64
+_SEQ_OFFSET = 16
+_SEQ = struct.Struct("<Q")
+# per-slot: seq (0 while being written), payload length
+_SLOT_HEADER = struct.Struct("<QI4x")
+
+# symbol, source, kind, exchange timestamp, price, size, bid, ask, bid size, ask size
+_QUOTE = struct.Struct("<16s8sB7x7d")
+_KINDS = {"trade": 0, "quote": 1, "merged": 2}
+_KIND_NAMES = {v: k for k, v in _KINDS.items()}
+_NAN = float("nan")
+
+
+class QuoteRecord(NamedTuple):
+    seq: int
+    symbol: str
+    source: str
+    kind: str
+    timestamp: float
+    price: float
+    size: float
+    bid: float
+    ask: float
+    bid_size: float
+    ask_size: float
+
+
+_ATTACH_LOCK = threading.Lock()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without registering it with the resource
+    tracker, which would otherwise unlink it when this process (or its
+    tracker) exits. Only the creator owns the segment.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        pass
+    # Python < 3.13 always registers; suppress it for the duration of the open.
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class ShmRing:
+    """
+    Single-writer, multi-reader ring of fixed-size slots in
+    `multiprocessing.shared_memory`.
+
+    Every record gets a sequence number (1, 2, ...) stored in its slot and
+    in the header. A slot's seq is zeroed while it is rewritten, so readers
+    validate a record by checking the slot seq before and after reading it
+    (a seqlock): a mismatch means the writer lapped them. Readers never
+    lock and never slow the writer down; they learn about overruns instead.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.shm = shm
+        self.owner = owner
+        magic, version, _, self.slot_size, self.capacity, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Shared memory {shm.name!r} is not an Aurora ring")
+        self.payload_size = self.slot_size - _SLOT_HEADER.size
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @classmethod
+    def create(cls, name: str | None, capacity: int, payload_size: int) -> "ShmRing":
+        if capacity < 2 or payload_size < 1:
+            raise ValueError("capacity must be >= 2 and payload_size >= 1")
+        # Keep slots 8-byte aligned so the float fields stay aligned.
+        slot_size = -(-(payload_size + _SLOT_HEADER.size) // 8) * 8
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER_SIZE + capacity * slot_size
+        )
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, 0, slot_size, capacity, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "ShmRing":
+        return cls(_attach(name), owner=False)
+
+    def last_seq(self) -> int:
+        return _SEQ.unpack_from(self.shm.buf, _SEQ_OFFSET)[0]
+
+    def _slot(self, seq: int) -> int:
+        return _HEADER_SIZE + ((seq - 1) % self.capacity) * self.slot_size
+
+    def write(self, payload: bytes) -> int:
+        """
+        Append `payload` and return its sequence number (writer only).
+        """
+        if len(payload) > self.payload_size:
+            raise ValueError(
+                f"Record of {len(payload)} bytes exceeds slot payload size {self.payload_size}"
+            )
+        buf = self.shm.buf
+        seq = self.last_seq() + 1
+        off = self._slot(seq)
+        _SEQ.pack_into(buf, off, 0)
+        start = off + _SLOT_HEADER.size
+        buf[start:start + len(payload)] = payload
+        _SLOT_HEADER.pack_into(buf, off, seq, len(payload))
+        _SEQ.pack_into(buf, _SEQ_OFFSET, seq)
+        return seq
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class RingReader:
+    """
+    Cursor over a `ShmRing`. Starts at the newest record unless
+    `from_start`; `lost` counts records overwritten before they were read.
+    """
+
+    def __init__(self, ring: ShmRing, from_start: bool = False) -> None:
+        self.ring = ring
+        last = ring.last_seq()
+        self.next_seq = max(1, last - ring.capacity + 1) if from_start else last + 1
+        self.lost = 0
+        self.overruns = 0
+
+    def _skip_to(self, seq: int) -> None:
+        self.lost += seq - self.next_seq
+        self.overruns += 1
+        self.next_seq = seq
+
+    def _read(self, decode: Any, max_items: int) -> List[Any]:
+        ring = self.ring
+        buf = ring.shm.buf
+        out: List[Any] = []
+        while len(out) < max_items:
+            last = ring.last_seq()
+            if self.next_seq > last:
+                break
+            oldest = last - ring.capacity + 1
+            if self.next_seq < oldest:
+                # Leave one slot of slack for the record being written now.
+                self._skip_to(oldest + 1)
+                continue
+            seq = self.next_seq
+            off = ring._slot(seq)
+            before, length = _SLOT_HEADER.unpack_from(buf, off)
+            if before != seq:
+                if before > seq or before == 0:
+                    self._skip_to(seq + 1)
+                    continue
+                break
+            value = decode(buf, off + _SLOT_HEADER.size, length, seq)
+            if _SEQ.unpack_from(buf, off)[0] != seq:
+                self._skip_to(seq + 1)
+                continue
+            out.append(value)
+            self.next_seq = seq + 1
+        return out
+
+    def read(self, max_items: int = 1024) -> List[Tuple[int, bytes]]:
+        return self._read(
+            lambda buf, start, length, seq: (seq, bytes(buf[start:start + length])),
+            max_items,
+        )
+
+
+def _opt(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _text(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("ascii", "replace")
+
+
+class TickRing:
+    """
+    Fixed-layout quote/trade records (`QuoteRecord`) in a `ShmRing`.
+
+    One ingest process creates the ring and writes; analytics processes
+    `attach` by name and `poll`. Records are decoded with `unpack_from`
+    straight out of the shared mapping, with no intermediate copies.
+    """
+
+    def __init__(self, ring: ShmRing) -> None:
+        self.ring = ring
+
+    @classmethod
+    def create(cls, name: str | None = None, capacity: int = 1 << 16) -> "TickRing":
+        return cls(ShmRing.create(name, capacity, _QUOTE.size))
+
+    @classmethod
+    def attach(cls, name: str) -> "TickRing":
+        return cls(ShmRing.attach(name))
+
+    @property
+    def name(self) -> str:
+        return self.ring.name
+
+    def _write(self, symbol: str, source: str, kind: str, values: Iterable[Any]) -> int:
+        record = _QUOTE.pack(
+            symbol.encode("ascii")[:16],
+            source.encode("ascii")[:8],
+            _KINDS[kind],
+            *(_opt(v) for v in values),
+        )
+        return self.ring.write(record)
+
+    def write_tick(self, tick: Tick) -> int:
+        return self._write(
+            tick.symbol,
+            tick.source,
+            tick.kind,
+            (
+                tick.timestamp,
+                tick.price,
+                tick.size,
+                tick.bid,
+                tick.ask,
+                tick.bid_size,
+                tick.ask_size,
+            ),
+        )
+
+    def write_quote(self, symbol: str, quote: Mapping[str, Any]) -> int:
+        """
+        Write a merged live quote (as kept by `DataFusionBus`).
+        """
+        timestamp = max(quote.get("trade_time") or 0.0, quote.get("quote_time") or 0.0)
+        return self._write(
+            symbol,
+            str(quote.get("source") or ""),
+            "merged",
+            (
+                timestamp,
+                quote.get("price"),
+                quote.get("size"),
+                quote.get("bid"),
+                quote.get("ask"),
+                quote.get("bid_size"),
+                quote.get("ask_size"),
+            ),
+        )
+
+    def reader(self, from_start: bool = False) -> "TickRingReader":
+        return TickRingReader(self.ring, from_start)
+
+    def close(self) -> None:
+        self.ring.close()
+
+
+class TickRingReader(RingReader):
+    def __init__(self, ring: ShmRing, from_start: bool = False) -> None:
+        super().__init__(ring, from_start)
+        self.latest: Dict[str, QuoteRecord] = {}
+
+    @staticmethod
+    def _decode(buf: memoryview, start: int, length: int, seq: int) -> QuoteRecord:
+        symbol, source, kind, *values = _QUOTE.unpack_from(buf, start)
+        return QuoteRecord(seq, _text(symbol), _text(source), _KIND_NAMES[kind], *values)
+
+    def poll(self, max_items: int = 1024) -> List[QuoteRecord]:
+        """
+        New records since the last poll; also updates `latest` per symbol.
+        """
+        records = self._read(self._decode, max_items)
+        for record in records:
+            self.latest[record.symbol] = record
+        return records
+
+
+class SnapshotRing:
+    """
+    `TickerSnapshot`s as JSON records in a `ShmRing` with large slots.
+
+    Fundamentals are left out by default: company facts are megabytes per
+    filer and are already shared between processes by the SEC disk cache
+    (`SEC_EDGAR_CACHE_DIR`).
+    """
+
+    def __init__(self, ring: ShmRing, exclude: Iterable[str] = ("fundamentals",)) -> None:
+        self.ring = ring
+        self.exclude = tuple(exclude)
+
+    @classmethod
+    def create(
+        cls,
+        name: str | None = None,
+        capacity: int = 1024,
+        slot_size: int = 64 << 10,
+        exclude: Iterable[str] = ("fundamentals",),
+    ) -> "SnapshotRing":
+        return cls(ShmRing.create(name, capacity, slot_size), exclude)
+
+    @classmethod
+    def attach(cls, name: str) -> "SnapshotRing":
+        return cls(ShmRing.attach(name))
+
+    @property
+    def name(self) -> str:
+        return self.ring.name
+
+    def write_snapshot(self, snapshot: TickerSnapshot) -> int:
+        data = asdict(snapshot)
+        for name in self.exclude:
+            data.pop(name, None)
+        return self.ring.write(json.dumps(data, separators=(",", ":")).encode())
+
+    def reader(self, from_start: bool = False) -> "SnapshotRingReader":
+        return SnapshotRingReader(self.ring, from_start)
+
+    def close(self) -> None:
+        self.ring.close()
+
+
+class SnapshotRingReader(RingReader):
+    def poll(self, max_items: int = 256) -> List[Dict[str, Any]]:
+        return [json.loads(payload) for _, payload in self.read(max_items)]
+
+
+class ShmPublisher:
+    """
+    Ingest-side glue: mirrors `DataFusionBus` live quotes into a
+    `TickRing` and writes snapshots into a `SnapshotRing`, so upstream
+    calls are made once per box rather than once per process.
+    """
+
+    def __init__(
+        self,
+        bus: DataFusionBus,
+        ticks: TickRing,
+        snapshots: SnapshotRing | None = None,
+    ) -> None:
+        self.bus = bus
+        self.ticks = ticks
+        self.snapshots = snapshots
+        self._sub: Subscription | None = None
+
+    def _on_quotes(self, batch: List[Event]) -> None:
+        for event in batch:
+            self.ticks.write_quote(event.key or "", event.payload)
+
+    def start(self) -> None:
+        if self._sub is None:
+            # A single handler thread keeps the ring single-writer.
+            self._sub = self.bus.events.subscribe_handler(
+                Topic.QUOTES, self._on_quotes, maxsize=1 << 16
+            )
+
+    def publish_snapshots(self, symbols: Iterable[str]) -> int:
+        if self.snapshots is None:
+            raise RuntimeError("ShmPublisher has no SnapshotRing")
+        symbols = list(symbols)
+        snaps = (
+            self.bus.snapshot_many(symbols)
+            if self.bus.concurrent
+            else (self.bus.snapshot(s) for s in symbols)
+        )
+        count = 0
+        for snap in snaps:
+            try:
+                self.snapshots.write_snapshot(snap)
+                count += 1
+            except ValueError as exc:
+                logger.warning("Snapshot for %s not published: %s", snap.symbol, exc)
+        return count
+
+    def stop(self) -> None:
+        if self._sub is not None:
+            self.bus.events.unsubscribe(self._sub)
+            self._sub = None
+
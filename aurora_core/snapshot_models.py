@@ -0,0 +1,462 @@
+import math
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from aurora_core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from aurora_core.data_fusion_bus import TickerSnapshot
+
+
+logger = get_logger(__name__)
+
+_NAN = float("nan")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _num(value: Any) -> float:
+    """
+    Parse provider numbers ("1,234.5", "0.53%", None, "None") to float/NaN.
+    """
+    if value is None:
+        return _NAN
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().rstrip("%").replace(",", "")
+    try:
+        return float(text)
+    except ValueError:
+        return _NAN
+
+
+def _epoch_day(value: str | None) -> int:
+    if not value:
+        return 0
+    return date.fromisoformat(value[:10]).toordinal() - _EPOCH_ORDINAL
+
+
+def _epoch_seconds(value: Any) -> float:
+    """
+    Accept epoch seconds/ms/ns, ISO-8601 or RFC 2822 timestamps.
+    """
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, (int, float)):
+        v = float(value)
+        if v > 1e17:
+            return v / 1e9
+        if v > 1e11:
+            return v / 1e3
+        return v
+    text = str(value)
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+@dataclass(slots=True)
+class Quote:
+    """
+    Provider-neutral quote. Prices are floats (NaN when unknown) and
+    `timestamp` is epoch seconds of the last update.
+    """
+
+    symbol: str
+    source: str
+    price: float = _NAN
+    open: float = _NAN
+    high: float = _NAN
+    low: float = _NAN
+    prev_close: float = _NAN
+    volume: float = _NAN
+    bid: float = _NAN
+    ask: float = _NAN
+    timestamp: float = 0.0
+
+    @property
+    def change(self) -> float:
+        return self.price - self.prev_close
+
+    @property
+    def change_pct(self) -> float:
+        if not self.prev_close or math.isnan(self.prev_close):
+            return _NAN
+        return (self.price / self.prev_close - 1.0) * 100.0
+
+
+@dataclass(slots=True)
+class NewsItem:
+    id: int
+    title: str
+    url: str
+    published: float
+    tickers: Tuple[str, ...] = ()
+    source: str = ""
+
+
+@dataclass(slots=True)
+class Fundamentals:
+    """
+    Latest reported values of a few headline us-gaap concepts; revenue,
+    net income and EPS are fiscal-year totals. `as_of` is the period end
+    (epoch days) of the newest one.
+    """
+
+    cik: int
+    entity_name: str = ""
+    as_of: int = 0
+    revenue: float = _NAN
+    net_income: float = _NAN
+    eps_diluted: float = _NAN
+    total_assets: float = _NAN
+    total_liabilities: float = _NAN
+    shares_outstanding: float = _NAN
+
+
+@dataclass(slots=True)
+class CompactSnapshot:
+    symbol: str
+    quote: Quote | None = None
+    news: Tuple[NewsItem, ...] = ()
+    fundamentals: Fundamentals | None = None
+    missing: Tuple[str, ...] = ()
+    stale: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: "TickerSnapshot") -> "CompactSnapshot":
+        return cls(
+            symbol=snapshot.symbol,
+            quote=quote_from_payload(snapshot.symbol, snapshot.quote),
+            news=tuple(news_from_benzinga(snapshot.news or [])),
+            fundamentals=(
+                fundamentals_from_sec(snapshot.fundamentals) if snapshot.fundamentals else None
+            ),
+            missing=tuple(snapshot.missing),
+            stale=tuple(snapshot.stale),
+        )
+
+    def to_bytes(self) -> bytes:
+        return encode_snapshot(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "CompactSnapshot":
+        return decode_snapshot(data)
+
+
+# Provider adapters.
+
+
+def quote_from_alpha_vantage(payload: Mapping[str, Any]) -> Quote:
+    payload = payload.get("Global Quote", payload)
+    return Quote(
+        symbol=payload.get("01. symbol", ""),
+        source="alpha_vantage",
+        open=_num(payload.get("02. open")),
+        high=_num(payload.get("03. high")),
+        low=_num(payload.get("04. low")),
+        price=_num(payload.get("05. price")),
+        volume=_num(payload.get("06. volume")),
+        prev_close=_num(payload.get("08. previous close")),
+        timestamp=_epoch_seconds(payload.get("07. latest trading day")),
+    )
+
+
+def quote_from_finnhub(symbol: str, payload: Mapping[str, Any]) -> Quote:
+    return Quote(
+        symbol=symbol,
+        source="finnhub",
+        price=_num(payload.get("c")),
+        open=_num(payload.get("o")),
+        high=_num(payload.get("h")),
+        low=_num(payload.get("l")),
+        prev_close=_num(payload.get("pc")),
+        timestamp=_epoch_seconds(payload.get("t")),
+    )
+
+
+def quote_from_iex(payload: Mapping[str, Any]) -> Quote:
+    return Quote(
+        symbol=payload.get("symbol", ""),
+        source="iex",
+        price=_num(payload.get("latestPrice")),
+        open=_num(payload.get("open")),
+        high=_num(payload.get("high")),
+        low=_num(payload.get("low")),
+        prev_close=_num(payload.get("previousClose")),
+        volume=_num(payload.get("volume") or payload.get("latestVolume")),
+        bid=_num(payload.get("iexBidPrice") or None),
+        ask=_num(payload.get("iexAskPrice") or None),
+        timestamp=_epoch_seconds(payload.get("latestUpdate")),
+    )
+
+
+def quote_from_polygon(payload: Mapping[str, Any]) -> Quote:
+    """
+    From a `/v2/last/trade` response.
+    """
+    result = payload.get("results", payload)
+    return Quote(
+        symbol=result.get("T", ""),
+        source="polygon",
+        price=_num(result.get("p")),
+        volume=_num(result.get("s")),
+        timestamp=_epoch_seconds(result.get("t")),
+    )
+
+
+def quote_from_live(payload: Mapping[str, Any]) -> Quote:
+    """
+    From a merged streaming quote as kept by `DataFusionBus.live_quote`.
+    """
+    return Quote(
+        symbol=payload.get("symbol", ""),
+        source=payload.get("source", ""),
+        price=_num(payload.get("price")),
+        bid=_num(payload.get("bid")),
+        ask=_num(payload.get("ask")),
+        timestamp=max(payload.get("trade_time") or 0.0, payload.get("quote_time") or 0.0),
+    )
+
+
+def quote_from_payload(symbol: str, payload: Mapping[str, Any] | None) -> Quote | None:
+    """
+    Detect the provider from the payload shape and normalize it. Payloads
+    without a quote - e.g. Alpha Vantage's {"Note": ...} throttle reply -
+    give None.
+    """
+    if not payload:
+        return None
+    if "prev_close" in payload and "source" in payload:
+        quote = Quote(**payload)  # already normalized, e.g. by QuoteRouter
+    elif "Global Quote" in payload or "05. price" in payload:
+        quote = quote_from_alpha_vantage(payload)
+    elif "latestPrice" in payload:
+        quote = quote_from_iex(payload)
+    elif "pc" in payload and "c" in payload:
+        quote = quote_from_finnhub(symbol, payload)
+    elif "results" in payload:
+        quote = quote_from_polygon(payload)
+    elif "trade_time" in payload or "quote_time" in payload:
+        quote = quote_from_live(payload)
+    else:
+        logger.debug("No quote in payload for %s: %s", symbol, sorted(payload)[:5])
+        return None
+    quote.symbol = quote.symbol or symbol
+    return quote
+
+
+def news_from_benzinga(items: Iterable[Mapping[str, Any]]) -> List[NewsItem]:
+    return [
+        NewsItem(
+            id=int(item.get("id") or 0),
+            title=item.get("title") or "",
+            url=item.get("url") or "",
+            published=_epoch_seconds(item.get("created")),
+            tickers=tuple(s.get("name", "") for s in item.get("stocks") or []),
+            source="benzinga",
+        )
+        for item in items
+    ]
+
+
+# Fundamentals field -> (taxonomy, candidate concepts, unit).
+_SEC_CONCEPTS: Dict[str, Tuple[str, Tuple[str, ...], str]] = {
+    "revenue": (
+        "us-gaap",
+        ("Revenues", "RevenueFromContractWithCustomerExcludingAssessedTax", "SalesRevenueNet"),
+        "USD",
+    ),
+    "net_income": ("us-gaap", ("NetIncomeLoss",), "USD"),
+    "eps_diluted": ("us-gaap", ("EarningsPerShareDiluted",), "USD/shares"),
+    "total_assets": ("us-gaap", ("Assets",), "USD"),
+    "total_liabilities": ("us-gaap", ("Liabilities",), "USD"),
+    "shares_outstanding": ("dei", ("EntityCommonStockSharesOutstanding",), "shares"),
+}
+
+
+# Forms whose duration facts are fiscal-year totals.
+_ANNUAL_FORMS = frozenset({"10-K", "10-K/A", "10-KT", "20-F", "20-F/A", "40-F", "40-F/A"})
+
+
+def _is_annual(point: Mapping[str, Any]) -> bool:
+    """
+    Instant facts (no "start") always qualify; duration facts only if they
+    are a full fiscal year from an annual report, so flow values such as
+    revenue are never a mix of quarter, year-to-date and full-year figures.
+    """
+    start = point.get("start")
+    if not start:
+        return True
+    if point.get("form") not in _ANNUAL_FORMS or point.get("fp", "FY") != "FY":
+        return False
+    days = _epoch_day(point.get("end")) - _epoch_day(start)
+    return 350 <= days <= 380
+
+
+def _latest_fact(facts: Mapping[str, Any], taxonomy: str, concepts: Sequence[str], unit: str):
+    candidates = [
+        point
+        for concept in concepts
+        for point in facts.get(taxonomy, {}).get(concept, {}).get("units", {}).get(unit) or ()
+        if _is_annual(point)
+    ]
+    if not candidates:
+        return None
+    # Latest period end across all concepts (filers switch concepts, e.g.
+    # Revenues -> RevenueFromContract...); among restatements, the latest filing.
+    return max(candidates, key=lambda p: (p.get("end", ""), p.get("filed", "")))
+
+
+def fundamentals_from_sec(payload: Mapping[str, Any]) -> Fundamentals:
+    """
+    From an SEC companyfacts document.
+    """
+    facts = payload.get("facts") or {}
+    out = Fundamentals(cik=int(payload.get("cik") or 0), entity_name=payload.get("entityName") or "")
+    for name, (taxonomy, concepts, unit) in _SEC_CONCEPTS.items():
+        point = _latest_fact(facts, taxonomy, concepts, unit)
+        if point is None:
+            continue
+        setattr(out, name, _num(point.get("val")))
+        if taxonomy == "us-gaap":
+            out.as_of = max(out.as_of, _epoch_day(point.get("end")))
+    return out
+
+
+# Binary serialization.
+
+_MAGIC = 0xA5
+_VERSION = 2
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_SNAP_HEAD = struct.Struct("<BBB")  # magic, version, presence flags
+_QUOTE_NUMS = struct.Struct("<9d")
+_NEWS_NUMS = struct.Struct("<qd")
+_FUND_NUMS = struct.Struct("<qq6d")
+_HAS_QUOTE = 1
+_HAS_FUNDAMENTALS = 2
+# Snapshot field names as a bitmask for missing/stale.
+_FIELD_BITS = {"quote": 1, "news": 2, "fundamentals": 4}
+
+
+_MAX_U16 = 0xFFFF
+
+
+def _put_count(out: bytearray, n: int, what: str) -> None:
+    if n > _MAX_U16:
+        raise ValueError(f"Too many {what} to encode: {n} > {_MAX_U16}")
+    out += _U16.pack(n)
+
+
+def _put_str(out: bytearray, value: str) -> None:
+    raw = value.encode("utf-8")
+    _put_count(out, len(raw), "string bytes")
+    out += raw
+
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes | memoryview) -> None:
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt: struct.Struct) -> Tuple[Any, ...]:
+        values = fmt.unpack_from(self.data, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def string(self) -> str:
+        (n,) = self.unpack(_U16)
+        raw = bytes(self.data[self.pos:self.pos + n])
+        self.pos += n
+        return raw.decode("utf-8")
+
+
+def _mask(names: Iterable[str]) -> int:
+    return sum(_FIELD_BITS[n] for n in set(names) if n in _FIELD_BITS)
+
+
+def _unmask(mask: int) -> Tuple[str, ...]:
+    return tuple(n for n, bit in _FIELD_BITS.items() if mask & bit)
+
+
+def encode_snapshot(snap: CompactSnapshot) -> bytes:
+    """
+    Length-prefixed UTF-8 strings and little-endian fixed-width numbers;
+    a typical snapshot with ten headlines is ~1-2 KB. Strings over 64 KiB
+    and more than 65535 news items or tickers per item raise ValueError.
+    """
+    flags = (_HAS_QUOTE if snap.quote else 0) | (_HAS_FUNDAMENTALS if snap.fundamentals else 0)
+    out = bytearray(_SNAP_HEAD.pack(_MAGIC, _VERSION, flags))
+    _put_str(out, snap.symbol)
+    out += _U8.pack(_mask(snap.missing)) + _U8.pack(_mask(snap.stale))
+    if snap.quote is not None:
+        q = snap.quote
+        _put_str(out, q.source)
+        out += _QUOTE_NUMS.pack(
+            q.price, q.open, q.high, q.low, q.prev_close, q.volume, q.bid, q.ask, q.timestamp
+        )
+    _put_count(out, len(snap.news), "news items")
+    for item in snap.news:
+        out += _NEWS_NUMS.pack(item.id, item.published)
+        _put_str(out, item.title)
+        _put_str(out, item.url)
+        _put_str(out, item.source)
+        _put_count(out, len(item.tickers), "tickers")
+        for ticker in item.tickers:
+            _put_str(out, ticker)
+    if snap.fundamentals is not None:
+        f = snap.fundamentals
+        _put_str(out, f.entity_name)
+        out += _FUND_NUMS.pack(
+            f.cik,
+            f.as_of,
+            f.revenue,
+            f.net_income,
+            f.eps_diluted,
+            f.total_assets,
+            f.total_liabilities,
+            f.shares_outstanding,
+        )
+    return bytes(out)
+
+
+def decode_snapshot(data: bytes | memoryview) -> CompactSnapshot:
+    r = _Reader(data)
+    magic, version, flags = r.unpack(_SNAP_HEAD)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not an encoded CompactSnapshot")
+    symbol = r.string()
+    (missing,) = r.unpack(_U8)
+    (stale,) = r.unpack(_U8)
+    quote = None
+    if flags & _HAS_QUOTE:
+        source = r.string()
+        quote = Quote(symbol, source, *r.unpack(_QUOTE_NUMS))
+    (n_news,) = r.unpack(_U16)
+    news = []
+    for _ in range(n_news):
+        item_id, published = r.unpack(_NEWS_NUMS)
+        title, url, source = r.string(), r.string(), r.string()
+        (n_tickers,) = r.unpack(_U16)
+        tickers = tuple(r.string() for _ in range(n_tickers))
+        news.append(NewsItem(item_id, title, url, published, tickers, source))
+    fundamentals = None
+    if flags & _HAS_FUNDAMENTALS:
+        entity = r.string()
+        cik, as_of, *values = r.unpack(_FUND_NUMS)
+        fundamentals = Fundamentals(cik, entity, as_of, *values)
+    return CompactSnapshot(
+        symbol, quote, tuple(news), fundamentals, _unmask(missing), _unmask(stale)
+    )
@@ -0,0 +1,434 @@
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Tuple
+
+from aurora_core.api_manager import AuroraClients
+from aurora_core.event_bus import EventBus, Topic
+from aurora_core.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+TickerExtractor = Callable[[str], Iterable[str]]
+
+_CASHTAG = re.compile(r"\$([A-Za-z]{1,5}(?:[.-][A-Za-z])?)\b")
+
+
+def extract_cashtags(text: str) -> List[str]:
+    """
+    Tickers written as cashtags ("$AAPL", "$brk.b"), upper-cased, in order
+    of first appearance.
+    """
+    return list(dict.fromkeys(m.upper() for m in _CASHTAG.findall(text)))
+
+
+@dataclass(frozen=True)
+class SocialMention:
+    source: str
+    id: str
+    symbols: Tuple[str, ...]
+    created: float
+    text: str
+    author: str = ""
+    sentiment: str | None = None
+    url: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}:{self.id}"
+
+
+class SeenSet:
+    """
+    Exact set of the last `capacity` keys; the oldest are forgotten first.
+    Memory stays bounded however long the pipeline runs.
+    """
+
+    def __init__(self, capacity: int = 100_000) -> None:
+        self.capacity = capacity
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def add(self, key: str) -> bool:
+        """
+        Record `key`; False if it was already present.
+        """
+        if key in self._keys:
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+        return True
+
+
+class RollingCounts:
+    """
+    Per-ticker mention and sentiment counts in fixed time buckets over the
+    last `horizon` seconds. Adding a mention is O(1); window queries touch
+    at most horizon / bucket buckets per ticker. Safe to query while
+    another thread adds.
+    """
+
+    def __init__(self, bucket: float = 60.0, horizon: float = 3600.0) -> None:
+        self.bucket = bucket
+        self.horizon = horizon
+        # symbol -> bucket start -> [mentions, bullish, bearish]
+        self._buckets: Dict[str, Dict[float, List[int]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, symbol: str, at: float, sentiment: str | None = None, now: float | None = None) -> bool:
+        """
+        Count one mention of `symbol` at time `at`; False (and not counted)
+        if it falls outside the horizon.
+        """
+        now = time.time() if now is None else now
+        if at < now - self.horizon or at > now + self.bucket:
+            return False
+        start = at - at % self.bucket
+        with self._lock:
+            entry = self._buckets.setdefault(symbol, {}).setdefault(start, [0, 0, 0])
+            entry[0] += 1
+            if sentiment == "Bullish":
+                entry[1] += 1
+            elif sentiment == "Bearish":
+                entry[2] += 1
+        return True
+
+    def prune(self, now: float | None = None) -> None:
+        cutoff = (time.time() if now is None else now) - self.horizon - self.bucket
+        with self._lock:
+            for symbol in list(self._buckets):
+                series = self._buckets[symbol]
+                for start in [s for s in series if s < cutoff]:
+                    del series[start]
+                if not series:
+                    del self._buckets[symbol]
+
+    def window(self, symbol: str, seconds: float, now: float | None = None) -> Tuple[int, int, int]:
+        """
+        (mentions, bullish, bearish) in buckets overlapping the last
+        `seconds`.
+        """
+        cutoff = (time.time() if now is None else now) - seconds
+        mentions = bullish = bearish = 0
+        with self._lock:
+            for start, (n, bull, bear) in self._buckets.get(symbol, {}).items():
+                if start + self.bucket > cutoff:
+                    mentions += n
+                    bullish += bull
+                    bearish += bear
+        return mentions, bullish, bearish
+
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return list(self._buckets)
+
+
+@dataclass
+class _Feed:
+    source: str
+    name: str
+    params: Dict[str, Any]
+    cursor: Any = None
+    # Catching up after a poll ran out of pages: where to resume paging
+    # back from, and the newest item seen so far.
+    resume: Any = None
+    high_water: Any = None
+    empty_polls: int = 0
+    polls: int = 0
+    fetched: int = 0
+    errors: int = 0
+    last_error: str = ""
+    symbols: Tuple[str, ...] = field(default_factory=tuple)
+
+
+def _reddit_mention(post: Dict[str, Any]) -> SocialMention:
+    text = f"{post.get('title', '')}\n{post.get('selftext', '')}"
+    permalink = post.get("permalink", "")
+    return SocialMention(
+        source="reddit",
+        id=post.get("name") or f"t3_{post.get('id', '')}",
+        symbols=(),
+        created=float(post.get("created_utc") or 0.0),
+        text=text,
+        author=post.get("author", ""),
+        url=f"https://www.reddit.com{permalink}" if permalink else post.get("url", ""),
+    )
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return 0.0
+
+
+def _stocktwits_mention(message: Dict[str, Any]) -> SocialMention:
+    sentiment = ((message.get("entities") or {}).get("sentiment") or {}).get("basic")
+    tagged = tuple(s["symbol"].upper() for s in message.get("symbols", ()) if s.get("symbol"))
+    return SocialMention(
+        source="stocktwits",
+        id=str(message.get("id", "")),
+        symbols=tagged,
+        created=_parse_time(message.get("created_at", "")),
+        text=message.get("body", ""),
+        author=(message.get("user") or {}).get("username", ""),
+        sentiment=sentiment,
+    )
+
+
+class SocialAggregator:
+    """
+    Incremental Reddit/StockTwits mention pipeline.
+
+    Each watched feed keeps a cursor - the newest Reddit fullname
+    (`before`) or StockTwits message id (`since`) - so a poll fetches only
+    items newer than the last one seen, paging until it has caught up (at
+    most `max_pages` requests). A StockTwits feed that runs out of pages
+    keeps its cursor and resumes paging back from the oldest message it
+    fetched on the next poll, so a burst is never skipped; a Reddit feed
+    pages forward in time and just continues from where it stopped. A
+    bounded `SeenSet` drops items seen
+    through another feed or after a cursor reset. Every new mention is
+    counted per ticker in `RollingCounts` and published on `events` under
+    `Topic.SOCIAL`, keyed by ticker, so per-poll work is O(new items).
+
+    Tickers come from `extract` (cashtags by default; pass a
+    `TickerMatcher` to find bare symbols of a universe), plus the feed's
+    own symbols: the StockTwits stream symbol, or those given to
+    `watch_reddit`. With a matcher, `watch_subreddit` reads a subreddit's
+    whole new feed once per poll instead of one search per symbol. The
+    last `recent_per_symbol` mentions of each ticker are kept for `recent`.
+    """
+
+    def __init__(
+        self,
+        clients: AuroraClients,
+        extract: TickerExtractor = extract_cashtags,
+        seen_capacity: int = 100_000,
+        bucket: float = 60.0,
+        horizon: float = 6 * 3600.0,
+        page_size: int = 100,
+        max_pages: int = 5,
+        resync_after: int = 10,
+        recent_per_symbol: int = 50,
+        events: EventBus | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.clients = clients
+        self.extract = extract
+        self.seen = SeenSet(seen_capacity)
+        self.counts = RollingCounts(bucket, horizon)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.resync_after = resync_after
+        self.events = events
+        self.clock = clock
+        self.feeds: Dict[str, _Feed] = {}
+        self.recent_per_symbol = recent_per_symbol
+        self._recent: Dict[str, Deque[SocialMention]] = {}
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def watch_reddit(self, subreddit: str, query: str, symbols: Iterable[str] = ()) -> str:
+        name = f"reddit:{subreddit}:{query}"
+        self.feeds[name] = _Feed(
+            "reddit", name, {"subreddit": subreddit, "query": query},
+            symbols=tuple(s.upper() for s in symbols),
+        )
+        return name
+
+    def watch_subreddit(self, subreddit: str) -> str:
+        """
+        Follow every new post in `subreddit`; tickers come from `extract`.
+        """
+        name = f"reddit:{subreddit}"
+        self.feeds[name] = _Feed("reddit", name, {"subreddit": subreddit})
+        return name
+
+    def watch_stocktwits(self, symbol: str) -> str:
+        name = f"stocktwits:{symbol.upper()}"
+        self.feeds[name] = _Feed(
+            "stocktwits", name, {"symbol": symbol.upper()}, symbols=(symbol.upper(),)
+        )
+        return name
+
+    def _fetch_reddit(self, feed: _Feed) -> Tuple[List[SocialMention], bool]:
+        """
+        New posts, and whether the feed has caught up.
+        """
+        reddit = self.clients.reddit
+        out: List[SocialMention] = []
+        before = feed.cursor
+        subreddit, query = feed.params["subreddit"], feed.params.get("query")
+        for _ in range(self.max_pages):
+            if query is None:
+                posts = reddit.get_new(subreddit, limit=self.page_size, before=before)
+            else:
+                posts = reddit.search_subreddit(subreddit, query, limit=self.page_size, before=before)
+            out.extend(_reddit_mention(p) for p in posts)
+            # Without a cursor the first page is simply the newest posts.
+            if before is None or len(posts) < self.page_size:
+                return out, True
+            # `before` pages walk forward in time: continue past the newest.
+            before = posts[0].get("name") or before
+        return out, False
+
+    def _fetch_stocktwits(self, feed: _Feed) -> Tuple[List[SocialMention], bool]:
+        """
+        New messages, and whether the feed has caught up. If not,
+        `feed.resume` is left at the max_id to continue from.
+        """
+        stocktwits = self.clients.stocktwits
+        out: List[SocialMention] = []
+        max_id = feed.resume
+        for _ in range(self.max_pages):
+            data = stocktwits.get_symbol_stream(
+                feed.params["symbol"], since=feed.cursor, max_id=max_id
+            )
+            messages = data.get("messages", [])
+            out.extend(_stocktwits_mention(m) for m in messages)
+            more = (data.get("cursor") or {}).get("more")
+            if feed.cursor is None or not messages or not more:
+                feed.resume = None
+                return out, True
+            # `since` returns the newest page; walk back towards the cursor.
+            max_id = min(int(m["id"]) for m in messages) - 1
+        feed.resume = max_id
+        return out, False
+
+    @staticmethod
+    def _newest(feed: _Feed, mentions: List[SocialMention]) -> Any:
+        if feed.source == "reddit":
+            if not mentions:
+                return feed.cursor
+            return max(mentions, key=lambda m: m.created).id
+        ids = [int(m.id) for m in mentions]
+        for known in (feed.cursor, feed.high_water):
+            if known is not None:
+                ids.append(known)
+        return max(ids) if ids else None
+
+    def poll_feed(self, name: str) -> List[SocialMention]:
+        """
+        Fetch and ingest one feed; returns only mentions not seen before.
+        """
+        feed = self.feeds[name]
+        feed.polls += 1
+        if feed.cursor is not None and feed.empty_polls >= self.resync_after:
+            # A deleted Reddit post makes its fullname a cursor that never
+            # yields anything; refetch from the top and let dedupe sort it out.
+            feed.cursor = feed.resume = feed.high_water = None
+            feed.empty_polls = 0
+        fetch = self._fetch_reddit if feed.source == "reddit" else self._fetch_stocktwits
+        try:
+            mentions, caught_up = fetch(feed)
+        except Exception as exc:  # noqa: BLE001 - one bad feed must not stop the others
+            feed.errors += 1
+            feed.last_error = f"{type(exc).__name__}: {exc}"
+            logger.warning("Social feed %s failed: %s", name, feed.last_error)
+            return []
+
+        feed.fetched += len(mentions)
+        feed.empty_polls = 0 if mentions else feed.empty_polls + 1
+        newest = self._newest(feed, mentions)
+        if caught_up or feed.source == "reddit":
+            feed.cursor, feed.high_water = newest, None
+        else:
+            feed.high_water = newest
+        if not caught_up:
+            logger.warning("Social feed %s still had more pages after %d", name, self.max_pages)
+        return self._ingest(feed, mentions)
+
+    def poll(self) -> List[SocialMention]:
+        """
+        Poll every watched feed once.
+        """
+        new: List[SocialMention] = []
+        for name in list(self.feeds):
+            new.extend(self.poll_feed(name))
+        self.counts.prune(self.clock())
+        return new
+
+    def _ingest(self, feed: _Feed, mentions: List[SocialMention]) -> List[SocialMention]:
+        now = self.clock()
+        new: List[SocialMention] = []
+        with self._lock:
+            for mention in sorted(mentions, key=lambda m: m.created):
+                if not self.seen.add(mention.key):
+                    self.duplicates += 1
+                    continue
+                symbols = tuple(
+                    dict.fromkeys((*feed.symbols, *mention.symbols, *self.extract(mention.text)))
+                )
+                mention = replace(mention, symbols=symbols)
+                for symbol in symbols:
+                    self.counts.add(symbol, mention.created or now, mention.sentiment, now)
+                    recent = self._recent.get(symbol)
+                    if recent is None:
+                        recent = self._recent[symbol] = deque(maxlen=self.recent_per_symbol)
+                    recent.append(mention)
+                new.append(mention)
+        if self.events is not None:
+            self.events.publish_many(
+                Topic.SOCIAL, ((symbol, m) for m in new for symbol in m.symbols)
+            )
+        return new
+
+    def recent(self, symbol: str) -> List[SocialMention]:
+        """
+        Latest mentions of `symbol`, newest first.
+        """
+        with self._lock:
+            return list(reversed(self._recent.get(symbol.upper(), ())))
+
+    def mentions(self, symbol: str, window: float = 3600.0) -> int:
+        return self.counts.window(symbol.upper(), window, self.clock())[0]
+
+    def velocity(self, symbol: str, short: float = 300.0, long: float = 3600.0) -> float:
+        """
+        Mention rate over the last `short` seconds relative to the rate over
+        the last `long` seconds; above 1 means chatter is accelerating.
+        """
+        now = self.clock()
+        recent = self.counts.window(symbol.upper(), short, now)[0]
+        baseline = self.counts.window(symbol.upper(), long, now)[0]
+        if not baseline:
+            return 0.0
+        return (recent / short) / (baseline / long)
+
+    def sentiment(self, symbol: str, window: float = 3600.0) -> Dict[str, int]:
+        mentions, bullish, bearish = self.counts.window(symbol.upper(), window, self.clock())
+        return {"mentions": mentions, "bullish": bullish, "bearish": bearish}
+
+    def top(self, n: int = 10, window: float = 3600.0) -> List[Tuple[str, int]]:
+        now = self.clock()
+        ranked = [(s, self.counts.window(s, window, now)[0]) for s in self.counts.symbols()]
+        ranked = [item for item in ranked if item[1]]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:n]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "seen": len(self.seen),
+            "duplicates": self.duplicates,
+            "feeds": {
+                name: {
+                    "cursor": feed.cursor,
+                    "polls": feed.polls,
+                    "fetched": feed.fetched,
+                    "errors": feed.errors,
+                    "last_error": feed.last_error,
+                }
+                for name, feed in self.feeds.items()
+            },
+        }
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List
+
+from aurora_core.api_manager import AuroraClients
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.logging_utils import get_logger
+from aurora_apis.market_stream import MarketStream
+
+
+logger = get_logger(__name__)
+
+
+class StreamIngestor:
+    """
+    Runs WebSocket market streams on a background event loop and publishes
+    every tick into a `DataFusionBus`.
+
+    The loop lives on its own daemon thread so synchronous callers (the
+    bus, the scheduler) are unaffected. Streams reconnect and resubscribe
+    on their own; the ingestor only starts them, fans out subscription
+    changes and stops them.
+    """
+
+    def __init__(self, bus: DataFusionBus, streams: Iterable[MarketStream] = ()) -> None:
+        self.bus = bus
+        self.streams: List[MarketStream] = list(streams)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    @classmethod
+    def from_clients(
+        cls,
+        bus: DataFusionBus,
+        clients: AuroraClients,
+        providers: Iterable[str] = ("polygon", "finnhub"),
+        **stream_kwargs: Any,
+    ) -> "StreamIngestor":
+        """
+        Build streams for `providers` from the configured REST clients.
+        """
+        ingestor = cls(bus)
+        for provider in providers:
+            client = getattr(clients, provider)
+            ingestor.streams.append(
+                client.stream(
+                    bus.publish_tick,
+                    on_disconnect=ingestor._on_disconnect,
+                    **stream_kwargs,
+                )
+            )
+        return ingestor
+
+    @staticmethod
+    def _on_disconnect(stream: MarketStream, exc: BaseException) -> None:
+        logger.warning("%s stream disconnected, reconnecting: %s", stream.provider, exc)
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def _call(self, coro: Any) -> Future:
+        if self._loop is None:
+            raise RuntimeError("StreamIngestor is not running; call start() first")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def start(self) -> None:
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(loop,), name="aurora-streams", daemon=True
+        )
+        self._thread.start()
+
+        async def launch() -> None:
+            for stream in self.streams:
+                self._tasks.append(asyncio.create_task(stream.run()))
+
+        self._call(launch()).result()
+        logger.info("Started %d market stream(s)", len(self.streams))
+
+    def subscribe(self, symbols: Iterable[str], timeout: float = 10.0) -> None:
+        symbols = list(symbols)
+        for stream in self.streams:
+            self._call(stream.subscribe(symbols)).result(timeout)
+
+    def unsubscribe(self, symbols: Iterable[str], timeout: float = 10.0) -> None:
+        symbols = list(symbols)
+        for stream in self.streams:
+            self._call(stream.unsubscribe(symbols)).result(timeout)
+
+    def wait_connected(self, timeout: float = 10.0) -> bool:
+        """
+        Block until every stream has an open, subscribed connection.
+        """
+
+        async def wait_all() -> None:
+            await asyncio.gather(*(s.connected.wait() for s in self.streams))
+
+        try:
+            self._call(asyncio.wait_for(wait_all(), timeout)).result(timeout + 1)
+        except (asyncio.TimeoutError, TimeoutError):
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {stream.provider: dict(stream.stats) for stream in self.streams}
+
+    def stop(self, timeout: float = 5.0) -> None:
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def shutdown() -> None:
+            for stream in self.streams:
+                await stream.close()
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks.clear()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        loop.close()
@@ -0,0 +1,189 @@
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+from urllib import parse
+
+from aurora_core.config import APIConfig, load_api_config
+from aurora_core.logging_utils import get_logger
+from aurora_apis.metrics import MetricsRegistry, get_metrics
+
+
+logger = get_logger(__name__)
+
+MAX_PROFILE_SECONDS = 60.0
+# Shorter intervals make the sampler thread spin and starve the process.
+MIN_PROFILE_INTERVAL = 0.001
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler: every `interval` seconds a background thread
+    records the Python stack of every other thread. Costs nothing when
+    not running and little when it is, so it is safe on a live process.
+
+    `collapsed()` gives folded stacks ("outer;...;inner count"), the input
+    format of flamegraph.pl and speedscope; `top()` ranks the functions
+    most often on top of a stack.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64) -> None:
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "SamplingProfiler":
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="aurora-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                if ident not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                frames: List[str] = []
+                while frame is not None and len(frames) < self.max_depth:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                frames.append(names.get(ident, str(ident)))
+                self.stacks[tuple(reversed(frames))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def top(self, n: int = 20) -> List[Tuple[str, int]]:
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack[-1]] += count
+        return leaves.most_common(n)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        url = parse.urlsplit(self.path)
+        registry = self.server.registry or get_metrics()
+        if url.path == "/metrics":
+            body = registry.to_prometheus() if registry else ""
+            self._reply(200, "text/plain; version=0.0.4", body)
+        elif url.path == "/metrics.json":
+            body = registry.to_json() if registry else "{}"
+            self._reply(200, "application/json", body)
+        elif url.path == "/profile":
+            query = dict(parse.parse_qsl(url.query))
+            try:
+                seconds = min(float(query.get("seconds", 5)), MAX_PROFILE_SECONDS)
+                interval = float(query.get("interval", 0.005))
+            except ValueError:
+                self._reply(400, "text/plain", "seconds and interval must be numbers\n")
+                return
+            if not (seconds >= 0 and MIN_PROFILE_INTERVAL <= interval <= MAX_PROFILE_SECONDS):
+                self._reply(
+                    400,
+                    "text/plain",
+                    f"seconds must be >= 0 and interval between {MIN_PROFILE_INTERVAL:g} "
+                    f"and {MAX_PROFILE_SECONDS:g}\n",
+                )
+                return
+            with SamplingProfiler(interval=interval) as profiler:
+                time.sleep(seconds)
+            self._reply(200, "text/plain", profiler.collapsed())
+        else:
+            self._reply(404, "text/plain", "not found\n")
+
+    def _reply(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """
+    Serves `/metrics` (Prometheus text), `/metrics.json` and
+    `/profile?seconds=N` (folded stacks from a `SamplingProfiler` run) on a
+    daemon thread. Uses the process-wide registry unless given one.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        super().__init__((host, port), _Handler)
+        self.registry = registry
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="aurora-metrics", daemon=True
+        )
+        self._thread.start()
+        logger.info("Serving metrics on %s/metrics", self.url)
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def start_metrics_server(config: APIConfig | None = None) -> MetricsServer | None:
+    """
+    Start a `MetricsServer` on AURORA_METRICS_ADDR ("[host:]port"), or
+    return None if it is not set.
+    """
+    if config is None:
+        config = load_api_config()
+    if not config.metrics_addr:
+        return None
+    host, _, port = config.metrics_addr.rpartition(":")
+    try:
+        return MetricsServer(host or "127.0.0.1", int(port)).start()
+    except ValueError:
+        raise ValueError(f"Invalid AURORA_METRICS_ADDR: {config.metrics_addr!r}")
+
@@ -0,0 +1,153 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Mapping, Tuple
+
+from aurora_core.logging_utils import get_logger
+
+
+logger = get_logger(__name__)
+
+# Tickers that are also everyday words or trading slang; written bare they
+# are almost never about the company, so they only count as cashtags.
+DEFAULT_STOPWORDS = frozenset(
+    """
+    A AI ALL AM AN ANY ARE AT ATH BE BEST BIG BY CAN CEO CFO CPI DD DO EOD EPS
+    ETF EV FED FOR FUN GDP GO GOOD HAS HE HOLD IMO IN IPO IS IT LOL LOVE LOW
+    ME MOON NEW NEXT NOW OF OK ON ONE OR OUT PM PT RH SEC SO TA THE TO TV UK
+    UP US USA WSB YOLO
+    """.split()
+)
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@dataclass(frozen=True)
+class TickerMatch:
+    symbol: str
+    start: int
+    end: int
+    cashtag: bool = False
+
+
+class TickerMatcher:
+    """
+    Finds every ticker of a symbol universe in a text in one pass, using an
+    Aho-Corasick automaton over the symbols (and optional `aliases` such as
+    company names), so the cost depends on the text length rather than the
+    number of symbols.
+
+    "$aapl"-style cashtags match in any case. Bare symbols must be written
+    in upper case, be at least `min_bare_length` long and not be in
+    `stopwords`; aliases match in any case. Matches must sit on word
+    boundaries, and overlapping matches keep the longest ("BRK.B" over
+    "BRK"). Class tickers match with either separator: "BRK-B" or "BRK.B".
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        aliases: Mapping[str, str] | None = None,
+        stopwords: Iterable[str] = DEFAULT_STOPWORDS,
+        min_bare_length: int = 2,
+    ) -> None:
+        self.stopwords = frozenset(s.upper() for s in stopwords)
+        self.min_bare_length = min_bare_length
+        # Node 0 is the root; per node: transitions, failure link and the
+        # (length, symbol, is_alias) patterns ending there.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, str, bool], ...]] = [()]
+        self.symbols: List[str] = []
+
+        for symbol in dict.fromkeys(s.strip().upper() for s in symbols if s.strip()):
+            self.symbols.append(symbol)
+            for form in {symbol, symbol.replace("-", "."), symbol.replace(".", "-")}:
+                self._insert(form, symbol, False)
+        for alias, symbol in (aliases or {}).items():
+            if alias.strip():
+                self._insert(alias.strip(), symbol.strip().upper(), True)
+        self._link()
+        logger.debug("Ticker matcher built: %d symbols, %d states", len(self.symbols), len(self._goto))
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def _insert(self, pattern: str, symbol: str, alias: bool) -> None:
+        node = 0
+        for ch in pattern.translate(_ASCII_LOWER):
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        entry = (len(pattern), symbol, alias)
+        if entry not in self._out[node]:
+            self._out[node] += (entry,)
+
+    def _link(self) -> None:
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] += self._out[self._fail[child]]
+
+    def _accept(self, text: str, start: int, end: int, symbol: str, alias: bool) -> TickerMatch | None:
+        if end < len(text) and _is_word(text[end]):
+            return None
+        cashtag = start > 0 and text[start - 1] == "$"
+        before = start - 1 if cashtag else start
+        if before > 0 and _is_word(text[before - 1]):
+            return None
+        if cashtag or alias:
+            return TickerMatch(symbol, before, end, cashtag)
+        written = text[start:end]
+        if (
+            written != written.upper()
+            or end - start < self.min_bare_length
+            or symbol in self.stopwords
+        ):
+            return None
+        return TickerMatch(symbol, start, end)
+
+    def matches(self, text: str) -> List[TickerMatch]:
+        """
+        Every accepted ticker occurrence in `text`, in order.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: List[TickerMatch] = []
+        state = 0
+        for i, ch in enumerate(text.translate(_ASCII_LOWER)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, symbol, alias in out[state]:
+                match = self._accept(text, i + 1 - length, i + 1, symbol, alias)
+                if match is not None:
+                    found.append(match)
+
+        found.sort(key=lambda m: (m.start, m.start - m.end))
+        kept: List[TickerMatch] = []
+        for match in found:
+            if not kept or match.start >= kept[-1].end:
+                kept.append(match)
+        return kept
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Distinct symbols mentioned in `text`, in order of first mention.
+        """
+        return list(dict.fromkeys(m.symbol for m in self.matches(text)))
+
+    __call__ = extract
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+from urllib import parse
+
+from aurora_apis.async_transport import AsyncTransport
+from aurora_apis.transport import HTTPResponse, Transport
+
+RECORDINGS_DIR = Path(__file__).with_name("recordings")
+
+# Bodies may contain this placeholder; it is replaced by the route's
+# `symbol` regex group so one recording serves every ticker.
+SYMBOL_PLACEHOLDER = "{{symbol}}"
+
+
+@dataclass
+class Route:
+    provider: str
+    host: str
+    method: str
+    pattern: re.Pattern
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def render(self, match: re.Match) -> bytes:
+        symbol = match.groupdict().get("symbol")
+        if symbol is None or SYMBOL_PLACEHOLDER.encode() not in self.body:
+            return self.body
+        return self.body.replace(SYMBOL_PLACEHOLDER.encode(), parse.unquote(symbol).encode())
+
+
+def load_recordings(directory: str | Path = RECORDINGS_DIR) -> List[Route]:
+    """
+    Read every `*.json` recording file: `{"provider", "host", "routes": [...]}`
+    where each route has `method`, `path` (regex over path + query), and
+    `status`, `headers` and `body` (any JSON value) for the response.
+    """
+    routes: List[Route] = []
+    for path in sorted(Path(directory).glob("*.json")):
+        data = json.loads(path.read_text())
+        for route in data["routes"]:
+            body = route.get("body")
+            raw = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+            routes.append(
+                Route(
+                    provider=data["provider"],
+                    host=data["host"],
+                    method=route.get("method", "GET").upper(),
+                    pattern=re.compile(route["path"]),
+                    status=route.get("status", 200),
+                    headers={"Content-Type": "application/json", **route.get("headers", {})},
+                    body=raw,
+                )
+            )
+    return routes
+
+
+@dataclass
+class LatencyModel:
+    """
+    Per-request delay of `latency` seconds plus uniform jitter in
+    [0, `jitter`], overridable per provider. Draws come from one seeded RNG.
+    """
+
+    latency: float = 0.02
+    jitter: float = 0.005
+    per_provider: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def delay(self, provider: str) -> float:
+        base, jitter = self.per_provider.get(provider, (self.latency, self.jitter))
+        with self._lock:
+            return base + self._rng.uniform(0, jitter)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "ReplayServer"
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle
+        # plus delayed ACKs add ~40ms to every keep-alive response.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        host, _, rest = self.path.lstrip("/").partition("/")
+        route, match = self.server.match(self.command, host, "/" + rest)
+        if route is None:
+            self.server.count(("unmatched", host))
+            self._reply(404, {"Content-Type": "application/json"}, b'{"error": "no recording"}')
+            return
+        self.server.count((route.provider, route.method))
+        time.sleep(self.server.latency.delay(route.provider))
+        self._reply(route.status, route.headers, route.render(match))
+
+    do_GET = _serve
+    do_POST = _serve
+
+    def _reply(self, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Serves recordings at `http://127.0.0.1:<port>/<upstream host>/<path>`;
+    pair it with `RedirectTransport` so clients keep their real base URLs.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        routes: List[Route] | None = None,
+        latency: LatencyModel | None = None,
+        port: int = 0,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.routes = routes if routes is not None else load_recordings()
+        self.latency = latency or LatencyModel()
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def match(self, method: str, host: str, path: str) -> Tuple[Route | None, re.Match | None]:
+        for route in self.routes:
+            if route.host == host and route.method == method:
+                match = route.pattern.search(path)
+                if match:
+                    return route, match
+        return None, None
+
+    def count(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def redirect_url(url: str, target: str) -> str:
+    parts = parse.urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{target}/{parts.netloc}{parts.path}{query}"
+
+
+class RedirectTransport(Transport):
+    """
+    Sends every request to `target` (a `ReplayServer` URL) through `inner`,
+    so the real pooling transport is what gets measured.
+    """
+
+    def __init__(self, inner: Transport, target: str) -> None:
+        self.inner = inner
+        self.target = target
+
+    def request(self, method, url, body=None, headers=None, timeout=10):  # type: ignore[override]
+        return self.inner.request(
+            method, redirect_url(url, self.target), body=body, headers=headers, timeout=timeout
+        )
+
+    def stream(self, method, url, body=None, headers=None, timeout=10):  # type: ignore[override]
+        return self.inner.stream(
+            method, redirect_url(url, self.target), body=body, headers=headers, timeout=timeout
+        )
+
+
+class AsyncRedirectTransport(AsyncTransport):
+    """
+    Coroutine counterpart of `RedirectTransport`.
+    """
+
+    def __init__(self, inner: AsyncTransport, target: str) -> None:
+        self.inner = inner
+        self.target = target
+
+    async def request(self, method, url, body=None, headers=None, timeout=10):  # type: ignore[override]
+        return await self.inner.request(
+            method, redirect_url(url, self.target), body=body, headers=headers, timeout=timeout
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through to the real upstream via `inner` and saves each
+    distinct response as an exact-match route in `<directory>/<host>.json`.
+    Credentials in the query string are not written out. Edit the saved
+    `path` into a `(?P<symbol>...)` regex and the body to use
+    `{{symbol}}` to make a recording serve every ticker.
+    """
+
+    SECRET_PARAMS = ("token", "apikey", "apiKey", "api_key", "c")
+
+    def __init__(self, inner: Transport, directory: str | Path, provider: str = "") -> None:
+        self.inner = inner
+        self.directory = Path(directory)
+        self.provider = provider
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None, timeout=10):  # type: ignore[override]
+        resp = self.inner.request(method, url, body=body, headers=headers, timeout=timeout)
+        self._save(method, url, resp)
+        return resp
+
+    def _save(self, method: str, url: str, resp: HTTPResponse) -> None:
+        parts = parse.urlsplit(url)
+        query = [(k, v) for k, v in parse.parse_qsl(parts.query) if k not in self.SECRET_PARAMS]
+        path = parts.path + ("?" + parse.urlencode(query) if query else "")
+        try:
+            body: Any = json.loads(resp.body)
+        except ValueError:
+            body = resp.body.decode("utf-8", "replace")
+        route = {
+            "method": method,
+            "path": "^" + re.escape(parts.path),
+            "recorded_path": path,
+            "status": resp.status,
+            "body": body,
+        }
+        target = self.directory / f"{parts.netloc}.json"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            data = (
+                json.loads(target.read_text())
+                if target.exists()
+                else {"provider": self.provider or parts.netloc, "host": parts.netloc, "routes": []}
+            )
+            if all(r["path"] != route["path"] or r["method"] != method for r in data["routes"]):
+                data["routes"].append(route)
+                target.write_text(json.dumps(data, indent=2))
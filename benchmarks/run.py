@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from aurora_apis import http_client
+from aurora_apis.async_transport import AsyncPooledTransport
+from aurora_apis.metrics import MetricsRegistry, set_metrics
+from aurora_apis.transport import PooledTransport
+from aurora_core.api_manager import AuroraClients, build_async_clients, build_clients
+from aurora_core.config import APIConfig
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.quote_router import QuoteRouter
+from benchmarks.replay import AsyncRedirectTransport, LatencyModel, RedirectTransport, ReplayServer
+
+RESULTS_DIR = Path(__file__).with_name("results")
+SCHEMA_VERSION = 1
+
+SYMBOLS = (
+    "AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "BRK-B", "JPM", "V",
+    "XOM", "UNH", "JNJ", "WMT", "PG", "MA", "HD", "AVGO", "CVX", "LLY",
+)
+
+# Metric families copied into each scenario's result to show where time went.
+BREAKDOWN_METRICS = (
+    "aurora_snapshot_source_seconds",
+    "aurora_client_call_seconds",
+    "aurora_http_request_seconds",
+)
+
+
+@dataclass
+class Settings:
+    iterations: int = 50
+    warmup: int = 5
+    memory_iterations: int = 10
+    batch_size: int = 20
+    latency: float = 0.02
+    jitter: float = 0.005
+    seed: int = 0
+    cache: bool = False
+
+
+def replay_config() -> APIConfig:
+    """
+    Dummy credentials for every provider; the replay server ignores them.
+    Rate limiting is off so the benchmark measures Aurora, not the quotas.
+    """
+    values = {f.name: "replay" for f in fields(APIConfig)}
+    values.update(
+        sec_edgar_user_agent="AuroraBench/1.0 (bench@example.com)",
+        sec_edgar_cache_dir=None,
+        finnhub_proxy_url=None,
+        polygon_s3_endpoint=None,
+        rate_limits="off",
+        http_retries=None,
+        circuit_breaker=None,
+        metrics_addr=None,
+    )
+    return APIConfig(**values)
+
+
+def _serve(conn: Any, latency_args: Tuple[Any, ...]) -> None:
+    server = ReplayServer(latency=LatencyModel(*latency_args))
+    conn.send(server.url)
+    server.serve_forever()
+
+
+def start_replay_process(latency: LatencyModel) -> Tuple[str, multiprocessing.Process]:
+    """
+    Run the replay server in a child process so its CPU time and
+    allocations stay out of the measurements.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    latency_args = (latency.latency, latency.jitter, dict(latency.per_provider), latency.seed)
+    proc = ctx.Process(target=_serve, args=(child, latency_args), daemon=True)
+    proc.start()
+    if not parent.poll(30):
+        proc.terminate()
+        raise RuntimeError("replay server did not start")
+    return parent.recv(), proc
+
+
+def quantile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return math.nan
+    pos = q * (len(sorted_values) - 1)
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def measure(
+    op: Callable[[], Any], settings: Settings, items_per_op: int = 1
+) -> Dict[str, Any]:
+    """
+    Time `op` (after warmup) for latency and throughput, then run it again
+    under tracemalloc for peak memory and retained allocations.
+    """
+    for _ in range(settings.warmup):
+        op()
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for _ in range(settings.iterations):
+        t0 = time.perf_counter()
+        op()
+        latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    latencies.sort()
+
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(settings.memory_iterations):
+        op()
+    current, peak = tracemalloc.get_traced_memory()
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    return {
+        "iterations": settings.iterations,
+        "items_per_op": items_per_op,
+        "wall_seconds": wall,
+        "ops_per_second": settings.iterations / wall,
+        "items_per_second": settings.iterations * items_per_op / wall,
+        "latency_seconds": {
+            "mean": sum(latencies) / len(latencies),
+            "p50": quantile(latencies, 0.5),
+            "p90": quantile(latencies, 0.9),
+            "p99": quantile(latencies, 0.99),
+            "max": latencies[-1],
+        },
+        "memory": {
+            "peak_bytes": peak - base,
+            "retained_bytes": current - base,
+            "retained_blocks": blocks_after - blocks_before,
+        },
+    }
+
+
+def _symbols() -> Iterator[str]:
+    return itertools.cycle(SYMBOLS)
+
+
+def _batches(size: int) -> Iterator[List[str]]:
+    symbols = _symbols()
+    while True:
+        yield [next(symbols) for _ in range(size)]
+
+
+def _sync_scenarios(clients: AuroraClients, settings: Settings) -> Dict[str, Tuple[Callable[[], Any], int, Callable[[], None]]]:
+    sequential = DataFusionBus(clients)
+    concurrent = DataFusionBus(clients, concurrent=True)
+    router = QuoteRouter(clients, min_samples=5)
+    symbols = _symbols()
+    batches = _batches(settings.batch_size)
+    return {
+        "snapshot_sequential": (lambda: sequential.snapshot(next(symbols)), 1, sequential.close),
+        "snapshot_concurrent": (lambda: concurrent.snapshot(next(symbols)), 1, lambda: None),
+        "snapshot_many": (
+            lambda: list(concurrent.snapshot_many(next(batches))),
+            settings.batch_size,
+            concurrent.close,
+        ),
+        "quote_router": (lambda: router.get_quote(next(symbols)), 1, router.close),
+    }
+
+
+def _async_scenario(settings: Settings, target: str) -> Tuple[Callable[[], Any], int, Callable[[], None]]:
+    """
+    One op = quote, news and fundamentals for a batch of symbols, all
+    gathered on one event loop over the pooled async transport.
+    """
+    loop = asyncio.new_event_loop()
+    transport = AsyncRedirectTransport(AsyncPooledTransport(), target)
+    clients = loop.run_until_complete(build_async_clients(replay_config(), transport=transport))
+    batches = _batches(settings.batch_size)
+
+    async def batch(symbols: List[str]) -> List[Any]:
+        calls = []
+        for symbol in symbols:
+            calls += [
+                clients.alpha_vantage.get_quote(symbol),
+                clients.benzinga.get_news(symbol, limit=10),
+                clients.sec_edgar.get_company_facts(symbol),
+            ]
+        return await asyncio.gather(*calls)
+
+    def close() -> None:
+        loop.run_until_complete(clients.aclose())
+        loop.close()
+
+    return (lambda: loop.run_until_complete(batch(next(batches)))), settings.batch_size, close
+
+
+def _breakdown(registry: MetricsRegistry) -> Dict[str, Any]:
+    histograms = registry.snapshot()["histograms"]
+    return {name: histograms[name] for name in BREAKDOWN_METRICS if name in histograms}
+
+
+def run_benchmarks(
+    settings: Settings,
+    target: str,
+    only: Sequence[str] | None = None,
+) -> Dict[str, Any]:
+    """
+    Run every scenario (or those in `only`) against the replay server at
+    `target` and return the results document.
+    """
+    previous_transport = http_client.set_transport(
+        RedirectTransport(PooledTransport(max_connections_per_host=32), target)
+    )
+    previous_cache = http_client.get_response_cache()
+    if not settings.cache:
+        http_client.set_response_cache(None)
+    registry = MetricsRegistry()
+    previous_metrics = set_metrics(registry)
+
+    scenarios: Dict[str, Dict[str, Any]] = {}
+    try:
+        clients = build_clients(replay_config())
+        table = _sync_scenarios(clients, settings)
+        wanted = list(only) if only else [*table, "async_batch"]
+        for name in wanted:
+            if name == "async_batch":
+                op, items, close = _async_scenario(settings, target)
+            elif name in table:
+                op, items, close = table[name]
+            else:
+                raise ValueError(f"Unknown scenario: {name!r}")
+            registry.reset()
+            try:
+                result = measure(op, settings, items)
+            finally:
+                close()
+            result["breakdown"] = _breakdown(registry)
+            scenarios[name] = result
+    finally:
+        set_metrics(previous_metrics)
+        http_client.set_response_cache(previous_cache)
+        transport = http_client.set_transport(previous_transport)
+        if transport is not None:
+            transport.close()
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": environment(settings),
+        "scenarios": scenarios,
+    }
+
+
+def environment(settings: Settings) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": vars(settings),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Regressions beyond `tolerance` (a fraction) in p50/p99 latency or
+    throughput for scenarios present in both documents.
+    """
+    problems: List[str] = []
+    for name, new in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if old is None:
+            continue
+        for q in ("p50", "p99"):
+            before, after = old["latency_seconds"][q], new["latency_seconds"][q]
+            if before and after > before * (1 + tolerance):
+                problems.append(f"{name}: {q} {before * 1e3:.2f}ms -> {after * 1e3:.2f}ms")
+        before, after = old["items_per_second"], new["items_per_second"]
+        if before and after < before * (1 - tolerance):
+            problems.append(f"{name}: throughput {before:.1f}/s -> {after:.1f}/s")
+    return problems
+
+
+def _summary(results: Dict[str, Any]) -> str:
+    lines = [f"{'scenario':<22}{'items/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>10}"]
+    for name, r in results["scenarios"].items():
+        lat = r["latency_seconds"]
+        lines.append(
+            f"{name:<22}{r['items_per_second']:>10.1f}{lat['p50'] * 1e3:>10.2f}"
+            f"{lat['p99'] * 1e3:>10.2f}{r['memory']['peak_bytes'] / 1024:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Aurora benchmarks against replayed upstreams")
+    parser.add_argument("--iterations", type=int, default=Settings.iterations)
+    parser.add_argument("--warmup", type=int, default=Settings.warmup)
+    parser.add_argument("--memory-iterations", type=int, default=Settings.memory_iterations)
+    parser.add_argument("--batch-size", type=int, default=Settings.batch_size)
+    parser.add_argument("--latency", type=float, default=Settings.latency, help="seconds per upstream call")
+    parser.add_argument("--jitter", type=float, default=Settings.jitter, help="max extra seconds, uniform")
+    parser.add_argument(
+        "--provider-latency",
+        action="append",
+        default=[],
+        metavar="PROVIDER=LATENCY[:JITTER]",
+        help="per-provider override, e.g. sec_edgar=0.08:0.02",
+    )
+    parser.add_argument("--seed", type=int, default=Settings.seed)
+    parser.add_argument("--cache", action="store_true", help="keep the response cache enabled")
+    parser.add_argument("--scenario", action="append", help="run only these scenarios")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/)")
+    parser.add_argument("--baseline", type=Path, help="fail on regressions against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    per_provider: Dict[str, Tuple[float, float]] = {}
+    for spec in args.provider_latency:
+        try:
+            provider, _, value = spec.partition("=")
+            base, _, jitter = value.partition(":")
+            per_provider[provider] = (float(base), float(jitter or 0))
+        except ValueError:
+            parser.error(f"invalid --provider-latency {spec!r}")
+
+    settings = Settings(
+        iterations=args.iterations,
+        warmup=args.warmup,
+        memory_iterations=args.memory_iterations,
+        batch_size=args.batch_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        seed=args.seed,
+        cache=args.cache,
+    )
+    latency = LatencyModel(args.latency, args.jitter, per_provider, args.seed)
+    target, proc = start_replay_process(latency)
+    try:
+        results = run_benchmarks(settings, target, args.scenario)
+    finally:
+        proc.terminate()
+        proc.join()
+    results["meta"]["provider_latency"] = per_provider
+
+    output = args.output
+    if output is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"{stamp}-{results['meta']['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, sort_keys=True))
+    print(_summary(results))
+    print(f"\nresults written to {output}")
+
+    if args.baseline:
+        problems = compare(json.loads(args.baseline.read_text()), results, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from benchmarks.run import RESULTS_DIR, environment
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Each scenario runs in a fresh interpreter; `body` is timed from the
+# first Aurora import until it returns.
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+from aurora_core.api_manager import PROVIDERS
+providers = sorted(spec.module for spec in PROVIDERS.values() if spec.module in sys.modules)
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules), "provider_modules": providers}}))
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "import_api_manager": "import aurora_core.api_manager",
+    "build_one_provider": (
+        "from aurora_core.api_manager import build_clients\n"
+        "from aurora_core.config import APIConfig\n"
+        "build_clients(APIConfig(iex_api_token='x'), providers=['iex']).iex"
+    ),
+    "build_all_providers": (
+        "from aurora_core.api_manager import PROVIDERS, build_clients\n"
+        "from aurora_core.config import APIConfig\n"
+        "clients = build_clients(APIConfig())\n"
+        "for name in PROVIDERS: getattr(clients, name)"
+    ),
+}
+
+
+@dataclass
+class StartupSettings:
+    repeats: int = 10
+    budget_ms: float | None = None
+
+
+def run_child(body: str) -> Dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(body=body)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure_startup(settings: StartupSettings, only: Sequence[str] | None = None) -> Dict[str, Any]:
+    """
+    Cold-start time and loaded-module counts per scenario over
+    `settings.repeats` fresh interpreters.
+    """
+    scenarios: Dict[str, Any] = {}
+    for name in only or SCENARIOS:
+        runs = [run_child(SCENARIOS[name]) for _ in range(settings.repeats)]
+        seconds: List[float] = sorted(r["seconds"] for r in runs)
+        scenarios[name] = {
+            "repeats": settings.repeats,
+            "seconds": {
+                "min": seconds[0],
+                "median": statistics.median(seconds),
+                "max": seconds[-1],
+            },
+            "modules": runs[-1]["modules"],
+            "provider_modules": runs[-1]["provider_modules"],
+        }
+    return {"schema": 1, "meta": environment(settings), "scenarios": scenarios}
+
+
+def check(results: Dict[str, Any], budget_ms: float | None) -> List[str]:
+    """
+    Importing api_manager must not import any provider module, and (with a
+    budget) must take at most `budget_ms` at the median.
+    """
+    problems: List[str] = []
+    imported = results["scenarios"].get("import_api_manager")
+    if imported is None:
+        return problems
+    if imported["provider_modules"]:
+        problems.append(f"api_manager imports provider modules: {imported['provider_modules']}")
+    median_ms = imported["seconds"]["median"] * 1e3
+    if budget_ms is not None and median_ms > budget_ms:
+        problems.append(f"import took {median_ms:.1f}ms (budget {budget_ms:.1f}ms)")
+    return problems
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Aurora cold-start benchmark")
+    parser.add_argument("--repeats", type=int, default=StartupSettings.repeats)
+    parser.add_argument("--budget-ms", type=float, help="fail if importing api_manager is slower")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    settings = StartupSettings(repeats=args.repeats, budget_ms=args.budget_ms)
+    results = measure_startup(settings, args.scenario)
+
+    output = args.output
+    if output is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"startup-{stamp}-{results['meta']['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    print(f"{'scenario':<22}{'median ms':>10}{'min ms':>10}{'modules':>9}{'providers':>11}")
+    for name, r in results["scenarios"].items():
+        print(
+            f"{name:<22}{r['seconds']['median'] * 1e3:>10.1f}{r['seconds']['min'] * 1e3:>10.1f}"
+            f"{r['modules']:>9}{len(r['provider_modules']):>11}"
+        )
+    print(f"\nresults written to {output}")
+
+    problems = check(results, args.budget_ms)
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+import pytest
+
+from aurora_apis import async_http_client, http_client
+
+
+@pytest.fixture(autouse=True)
+def _restore_request_gates():
+    # build_clients() installs the rate limiter process-wide.
+    sync_gate = http_client.set_request_gate(None)
+    async_gate = async_http_client.set_async_request_gate(None)
+    http_client.set_request_gate(sync_gate)
+    async_http_client.set_async_request_gate(async_gate)
+    yield
+    http_client.set_request_gate(sync_gate)
+    async_http_client.set_async_request_gate(async_gate)
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from aurora_apis.async_transport import AsyncPooledTransport
+from aurora_apis.iex_client import IEXClient
+from aurora_core.api_manager import AuroraClients, build_async_clients, build_clients
+from aurora_core.config import APIConfig
+from benchmarks.startup import SCENARIOS, StartupSettings, check, measure_startup
+
+
+def test_clients_are_built_on_first_access_only():
+    clients = build_clients(APIConfig(iex_api_token="t", finnhub_api_key="k"))
+    assert clients.loaded == []
+    iex = clients.iex
+    assert iex is clients.iex and iex.api_token == "t"
+    assert clients.loaded == ["iex"]
+
+
+def test_selected_providers_restrict_attributes():
+    clients = build_clients(APIConfig(), providers=["iex", "finnhub"])
+    assert clients.providers == ("iex", "finnhub")
+    clients.finnhub
+    with pytest.raises(AttributeError, match="not selected"):
+        clients.polygon
+    with pytest.raises(ValueError, match="Unknown providers"):
+        build_clients(APIConfig(), providers=["bloomberg"])
+
+
+def test_explicit_clients_are_used_as_is():
+    iex = IEXClient(api_token="mine")
+    clients = AuroraClients(APIConfig(), iex=iex)
+    assert clients.iex is iex
+    with pytest.raises(TypeError):
+        AuroraClients(bloomberg=object())
+
+
+def test_async_clients_share_the_transport_lazily():
+    async def run():
+        transport = AsyncPooledTransport()
+        clients = await build_async_clients(
+            APIConfig(iex_api_token="t"), transport=transport, providers=["iex", "schwab"]
+        )
+        assert clients.loaded == []
+        assert clients.iex.transport is transport
+        assert type(clients.schwab).__name__ == "SchwabClient"
+        await clients.aclose()
+
+    asyncio.run(run())
+
+
+def test_importing_api_manager_loads_no_provider_module():
+    results = measure_startup(StartupSettings(repeats=1), ["import_api_manager"])
+    assert check(results, budget_ms=None) == []
+    assert set(SCENARIOS) >= {"import_api_manager", "build_one_provider"}
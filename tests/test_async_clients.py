@@ -0,0 +1,121 @@
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aurora_apis import http_client
+from aurora_apis.async_transport import AsyncPooledTransport, AsyncTransport
+from aurora_apis.finnhub_client import AsyncFinnhubClient
+from aurora_apis.fred_client import AsyncFREDClient
+from aurora_apis.sec_edgar_client import AsyncSECEdgarClient
+from aurora_apis.transport import HTTPResponse
+from aurora_core.api_manager import build_async_clients
+from aurora_core.config import APIConfig
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        body = gzip.compress(json.dumps({"path": self.path}).encode())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        if self.path.startswith("/chunked"):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            half = len(body) // 2
+            for part in (body[:half], body[half:]):
+                self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_async_transport_pools_connections_under_fan_out(server):
+    async def run():
+        transport = AsyncPooledTransport(max_connections_per_host=4)
+        responses = await asyncio.gather(
+            *(transport.request("GET", f"{server}/q?i={i}") for i in range(100))
+        )
+        chunked = await transport.request("GET", f"{server}/chunked")
+        await transport.aclose()
+        return responses, chunked
+
+    responses, chunked = asyncio.run(run())
+    assert [r.json()["path"] for r in responses] == [f"/q?i={i}" for i in range(100)]
+    assert chunked.json() == {"path": "/chunked"}
+    assert len(_Handler.connections) <= 4
+
+
+def test_async_client_uses_shared_transport(server):
+    async def run():
+        clients = await build_async_clients(APIConfig(finnhub_api_key="k"))
+        assert isinstance(clients.finnhub, AsyncFinnhubClient)
+        clients.finnhub.BASE_URL = server
+        quote = await clients.finnhub.get_quote("AAPL")
+        await clients.aclose()
+        return quote
+
+    assert asyncio.run(run()) == {"path": "/quote?symbol=AAPL&token=k"}
+
+
+class _RoutedAsyncTransport(AsyncTransport):
+    def __init__(self, routes):
+        self.routes = routes
+        self.urls = []
+
+    async def request(self, method, url, body=None, headers=None, timeout=10):
+        self.urls.append(url)
+        payload = next(v for k, v in self.routes.items() if k in url)
+        return HTTPResponse(200, "OK", {}, json.dumps(payload).encode(), url)
+
+
+def test_async_clients_do_not_fall_back_to_blocking_calls():
+    def blocking(*args, **kwargs):
+        raise AssertionError("sync transport used from an async client")
+
+    transport = _RoutedAsyncTransport({
+        "company_tickers": {"0": {"cik_str": 320193, "ticker": "AAPL"}},
+        "companyfacts": {"facts": {"dei": {"EntityName": {"units": {}}}}},
+        "observations": {"observations": [{"date": "2024-01-01", "value": "3.1"}]},
+    })
+    sec = AsyncSECEdgarClient(user_agent="test", transport=transport)
+    fred = AsyncFREDClient(api_key="k", transport=transport)
+
+    async def run():
+        facts = [f async for f in sec.iter_company_facts("aapl")]
+        series = await fred.get_series_columnar("CPIAUCSL")
+        observations = [o async for o in fred.iter_observations("CPIAUCSL")]
+        return facts, series, observations
+
+    previous = http_client.set_transport(type("Blocking", (), {"request": blocking})())
+    try:
+        facts, series, observations = asyncio.run(run())
+    finally:
+        http_client.set_transport(previous)
+    assert facts == [("dei", "EntityName", {"units": {}})]
+    assert len(series) == 1 and observations[0]["value"] == "3.1"
+    assert sum("company_tickers" in url for url in transport.urls) == 1
+    assert "CIK0000320193" in transport.urls[1]
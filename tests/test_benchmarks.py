@@ -0,0 +1,55 @@
+import copy
+
+import pytest
+
+from aurora_apis import http_client
+from aurora_apis.transport import PooledTransport
+from aurora_core.api_manager import build_clients
+from benchmarks.replay import LatencyModel, RedirectTransport, ReplayServer
+from benchmarks.run import Settings, compare, replay_config, run_benchmarks
+
+
+@pytest.fixture(scope="module")
+def replay():
+    server = ReplayServer(latency=LatencyModel(latency=0.001, jitter=0.0)).start()
+    yield server
+    server.stop()
+
+
+def test_recordings_cover_every_provider(replay):
+    previous = http_client.set_transport(RedirectTransport(PooledTransport(), replay.url))
+    cache = http_client.set_response_cache(None)
+    try:
+        clients = build_clients(replay_config())
+        assert clients.alpha_vantage.get_quote("MSFT")["01. symbol"] == "MSFT"
+        assert clients.benzinga.get_news("MSFT")[0]["stocks"] == [{"name": "MSFT"}]
+        assert clients.sec_edgar.get_company_facts("MSFT")["facts"]["us-gaap"]
+        assert clients.finnhub.get_quote("MSFT")["c"] > 0
+        assert clients.iex.get_quote("MSFT")["symbol"] == "MSFT"
+        assert clients.polygon.get_last_trade("MSFT")["results"]["T"] == "MSFT"
+        assert clients.fred.get_series("CPIAUCSL")["observations"]
+        assert clients.stocktwits.get_symbol_stream("MSFT")["symbol"]["symbol"] == "MSFT"
+        assert clients.tradingeconomics.get_calendar()
+        assert clients.reddit.search_subreddit("stocks", "MSFT")
+    finally:
+        http_client.set_response_cache(cache)
+        http_client.set_transport(previous).close()
+    assert not any(provider == "unmatched" for provider, _ in replay.requests)
+
+
+def test_run_benchmarks_reports_latency_memory_and_breakdown(replay):
+    settings = Settings(iterations=3, warmup=1, memory_iterations=1, batch_size=3)
+    results = run_benchmarks(settings, replay.url, ["snapshot_concurrent", "snapshot_many"])
+
+    many = results["scenarios"]["snapshot_many"]
+    assert many["items_per_op"] == 3
+    assert 0 < many["latency_seconds"]["p50"] <= many["latency_seconds"]["p99"]
+    assert many["memory"]["peak_bytes"] > 0
+    sources = {h["labels"]["source"] for h in many["breakdown"]["aurora_snapshot_source_seconds"]}
+    assert sources == {"quote", "news", "fundamentals"}
+    assert results["meta"]["settings"]["iterations"] == 3
+
+    slower = copy.deepcopy(results)
+    slower["scenarios"]["snapshot_many"]["latency_seconds"]["p50"] *= 2
+    assert compare(results, results, 0.1) == []
+    assert any("snapshot_many: p50" in p for p in compare(results, slower, 0.1))
@@ -0,0 +1,152 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from aurora_core.data_fusion_bus import DataFusionBus
+
+
+class _Quotes:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def get_quote(self, symbol):
+        time.sleep(self.delay)
+        return {"Global Quote": {"01. symbol": symbol, "05. price": "1.00"}}
+
+
+class _News:
+    def get_news(self, symbol, limit=10):
+        return [{"title": f"{symbol} news"}]
+
+
+class _Facts:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def get_company_facts(self, symbol):
+        if self.fail:
+            raise ValueError("no CIK")
+        return {"cik": 1}
+
+
+def _clients(quote_delay=0.0, facts_fail=False):
+    return SimpleNamespace(
+        alpha_vantage=_Quotes(quote_delay),
+        benzinga=_News(),
+        sec_edgar=_Facts(facts_fail),
+    )
+
+
+def test_concurrent_snapshot_is_complete_when_sources_succeed():
+    bus = DataFusionBus(_clients(), concurrent=True)
+    snap = bus.snapshot("AAPL")
+    bus.close()
+    assert snap.quote["symbol"] == "AAPL" and snap.quote["price"] == 1.0
+    assert snap.quote["source"] == "alpha_vantage"
+    assert snap.news == [{"title": "AAPL news"}]
+    assert snap.fundamentals == {"cik": 1}
+    assert not snap.is_partial
+
+
+def test_concurrent_snapshot_marks_failed_and_timed_out_sources():
+    bus = DataFusionBus(
+        _clients(quote_delay=0.5, facts_fail=True),
+        concurrent=True,
+        source_timeouts={"quote": 0.05},
+    )
+    snap = bus.snapshot("AAPL")
+    bus.close()
+    assert snap.missing == ["quote", "fundamentals"]
+    assert snap.errors["quote"] == "timeout"
+    assert snap.errors["fundamentals"].startswith("ValueError")
+    assert snap.news == [{"title": "AAPL news"}]
+
+
+def test_concurrent_snapshot_falls_back_to_stale_values():
+    clients = _clients()
+    bus = DataFusionBus(clients, concurrent=True)
+    bus.snapshot("AAPL")
+    clients.sec_edgar.fail = True
+    snap = bus.snapshot("AAPL")
+    bus.close()
+    assert snap.stale == ["fundamentals"]
+    assert snap.fundamentals == {"cik": 1}
+
+
+def test_snapshot_many_streams_all_symbols_within_provider_caps():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class _SlowQuotes:
+        def get_quote(self, symbol):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return {"Global Quote": {"01. symbol": symbol, "05. price": "1.00"}}
+
+    clients = _clients()
+    clients.alpha_vantage = _SlowQuotes()
+    bus = DataFusionBus(clients, max_workers=6, provider_limits={"alpha_vantage": 2})
+    symbols = [f"S{i}" for i in range(20)]
+    snaps = list(bus.snapshot_many(symbols))
+    bus.close()
+
+    assert sorted(s.symbol for s in snaps) == sorted(symbols)
+    assert all(not s.is_partial for s in snaps)
+    assert active["peak"] <= 2
+
+
+def test_source_timeout_starts_when_the_call_starts():
+    bus = DataFusionBus(_clients(), concurrent=True, max_workers=2, source_timeout=0.1)
+    release = threading.Event()
+    # Another caller occupies the shared pool, so the sources queue first.
+    blockers = [bus._get_executor().submit(release.wait) for _ in range(2)]
+    threading.Timer(0.15, release.set).start()
+    snap = bus.snapshot("AAPL")
+    for blocker in blockers:
+        blocker.result()
+    bus.close()
+    assert not snap.is_partial and snap.errors == {}
+
+
+def test_timed_out_call_retires_its_pool():
+    clients = _clients(quote_delay=0.3)
+    bus = DataFusionBus(clients, concurrent=True, source_timeouts={"quote": 0.05})
+    first = bus._get_executor()
+    assert bus.snapshot("AAPL").errors == {"quote": "timeout"}
+    assert bus._get_executor() is not first
+
+    clients.alpha_vantage.delay = 0.0
+    start = time.monotonic()
+    assert not bus.snapshot("MSFT").is_partial
+    assert time.monotonic() - start < 0.2
+    bus.close()
+
+
+def test_timed_out_quotes_leave_the_rate_limit_queue():
+    from aurora_core.request_scheduler import RateLimit, RequestScheduler
+
+    scheduler = RequestScheduler({"alpha_vantage": RateLimit(4, 1, burst=1)})
+    clients = _clients()
+    fetch = clients.alpha_vantage.get_quote
+
+    def gated_quote(symbol):
+        scheduler.acquire("alpha_vantage")
+        return fetch(symbol)
+
+    clients.alpha_vantage.get_quote = gated_quote
+    bus = DataFusionBus(
+        clients, concurrent=True, source_timeouts={"quote": 0.1}, provider_limits={"alpha_vantage": 6}
+    )
+    snaps = list(bus.snapshot_many(["A", "B", "C", "D", "E", "F"]))
+    assert sum("quote" in s.errors for s in snaps) == 5
+    time.sleep(0.05)
+    assert scheduler.queue_depth("alpha_vantage") == 0
+
+    # The next token goes to the new snapshot, not to an abandoned call.
+    time.sleep(0.2)
+    assert not bus.snapshot("G").is_partial
+    bus.close()
@@ -0,0 +1,97 @@
+from datetime import date
+from types import SimpleNamespace
+
+from aurora_core.economic_calendar import CalendarEvent, EconomicCalendar
+from aurora_core.event_bus import EventBus, Topic
+
+NOW = 1_744_848_000.0 + 8 * 3600  # 2025-04-17T08:00:00Z
+
+
+def row(calendar_id, when, country="United States", importance=3, actual=""):
+    return {
+        "CalendarId": calendar_id,
+        "Date": when,
+        "Country": country,
+        "Category": "Inflation Rate",
+        "Event": f"event {calendar_id}",
+        "Importance": importance,
+        "Actual": actual,
+    }
+
+
+class FakeTradingEconomics:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def get_calendar_range(self, start, end, country=None, importance=None):
+        self.calls.append((start, end, country))
+        return [r for r in self.rows if str(start) <= r["Date"][:10] <= str(end)]
+
+
+def _calendar(rows, clock, **kwargs):
+    te = FakeTradingEconomics(rows)
+    return te, EconomicCalendar(SimpleNamespace(tradingeconomics=te), clock=lambda: clock[0], **kwargs)
+
+
+def test_sync_fetches_only_stale_day_ranges():
+    clock = [NOW]
+    te, cal = _calendar([row("1", "2025-04-17T08:30:00"), row("2", "2025-04-20T12:00:00")], clock)
+
+    assert [e.id for e in cal.sync_ahead(days=5)] == ["1", "2"]
+    assert te.calls == [(date(2025, 4, 16), date(2025, 4, 22), None)]
+
+    # Nothing is stale yet; after near_refresh only yesterday..tomorrow is.
+    assert cal.sync_ahead(days=5) == [] and len(te.calls) == 1
+    clock[0] += 600
+    te.rows[0] = row("1", "2025-04-17T08:30:00", actual="2.4%")
+    changed = cal.sync_ahead(days=5)
+    assert te.calls[-1] == (date(2025, 4, 16), date(2025, 4, 18), None)
+    assert [(e.id, e.actual) for e in changed] == [("1", "2.4%")]
+    assert len(cal) == 2
+
+
+def test_refresh_moves_rescheduled_and_drops_cancelled_events():
+    clock = [NOW]
+    bus = EventBus()
+    sub = bus.subscribe(Topic.MACRO)
+    te, cal = _calendar(
+        [row("1", "2025-04-17T08:30:00"), row("2", "2025-04-17T09:00:00", "Euro Area")],
+        clock,
+        countries=["United States", "Euro Area"],
+        events=bus,
+    )
+    cal.sync(date(2025, 4, 17), date(2025, 4, 17))
+    assert te.calls[0][2] == "United States,Euro Area"
+
+    te.rows = [row("1", "2025-04-17T10:00:00")]
+    clock[0] += 300
+    cal.sync(date(2025, 4, 17), date(2025, 4, 17))
+    assert cal.get("2") is None
+    assert [e.id for e in cal.between(NOW, NOW + 3600)] == []
+    assert [e.id for e in cal.upcoming(120, country="united states")] == ["1"]
+    assert [e.key for e in sub.get_batch(10, timeout=0)] == ["United States", "Euro Area", "United States"]
+
+
+def test_queries_use_time_country_and_importance_indexes():
+    clock = [NOW]
+    _, cal = _calendar([], clock)
+    for event_id, minutes, country, importance in [
+        ("a", 10, "United States", 3),
+        ("b", 20, "Euro Area", 2),
+        ("c", 30, "United States", 1),
+        ("d", 40, "Japan", 3),
+        ("e", -2, "Japan", 3),
+    ]:
+        cal.upsert(CalendarEvent(event_id, NOW + minutes * 60, country, "", "", importance))
+
+    assert [e.id for e in cal.upcoming(35)] == ["a", "b", "c"]
+    assert [e.id for e in cal.upcoming(60, min_importance=2)] == ["a", "b", "d"]
+    assert [e.id for e in cal.upcoming(60, country="UNITED STATES", min_importance=2)] == ["a"]
+    assert cal.next_event(min_importance=3).id == "a"
+    assert cal.next_event(country="Japan").id == "d"
+
+    assert cal.blackout(before=60, after=300).id == "e"
+    clock[0] += 400
+    assert cal.blackout(before=60, after=300) is None
+    assert cal.blackout(before=300, after=300).id == "a"
@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aurora_apis.cik_index import CIKIndex
+from aurora_apis.sec_edgar_client import SECEdgarClient
+
+
+FACTS = {"cik": 320193, "entityName": "Apple Inc.", "facts": {}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    full_downloads = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        type(self).full_downloads += 1
+        body = json.dumps(FACTS).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def client(tmp_path):
+    _Handler.full_downloads = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    client = SECEdgarClient(user_agent="aurora-tests", cache_dir=str(tmp_path))
+    client.COMPANY_FACTS_URL = f"http://127.0.0.1:{srv.server_address[1]}/CIK{{cik:010d}}.json"
+    yield client
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_company_facts_are_revalidated_not_redownloaded(client):
+    assert client.get_company_facts(320193) == FACTS
+    assert client.get_company_facts("320193") == FACTS
+    assert _Handler.full_downloads == 1
+    assert list(client.cache.ciks()) == [320193]
+    assert client.cache.meta(320193).etag == '"v1"'
+
+
+def test_recently_validated_facts_skip_the_network(client):
+    client.revalidate_after = 60
+    client.get_company_facts(320193)
+    client.COMPANY_FACTS_URL = "http://127.0.0.1:9/unreachable/{cik}"
+    assert client.get_company_facts(320193) == FACTS
+
+
+def test_symbols_resolve_through_local_ticker_index(client, tmp_path):
+    tickers = tmp_path / "company_tickers.json"
+    tickers.write_text(
+        json.dumps(
+            {
+                "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+                "1": {"cik_str": 1067983, "ticker": "BRK-B", "title": "Berkshire"},
+            }
+        )
+    )
+    client.cik_index.load_file(tickers)
+    assert client.resolve_cik("brk.b") == 1067983
+    assert client.get_company_facts("AAPL") == FACTS
+    with pytest.raises(ValueError):
+        client.get_company_facts("NOPE")
+
+
+def test_iter_company_facts_streams_and_spools_to_cache(client):
+    facts = {"cik": 1, "facts": {"dei": {"Shares": {"units": {}}}, "us-gaap": {"Rev": {"u": 1}}}}
+    FACTS.update(facts)
+    try:
+        streamed = list(client.iter_company_facts(1))
+        assert streamed == [("dei", "Shares", {"units": {}}), ("us-gaap", "Rev", {"u": 1})]
+        assert client.cache.load(1)["facts"] == facts["facts"]
+        assert list(client.iter_company_facts(1)) == streamed
+        assert _Handler.full_downloads == 1
+    finally:
+        FACTS.clear()
+        FACTS.update({"cik": 320193, "entityName": "Apple Inc.", "facts": {}})
+
+
+def test_stale_index_refreshes_in_background_without_blocking_lookups(tmp_path):
+    release = threading.Event()
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        release.wait(5)
+        return {"0": {"cik_str": 789019, "ticker": "MSFT"}}
+
+    index = CIKIndex(path=tmp_path / "tickers.json", fetch=fetch, refresh_interval=60)
+    index.update({"AAPL": 320193})
+    index._loaded_at -= 120
+
+    start = time.monotonic()
+    assert index.lookup("AAPL") == 320193
+    assert index.lookup("MSFT") is None
+    assert time.monotonic() - start < 1
+    assert index.tickers() == ["AAPL"]
+
+    release.set()
+    index.join_refresh(timeout=5)
+    assert fetches == [1]
+    assert index.lookup("MSFT") == 789019 and not index.is_stale()
+
+
+def test_cold_index_loads_before_resolving(tmp_path):
+    client = SECEdgarClient(user_agent="test", tickers_path=str(tmp_path / "tickers.json"))
+    client.cik_index.fetch = lambda: {"0": {"cik_str": 320193, "ticker": "AAPL"}}
+    assert client.resolve_cik("AAPL") == 320193
+    assert (tmp_path / "tickers.json").exists()
+
+
+def test_async_cache_hits_do_not_block_the_event_loop(client, monkeypatch):
+    import asyncio
+
+    from aurora_apis.sec_edgar_client import AsyncSECEdgarClient
+
+    client.get_company_facts(320193)
+    async_client = AsyncSECEdgarClient(
+        user_agent="aurora-tests", cache_dir=str(client.cache.directory), revalidate_after=60
+    )
+    load = async_client.cache.load
+
+    def slow_load(cik):
+        time.sleep(0.2)
+        return load(cik)
+
+    monkeypatch.setattr(async_client.cache, "load", slow_load)
+
+    async def run():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        facts = await async_client.get_company_facts(320193)
+        beat.cancel()
+        return facts, ticks
+
+    facts, ticks = asyncio.run(run())
+    assert facts == FACTS
+    assert ticks >= 5
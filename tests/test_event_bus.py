@@ -0,0 +1,83 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from aurora_apis.market_stream import Tick
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.event_bus import EventBus, Overflow, Topic
+
+
+def test_drop_oldest_keeps_latest_events():
+    bus = EventBus()
+    sub = bus.subscribe(Topic.QUOTES, maxsize=3)
+    for i in range(5):
+        bus.publish(Topic.QUOTES, i, key="AAPL")
+    bus.publish(Topic.NEWS, "ignored")
+    assert [e.payload for e in sub.get_batch(10, timeout=0)] == [2, 3, 4]
+    assert sub.dropped == 2 and sub.delivered == 3
+
+
+def test_block_policy_waits_for_consumer_then_times_out():
+    bus = EventBus()
+    sub = bus.subscribe("news", maxsize=1, overflow="block", block_timeout=0.05)
+    bus.publish("news", "first")
+
+    threading.Timer(0.01, sub.get).start()
+    bus.publish("news", "second")  # waits until the timer drains "first"
+    assert sub.get(timeout=0).payload == "second"
+
+    bus.publish("news", "third")
+    start = time.monotonic()
+    bus.publish("news", "fourth")  # nobody drains: dropped after block_timeout
+    assert time.monotonic() - start >= 0.05
+    assert sub.dropped == 1
+    assert [e.payload for e in sub.get_batch(timeout=0)] == ["third"]
+
+
+def test_handler_receives_batches_filtered_by_key():
+    bus = EventBus()
+    batches = []
+    done = threading.Event()
+
+    def handler(batch):
+        batches.append([e.payload for e in batch])
+        if sum(map(len, batches)) == 4:
+            done.set()
+
+    sub = bus.subscribe_handler(
+        [Topic.SOCIAL], handler, batch_size=2, linger=0.05, keys={"GME"}
+    )
+    for i in range(6):
+        bus.publish(Topic.SOCIAL, i, key="GME" if i != 2 and i != 4 else "AMC")
+    assert done.wait(2)
+    bus.unsubscribe(sub)
+    assert [p for b in batches for p in b] == [0, 1, 3, 5]
+    assert all(len(b) <= 2 for b in batches)
+    assert bus.stats()["published"]["social"] == 6
+
+
+def test_fusion_bus_publishes_live_quotes():
+    fusion = DataFusionBus(SimpleNamespace())
+    sub = fusion.events.subscribe(Topic.QUOTES, overflow=Overflow.DROP_OLDEST)
+    fusion.publish_tick(Tick("AAPL", "trade", 1.0, "polygon", price=200.0, size=5))
+    event = sub.get(timeout=1)
+    assert event.key == "AAPL" and event.payload["price"] == 200.0
+
+
+def test_blocked_quote_subscriber_does_not_stall_ticks():
+    fusion = DataFusionBus(SimpleNamespace())
+    sub = fusion.events.subscribe(Topic.QUOTES, maxsize=1, overflow=Overflow.BLOCK)
+    start = time.monotonic()
+    for i in range(50):
+        fusion.publish_tick(Tick("AAPL", "trade", float(i), "polygon", price=100.0 + i, size=1))
+    assert time.monotonic() - start < 0.5
+    assert fusion.live_quote("AAPL")["price"] == 149.0
+
+    # Updates queued behind the blocked subscriber collapse to the newest.
+    seen = []
+    while not fusion.flush(timeout=0.01):
+        seen.append(sub.get(timeout=1).payload["price"])
+    seen.extend(e.payload["price"] for e in sub.get_batch(timeout=0))
+    assert seen[-1] == 149.0 and len(seen) < 50
+    assert fusion.conflated > 0
+    fusion.close()
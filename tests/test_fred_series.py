@@ -0,0 +1,131 @@
+import math
+from datetime import date, timedelta
+
+import pytest
+
+from aurora_apis.fred_series import FREDSeries, align, from_epoch_day, to_epoch_day
+from aurora_apis.fred_store import FREDStore
+
+
+def _series(series_id, rows):
+    return FREDSeries.from_observations(
+        series_id, [{"date": d, "value": v} for d, v in rows]
+    )
+
+
+def test_parses_dates_and_missing_marker():
+    s = _series("DGS10", [("2024-01-02", "3.95"), ("2024-01-03", ".")])
+    assert len(s) == 2
+    assert s[0] == (date(2024, 1, 2), 3.95)
+    assert math.isnan(s.values[1])
+    assert s.nbytes == 32
+
+
+def test_slice_and_asof_lookup():
+    s = _series("X", [(f"2024-01-{d:02d}", str(d)) for d in range(1, 11)])
+    assert list(s.slice("2024-01-03", "2024-01-05").values) == [3.0, 4.0, 5.0]
+    assert s.value_at(date(2024, 2, 1)) == 10.0
+    assert math.isnan(s.value_at("2023-12-31"))
+
+
+def test_resample_monthly_ignores_nan():
+    s = _series("X", [("2024-01-15", "1"), ("2024-01-31", "."), ("2024-02-01", "4"), ("2024-02-29", "6")])
+    monthly = s.resample("M", how="last")
+    assert [d for d, _ in (monthly[i] for i in range(len(monthly)))] == [date(2024, 1, 1), date(2024, 2, 1)]
+    assert list(monthly.values) == [1.0, 6.0]
+    assert list(s.resample("M", how="mean").values) == [1.0, 5.0]
+
+
+def test_align_inner_and_outer():
+    a = _series("A", [("2024-01-01", "1"), ("2024-01-02", "2")])
+    b = _series("B", [("2024-01-02", "20"), ("2024-01-03", "30")])
+    dates, (va, vb) = align([a, b])
+    assert len(dates) == 1 and list(va) == [2.0] and list(vb) == [20.0]
+    dates, (va, vb) = align([a, b], how="outer")
+    assert len(dates) == 3
+    assert math.isnan(va[2]) and math.isnan(vb[0])
+
+
+class _FakeFRED:
+    """
+    Rows are (date, value) or, with vintages, (date, value, realtime_start,
+    realtime_end); a real-time request clips them like FRED does.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def iter_observations(self, series_id, **params):
+        self.calls.append(params)
+        start = params.get("observation_start", "")
+        realtime_start = params.get("realtime_start", "")
+        for row in self.rows:
+            if row[0] < start:
+                continue
+            if len(row) == 2:
+                yield {"date": row[0], "value": row[1]}
+                continue
+            day, value, first, last = row
+            if last >= realtime_start:
+                yield {
+                    "date": day,
+                    "value": value,
+                    "realtime_start": max(first, realtime_start),
+                    "realtime_end": last,
+                }
+
+
+def test_store_sync_fetches_only_new_observations(tmp_path):
+    store = FREDStore(tmp_path)
+    client = _FakeFRED([("2024-01-01", "1"), ("2024-02-01", "2")])
+    assert store.sync(client, "CPIAUCSL") == 2
+
+    client.rows = [("2024-01-01", "1"), ("2024-02-01", "2.5"), ("2024-03-01", "3")]
+    assert store.sync(client, "CPIAUCSL") == 2
+    assert client.calls[-1]["observation_start"] == "2024-02-01"
+
+    series = store.load("CPIAUCSL")
+    assert list(series.values) == [1.0, 2.5, 3.0]
+    assert series.vintages is None
+    assert store.metadata("CPIAUCSL")["last_date"] == "2024-03-01"
+
+
+def test_store_tracks_vintages_across_syncs(tmp_path):
+    store = FREDStore(tmp_path)
+    today = date.today().isoformat()
+    later = (date.today() + timedelta(days=1)).isoformat()
+    client = _FakeFRED([
+        ("2024-01-01", "100", "2024-04-25", "2024-05-29"),
+        ("2024-01-01", "101", "2024-05-30", "9999-12-31"),
+        ("2024-04-01", "200", "2024-07-30", "9999-12-31"),
+    ])
+    assert store.sync(client, "GDP", full_history=True) == 3
+    assert client.calls[-1]["realtime_start"] == "1776-07-04"
+
+    # A revision and a new observation published after the last sync.
+    client.rows[2] = ("2024-04-01", "200", "2024-07-30", today)
+    client.rows += [
+        ("2024-04-01", "210", later, "9999-12-31"),
+        ("2024-07-01", "300", later, "9999-12-31"),
+    ]
+    assert store.sync(client, "GDP") == 3
+    assert client.calls[-1]["realtime_start"] == today
+
+    current = store.load("GDP")
+    assert list(current.values) == [101.0, 210.0, 300.0]
+    assert current.vintages[0] == to_epoch_day("2024-05-30")
+    assert [(from_epoch_day(d), v, from_epoch_day(s)) for d, v, s, _ in store.revisions("GDP")] == [
+        (date(2024, 1, 1), 100.0, date(2024, 4, 25)),
+        (date(2024, 4, 1), 200.0, date(2024, 7, 30)),
+    ]
+    assert list(store.as_of("GDP", "2024-05-01").values) == [100.0]
+    assert list(store.as_of("GDP", "2024-06-01").values) == [101.0]
+    assert list(store.as_of("GDP", "2025-01-01").values) == [101.0, 200.0]
+
+
+def test_merge_rejects_mixed_vintages():
+    stored = _series("X", [("2024-01-01", "1")])
+    update = FREDSeries("X", [to_epoch_day("2024-02-01")], [2.0], [to_epoch_day("2024-03-01")])
+    with pytest.raises(ValueError):
+        FREDStore.merge(stored, update)
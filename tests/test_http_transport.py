@@ -0,0 +1,74 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import error
+
+import pytest
+
+from aurora_apis import http_client
+from aurora_apis.transport import PooledTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        if self.path.startswith("/missing"):
+            body = b'{"error": "nope"}'
+            self.send_response(404)
+        else:
+            body = json.dumps({"path": self.path}).encode()
+            self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def transport():
+    transport = PooledTransport(max_connections_per_host=2)
+    previous = http_client.set_transport(transport)
+    yield transport
+    http_client.set_transport(previous)
+    transport.close()
+
+
+def test_http_get_reuses_keep_alive_connection(server, transport):
+    for i in range(5):
+        assert http_client.http_get(f"{server}/q", params={"i": i}) == {"path": f"/q?i={i}"}
+    assert len(_Handler.connections) == 1
+    assert sum(transport.idle_connections().values()) == 1
+
+
+def test_http_get_raises_http_error(server, transport):
+    with pytest.raises(error.HTTPError) as excinfo:
+        http_client.http_get(f"{server}/missing")
+    assert excinfo.value.code == 404
+
+
+def test_idle_connections_are_evicted(server, transport):
+    http_client.http_get(f"{server}/q")
+    transport.idle_timeout = 0
+    assert transport.evict_idle() == 1
+    assert sum(transport.idle_connections().values()) == 0
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from aurora_apis.json_stream import WILDCARD, iter_items, iter_values
+
+
+DOC = {
+    "cik": 320193,
+    "facts": {
+        "dei": {"EntityShares": {"units": {"shares": [{"val": 1}]}}},
+        "us-gaap": {"Revenues": {"label": "Revénue \"q\""}, "NetIncome": {}},
+    },
+    "observations": [{"date": f"2020-01-{d:02d}", "value": str(d * 1.5)} for d in range(1, 20)]
+    + [123456789, -0.25e-3, None, True],
+}
+
+
+def _chunks(size):
+    raw = json.dumps(DOC).encode()
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 17, 4096])
+def test_items_survive_any_chunk_boundary(size):
+    assert list(iter_values(_chunks(size), ["observations"])) == DOC["observations"]
+    items = list(iter_items(_chunks(size), ["facts", WILDCARD]))
+    assert [k for k, _ in items] == [
+        ("facts", "dei", "EntityShares"),
+        ("facts", "us-gaap", "Revenues"),
+        ("facts", "us-gaap", "NetIncome"),
+    ]
+    assert items[1][1] == DOC["facts"]["us-gaap"]["Revenues"]
+
+
+def test_top_level_array_and_missing_path():
+    assert list(iter_values([b"[1, {\"a\": ", b"2}, []]"])) == [1, {"a": 2}, []]
+    assert list(iter_values(_chunks(64), ["nope"])) == []
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        list(iter_values([b'{"observations": [1, 2'], ["observations"]))
@@ -0,0 +1,208 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from aurora_apis.market_stream import FinnhubStream, PolygonStream
+from aurora_apis.websocket import OP_TEXT, accept_key, encode_frame, read_frame
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.stream_ingestor import StreamIngestor
+
+
+class _MockPolygonServer:
+    """
+    Minimal Polygon-style WebSocket server: auth, subscribe, a few ticks,
+    and an abrupt disconnect after the first session. With `first` set to
+    "silent" the first session goes quiet after subscribing (a half-open
+    connection); with "no_auth" it never acknowledges the login.
+    """
+
+    def __init__(self, first="drop"):
+        self.first = first
+        self.subscriptions = []
+        self.sessions = 0
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+        self.ready.wait(5)
+
+    def _serve(self):
+        asyncio.set_event_loop(self.loop)
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        self.loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        head = (await reader.readuntil(b"\r\n\r\n")).decode()
+        key = next(
+            line.split(":", 1)[1].strip()
+            for line in head.split("\r\n")
+            if line.lower().startswith("sec-websocket-key:")
+        )
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+
+        def send(obj):
+            writer.write(encode_frame(OP_TEXT, json.dumps(obj).encode(), mask=False))
+
+        async def recv():
+            _, _, payload = await read_frame(reader, 1 << 20)
+            return json.loads(payload)
+
+        send([{"ev": "status", "status": "connected"}])
+        assert (await recv())["action"] == "auth"
+        if self.first == "no_auth" and not self.sessions:
+            self.sessions += 1
+            await self._ignore(reader, writer)
+            return
+        send([{"ev": "status", "status": "auth_success"}])
+        self.subscriptions.append((await recv())["params"])
+        self.sessions += 1
+
+        if self.sessions == 1 and self.first == "silent":
+            await self._ignore(reader, writer)
+            return
+        if self.sessions == 1:
+            send([
+                {"ev": "Q", "sym": "AAPL", "bp": 199.9, "ap": 200.1, "bs": 3, "as": 5, "t": 1},
+                {"ev": "T", "sym": "AAPL", "p": 200.0, "s": 100, "t": 2},
+            ])
+            await writer.drain()
+            writer.close()  # drop the connection without a close frame
+            return
+        send([{"ev": "T", "sym": "AAPL", "p": 201.5, "s": 10, "t": 3}])
+        await writer.drain()
+        try:
+            await read_frame(reader, 1 << 20)
+        except ConnectionError:
+            pass
+        writer.close()
+
+    @staticmethod
+    async def _ignore(reader, writer):
+        # Swallow frames (pings included) without answering until EOF.
+        try:
+            while True:
+                await read_frame(reader, 1 << 20)
+        except ConnectionError:
+            pass
+        writer.close()
+
+    def close(self):
+        async def shutdown():
+            self.server.close()
+            handlers = asyncio.all_tasks() - {asyncio.current_task()}
+            if handlers:
+                await asyncio.wait(handlers, timeout=1)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+class _NoQuotes:
+    calls = 0
+
+    def get_quote(self, symbol):
+        type(self).calls += 1
+        raise AssertionError("REST quote should not be called")
+
+
+def test_stream_reconnects_resubscribes_and_feeds_snapshots():
+    server = _MockPolygonServer()
+    clients = SimpleNamespace(
+        alpha_vantage=_NoQuotes(),
+        benzinga=SimpleNamespace(get_news=lambda symbol, limit=10: []),
+        sec_edgar=SimpleNamespace(get_company_facts=lambda symbol: {"cik": 1}),
+    )
+    bus = DataFusionBus(clients, concurrent=True, tick_max_age=30)
+    stream = PolygonStream(
+        "key", bus.publish_tick, url=f"ws://127.0.0.1:{server.port}", reconnect_delay=0.01
+    )
+    ingestor = StreamIngestor(bus, [stream])
+    ingestor.start()
+    try:
+        ingestor.subscribe(["aapl"])
+        deadline = time.monotonic() + 5
+        while (bus.live_quote("AAPL") or {}).get("price") != 201.5:
+            assert time.monotonic() < deadline, bus.live_quote("AAPL")
+            time.sleep(0.01)
+
+        assert server.subscriptions == ["T.AAPL,Q.AAPL", "T.AAPL,Q.AAPL"]
+        assert ingestor.stats()["polygon"]["connects"] == 2
+
+        snap = bus.snapshot("AAPL")
+        assert snap.quote["price"] == 201.5
+        assert snap.quote["bid"] == 199.9 and snap.quote["source"] == "polygon"
+        assert not snap.is_partial
+        assert _NoQuotes.calls == 0
+    finally:
+        ingestor.stop()
+        bus.close()
+        server.close()
+
+
+def _run_until_second_session(server, **kwargs):
+    ticks, errors = [], []
+    stream = PolygonStream(
+        "key",
+        ticks.append,
+        url=f"ws://127.0.0.1:{server.port}",
+        on_disconnect=lambda stream, exc: errors.append(exc),
+        reconnect_delay=0.01,
+        **kwargs,
+    )
+
+    async def main():
+        await stream.subscribe(["AAPL"])
+        task = asyncio.create_task(stream.run())
+        deadline = time.monotonic() + 5
+        while not ticks:
+            assert time.monotonic() < deadline, errors
+            await asyncio.sleep(0.01)
+        await stream.close()
+        await task
+
+    asyncio.run(main())
+    return stream, ticks, errors
+
+
+def test_idle_watchdog_reconnects_half_open_connection():
+    server = _MockPolygonServer(first="silent")
+    try:
+        stream, ticks, errors = _run_until_second_session(server, idle_timeout=0.05, pong_timeout=0.05)
+    finally:
+        server.close()
+    assert [type(e) for e in errors] == [TimeoutError]
+    assert stream.stats["timeouts"] == 1 and stream.stats["connects"] == 2
+    assert ticks[0].price == 201.5
+
+
+def test_unacknowledged_auth_times_out_and_reconnects():
+    server = _MockPolygonServer(first="no_auth")
+    try:
+        stream, ticks, errors = _run_until_second_session(server, connect_timeout=0.1)
+    finally:
+        server.close()
+    assert [type(e) for e in errors] == [asyncio.TimeoutError]
+    assert stream.stats["connects"] == 1 and server.subscriptions == ["T.AAPL,Q.AAPL"]
+
+
+def test_stale_live_quote_falls_back_to_rest():
+    bus = DataFusionBus(SimpleNamespace(), tick_max_age=0.0)
+    stream = FinnhubStream("key", bus.publish_tick)
+    for tick in stream._parse({"type": "trade", "data": [{"s": "MSFT", "p": 410.2, "v": 5, "t": 1000}]}):
+        bus.publish_tick(tick)
+    time.sleep(0.01)
+    assert bus.live_quote("MSFT") is None
+    bus.tick_max_age = 60
+    assert bus.live_quote("MSFT") == {
+        "symbol": "MSFT", "price": 410.2, "size": 5, "trade_time": 1.0, "source": "finnhub"
+    }
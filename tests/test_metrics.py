@@ -0,0 +1,114 @@
+import json
+import time
+from types import SimpleNamespace
+from urllib import error, request
+
+import pytest
+
+from aurora_apis import http_client, metrics
+from aurora_apis.iex_client import IEXClient
+from aurora_apis.metrics import MetricsRegistry
+from aurora_apis.response_cache import ResponseCache
+from aurora_apis.transport import HTTPResponse, Transport
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.telemetry import MetricsServer, SamplingProfiler
+
+
+class _Transport(Transport):
+    def request(self, method, url, body=None, headers=None, timeout=10):
+        return HTTPResponse(200, "OK", {}, b'{"symbol": "AAPL", "latestPrice": 1.5}', url)
+
+
+@pytest.fixture
+def registry():
+    previous = metrics.set_metrics(MetricsRegistry())
+    transport = http_client.set_transport(_Transport())
+    yield metrics.get_metrics()
+    metrics.set_metrics(previous)
+    http_client.set_transport(transport)
+
+
+def test_client_calls_record_latency_bytes_and_cache_hits(registry):
+    previous_cache = http_client.set_response_cache(ResponseCache())
+    try:
+        client = IEXClient(api_token="t")
+        for _ in range(3):
+            client.get_quote("AAPL")
+        snapshot = json.loads(registry.to_json())
+    finally:
+        http_client.set_response_cache(previous_cache)
+
+    host = "cloud.iexapis.com"
+    assert registry.histogram("aurora_http_request_seconds", host=host, method="GET").count == 1
+    assert registry.value("aurora_http_requests_total", host=host, method="GET", status="200") == 1
+    assert registry.value("aurora_http_received_bytes_total", host=host) == 38
+    calls = registry.histogram("aurora_client_call_seconds", provider="iex", method="get_quote")
+    assert calls.count == 3
+    assert registry.value("aurora_client_in_flight", provider="iex", method="get_quote") == 0
+    assert snapshot["gauges"]["aurora_cache_hit_ratio"][0]["value"] == pytest.approx(2 / 3)
+
+    text = registry.to_prometheus()
+    assert "# TYPE aurora_client_call_seconds histogram" in text
+    assert 'aurora_client_call_seconds_count{method="get_quote",provider="iex"} 3' in text
+    assert 'le="+Inf"' in text
+
+
+def test_failing_client_call_counts_an_error(registry):
+    with pytest.raises(RuntimeError):
+        IEXClient(api_token="").get_quote("AAPL")
+    assert registry.value("aurora_client_errors_total", provider="iex", method="get_quote") == 1
+
+
+def test_snapshot_records_per_source_timings(registry):
+    class _Slow:
+        def get_quote(self, symbol):
+            time.sleep(0.02)
+            return {"price": "1"}
+
+    clients = SimpleNamespace(
+        alpha_vantage=_Slow(),
+        benzinga=SimpleNamespace(get_news=lambda symbol, limit=10: []),
+        sec_edgar=SimpleNamespace(get_company_facts=lambda symbol: {}),
+    )
+    bus = DataFusionBus(clients, concurrent=True)
+    bus.snapshot("AAPL")
+    bus.close()
+    quote = registry.histogram(
+        "aurora_snapshot_source_seconds", source="quote", provider="alpha_vantage"
+    )
+    assert quote.count == 1 and quote.sum >= 0.02
+    assert registry.histogram("aurora_snapshot_seconds", mode="concurrent").count == 1
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    hist = metrics.Histogram((0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        hist.observe(value)
+    assert hist.quantile(0.5) == pytest.approx(0.15)
+    assert hist.cumulative()[-1] == (float("inf"), 4)
+
+
+def test_metrics_server_and_profiler():
+    server = MetricsServer(port=0, registry=MetricsRegistry()).start()
+    try:
+        server.registry.inc("aurora_test_total", 2, kind="x")
+        with request.urlopen(f"{server.url}/metrics", timeout=5) as resp:
+            assert 'aurora_test_total{kind="x"} 2' in resp.read().decode()
+        with request.urlopen(f"{server.url}/metrics.json", timeout=5) as resp:
+            assert json.load(resp)["counters"]["aurora_test_total"][0]["value"] == 2
+        for query in ("interval=0", "interval=-1", "interval=nan", "seconds=-1"):
+            with pytest.raises(error.HTTPError) as exc:
+                request.urlopen(f"{server.url}/profile?{query}", timeout=5)
+            assert exc.value.code == 400
+    finally:
+        server.stop()
+
+    def busy_loop():
+        end = time.monotonic() + 0.1
+        while time.monotonic() < end:
+            pass
+
+    with SamplingProfiler(interval=0.001) as profiler:
+        busy_loop()
+    assert profiler.samples > 0
+    assert "busy_loop" in profiler.collapsed()
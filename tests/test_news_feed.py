@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.event_bus import EventBus, Topic
+from aurora_core.news_feed import NewsPoller, NewsStore, _timestamp
+
+NOW = 1_744_920_000.0  # Thu, 17 Apr 2025 20:00:00 GMT
+
+
+def story(story_id, minute, tickers, revision=0, title=None, updated=None):
+    updated = minute if updated is None else updated
+    return {
+        "id": story_id,
+        "created": f"Thu, 17 Apr 2025 14:{minute:02d}:00 -0400",
+        "updated": f"Thu, 17 Apr 2025 14:{updated:02d}:{revision:02d} -0400",
+        "title": title or f"story {story_id}",
+        "stocks": [{"name": t} for t in tickers],
+    }
+
+
+class FakeBenzinga:
+    def __init__(self, stories):
+        self.stories = stories
+        self.calls = []
+
+    def get_news_updates(self, tickers, updated_since, page=0, page_size=100):
+        self.calls.append((tickers, updated_since, page))
+        matching = sorted(
+            (
+                s for s in self.stories
+                if _timestamp(s["updated"]) >= updated_since
+                and (tickers is None or {x["name"] for x in s["stocks"]} & set(tickers))
+            ),
+            key=lambda s: _timestamp(s["updated"]),
+        )
+        return matching[page * page_size:(page + 1) * page_size]
+
+
+def test_store_indexes_by_ticker_and_revises_in_place():
+    store = NewsStore()
+    assert store.upsert(story(1, 0, ["AAPL"]))
+    assert store.upsert(story(2, 5, ["AAPL", "MSFT"]))
+    assert store.upsert(story(3, 2, ["MSFT"]))
+    assert not store.upsert(story(2, 5, ["AAPL", "MSFT"]))
+
+    assert [s["id"] for s in store.latest("aapl")] == [2, 1]
+    assert [s["id"] for s in store.latest("MSFT", limit=1)] == [2]
+
+    # The revision drops MSFT and keeps its place by creation time.
+    assert store.upsert(story(2, 5, ["AAPL"], revision=30, title="corrected"))
+    assert [s["id"] for s in store.latest("MSFT")] == [3]
+    assert store.latest("AAPL")[0]["title"] == "corrected"
+    assert store.stats() == {"stories": 3, "tickers": 2, "inserted": 3, "revised": 1, "unchanged": 1}
+
+
+def test_store_evicts_least_recently_stored():
+    store = NewsStore(max_items=2)
+    for i in range(3):
+        store.upsert(story(i, i, ["AAPL"]))
+    assert 0 not in store and len(store) == 2
+    assert [s["id"] for s in store.latest("AAPL")] == [2, 1]
+
+
+def test_poller_batches_tickers_and_advances_cursor():
+    benzinga = FakeBenzinga([story(1, 0, ["AAPL"]), story(2, 1, ["MSFT"]), story(3, 2, ["TSLA"])])
+    bus = EventBus()
+    sub = bus.subscribe(Topic.NEWS)
+    poller = NewsPoller(
+        SimpleNamespace(benzinga=benzinga),
+        tickers=["aapl", "MSFT", "TSLA"],
+        batch_size=2,
+        page_size=1,
+        events=bus,
+        clock=lambda: NOW,
+    )
+    assert poller.batches == [("AAPL", "MSFT"), ("TSLA",)]
+
+    assert len(poller.poll()) == 3
+    first_cursor = poller.cursors[("AAPL", "MSFT")]
+    assert benzinga.calls[:3] == [
+        (("AAPL", "MSFT"), int(NOW - 24 * 3600), 0),
+        (("AAPL", "MSFT"), int(NOW - 24 * 3600), 1),
+        (("AAPL", "MSFT"), int(NOW - 24 * 3600), 2),
+    ]
+
+    benzinga.stories.append(story(1, 0, ["AAPL"], updated=3))
+    benzinga.calls.clear()
+    changed = poller.poll()
+    assert [s["id"] for s in changed] == [1]
+    assert benzinga.calls[0] == (("AAPL", "MSFT"), first_cursor, 0)
+    assert poller.store.stats()["revised"] == 1
+
+    assert [e.key for e in sub.get_batch(10, timeout=0)] == ["AAPL", "MSFT", "TSLA", "AAPL"]
+
+
+def test_snapshot_reads_news_from_store():
+    store = NewsStore()
+    store.upsert(story(7, 0, ["AAPL"]))
+
+    def no_news(*args, **kwargs):
+        raise AssertionError("per-symbol news query")
+
+    clients = SimpleNamespace(
+        alpha_vantage=SimpleNamespace(get_quote=lambda symbol: {"05. price": "1.00"}),
+        benzinga=SimpleNamespace(get_news=no_news),
+        sec_edgar=SimpleNamespace(get_company_facts=lambda symbol: {}),
+    )
+    bus = DataFusionBus(clients, news_store=store)
+    assert [s["id"] for s in bus.snapshot("AAPL").news] == [7]
@@ -0,0 +1,143 @@
+import gzip
+import math
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aurora_apis.polygon_client import PolygonClient
+from aurora_apis.polygon_flatfiles import DATASETS, MISSING_INT, FlatFileStore
+
+
+MINUTE_AGGS = (
+    "ticker,volume,open,close,high,low,window_start,transactions\n"
+    "AAPL,4930,200.29,200.5,200.63,200.29,1744792500000000000,129\n"
+    "MSFT,1815,388.1,388.2,388.3,388.0,1744792500000000000,57\n"
+    "AAPL,1815,200.39,200.34,200.61,200.34,1744792560000000000,\n"
+)
+OBJECTS = {
+    "/flatfiles/us_stocks_sip/minute_aggs_v1/2025/04/2025-04-16.csv.gz": gzip.compress(
+        MINUTE_AGGS.encode()
+    ),
+}
+LISTING = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    "<IsTruncated>false</IsTruncated>"
+    "<Contents><Key>us_stocks_sip/minute_aggs_v1/2025/04/2025-04-16.csv.gz</Key>"
+    "<Size>120</Size></Contents></ListBucketResult>"
+)
+
+
+class _S3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+        if not self.headers.get("Authorization", "").startswith("AWS4-HMAC-SHA256 "):
+            return self._send(403)
+        if self.path.startswith("/flatfiles?"):
+            return self._send(200, LISTING.encode())
+        body = OBJECTS.get(self.path)
+        if body is None:
+            return self._send(404)
+        self._send(200, body)
+
+
+@pytest.fixture
+def flat_files():
+    _S3Handler.requests = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _S3Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    client = PolygonClient(
+        access_key_id="key",
+        secret_access_key="secret",
+        s3_endpoint=f"http://127.0.0.1:{srv.server_address[1]}",
+    )
+    yield client.flat_files()
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_backfill_writes_one_file_per_day(flat_files, tmp_path):
+    store = FlatFileStore(tmp_path)
+    loaded = flat_files.backfill(store, "minute_aggs", date(2025, 4, 16), date(2025, 4, 20))
+
+    # Only the 16th has a file; the weekend is never requested.
+    assert loaded == {date(2025, 4, 16): 3}
+    assert len(_S3Handler.requests) == 3
+    assert store.symbols("minute_aggs", date(2025, 4, 16)) == ["AAPL", "MSFT"]
+    day_dir = store.day_dir("minute_aggs", date(2025, 4, 16))
+    assert sorted(p.name for p in day_dir.iterdir()) == ["_index.json", "data.col"]
+
+    aapl = store.load("minute_aggs", date(2025, 4, 16), "AAPL", ["close", "transactions"])
+    assert list(aapl["close"]) == [200.5, 200.34]
+    assert list(aapl["transactions"]) == [129, MISSING_INT]
+
+    # Loaded days and past days with no file are skipped on the next run.
+    assert store.is_missing("minute_aggs", date(2025, 4, 17))
+    assert not any(p.name.startswith(".tmp-") for p in (tmp_path / "minute_aggs").iterdir())
+    assert flat_files.backfill(store, "minute_aggs", date(2025, 4, 16), date(2025, 4, 20)) == {}
+    assert len(_S3Handler.requests) == 3
+
+
+def test_recent_missing_day_is_not_marked(flat_files, tmp_path):
+    store = FlatFileStore(tmp_path)
+    assert flat_files.load_day(store, "minute_aggs", date.today()) is None
+    assert not store.is_missing("minute_aggs", date.today())
+
+
+def test_interleaved_runs_and_text_columns_across_flushes(tmp_path):
+    store = FlatFileStore(tmp_path)
+    header = ["ticker", "conditions", "id", "price", "size"]
+    rows = [
+        ["AAPL", "12,37", "a1", "1.5", "100"],
+        ["MSFT", "", "m1", "2.5", "200"],
+        ["AAPL", "é", "a2", "1.6", "300"],
+        ["MSFT", "41", "m2", "2.6", "400"],
+        ["MSFT", "14", "m3", "2.7", "500"],
+    ]
+    day = date(2025, 4, 16)
+    counts = store.write_day(DATASETS["trades"], day, [header] + rows, flush_rows=2)
+    assert counts == {"AAPL": 2, "MSFT": 3}
+
+    msft = store.load("trades", day, "MSFT")
+    assert msft["conditions"] == ["", "41", "14"]
+    assert msft["id"] == ["m1", "m2", "m3"]
+    assert list(msft["price"]) == [2.5, 2.6, 2.7]
+    aapl = store.load("trades", day, "AAPL", ["conditions", "size"])
+    assert aapl["conditions"] == ["12,37", "é"]
+    assert list(aapl["size"]) == [100, 300]
+    with pytest.raises(ValueError):
+        store.load("trades", day, "TSLA")
+
+    with pytest.raises(ValueError):
+        store.write_day(DATASETS["trades"], date(2025, 4, 17), [["price", "size"]])
+    assert sorted(p.name for p in (tmp_path / "trades").iterdir()) == ["date=2025-04-16"]
+
+
+def test_symbol_filter_and_listing(flat_files, tmp_path):
+    store = FlatFileStore(tmp_path)
+    counts = flat_files.load_day(store, "minute_aggs", date(2025, 4, 16), symbols=["MSFT"])
+    assert counts == {"MSFT": 1}
+    msft = store.load("minute_aggs", date(2025, 4, 16), "MSFT")
+    assert msft["volume"][0] == 1815 and not math.isnan(msft["low"][0])
+    assert flat_files.available_days("minute_aggs", 2025, 4) == [date(2025, 4, 16)]
+
+
+def test_flat_files_require_s3_credentials(monkeypatch):
+    monkeypatch.delenv("POLYGON_ACCESS_KEY_ID", raising=False)
+    monkeypatch.delenv("POLYGON_SECRET_ACCESS_KEY", raising=False)
+    with pytest.raises(RuntimeError):
+        PolygonClient(api_key="x").flat_files()
@@ -0,0 +1,76 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aurora_core.data_fusion_bus import DataFusionBus
+from aurora_core.quote_router import QuoteRouter, QuoteUnavailable
+from aurora_core.snapshot_models import Quote
+
+
+def _fetcher(delay, price=100.0, fail=False):
+    def fetch(clients, symbol):
+        time.sleep(delay)
+        if fail:
+            raise RuntimeError("boom")
+        return Quote(symbol, "fake", price=price)
+
+    return fetch
+
+
+def test_hedge_fires_after_default_delay_and_first_answer_wins():
+    router = QuoteRouter(
+        SimpleNamespace(),
+        providers=["slow", "fast"],
+        fetchers={"slow": _fetcher(1.0, price=1.0), "fast": _fetcher(0.01, price=2.0)},
+        default_hedge_delay=0.05,
+    )
+    start = time.monotonic()
+    quote = router.get_quote("AAPL")
+    assert quote.price == 2.0
+    assert time.monotonic() - start < 0.5
+    stats = router.stats()
+    assert stats["fast"]["hedged"] == 1 and stats["fast"]["wins"] == 1
+    router.close()
+
+
+def test_profiles_rerank_and_failures_fail_over():
+    router = QuoteRouter(
+        SimpleNamespace(),
+        providers=["broken", "zero", "ok"],
+        fetchers={
+            "broken": _fetcher(0, fail=True),
+            "zero": _fetcher(0, price=0.0),  # e.g. Finnhub's c=0 for unknown symbols
+            "ok": _fetcher(0.005),
+        },
+        max_in_flight=1,
+        default_hedge_delay=10,
+    )
+    assert router.get_quote("AAPL").price == 100.0
+    assert router.stats()["broken"]["error_rate"] == 1.0
+    assert router.ranked()[0] == "ok"
+    router.close()
+
+    dead = QuoteRouter(
+        SimpleNamespace(), providers=["broken"], fetchers={"broken": _fetcher(0, fail=True)}
+    )
+    with pytest.raises(QuoteUnavailable) as info:
+        dead.get_quote("AAPL")
+    assert "boom" in info.value.errors["broken"]
+    dead.close()
+
+
+def test_fusion_bus_uses_router_for_quotes():
+    router = QuoteRouter(
+        SimpleNamespace(), providers=["ok"], fetchers={"ok": _fetcher(0, price=42.0)}
+    )
+    clients = SimpleNamespace(
+        benzinga=SimpleNamespace(get_news=lambda symbol, limit=10: []),
+        sec_edgar=SimpleNamespace(get_company_facts=lambda symbol: {}),
+    )
+    bus = DataFusionBus(clients, concurrent=True, quote_router=router)
+    snap = bus.snapshot("AAPL")
+    assert snap.quote["price"] == 42.0
+    assert snap.normalized().quote.price == 42.0
+    bus.close()
+    router.close()
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from aurora_core.config import APIConfig
+from aurora_core.request_scheduler import (
+    Priority,
+    RateLimit,
+    RequestScheduler,
+    parse_rate_limits,
+)
+
+
+def test_parse_rate_limits():
+    limits = parse_rate_limits("sec_edgar=10/s, alpha_vantage=75/min, finnhub=30/s:60")
+    assert limits["sec_edgar"].rate == 10
+    assert limits["alpha_vantage"].rate == pytest.approx(75 / 60)
+    assert limits["finnhub"].capacity == 60
+    with pytest.raises(ValueError):
+        parse_rate_limits("sec_edgar=10/fortnight")
+
+
+def test_from_config_overrides_defaults():
+    scheduler = RequestScheduler.from_config(APIConfig(rate_limits="sec_edgar=2/s"))
+    assert scheduler.stats()["sec_edgar"]["rate_per_second"] == 2
+    assert "alpha_vantage" in scheduler.stats()
+
+
+def test_acquire_never_exceeds_rate():
+    scheduler = RequestScheduler({"p": RateLimit(50, 1, burst=1)})
+    start = time.monotonic()
+    for _ in range(6):
+        scheduler.acquire("p")
+    # The first token is immediate, the next five arrive at 50/s.
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+    assert scheduler.stats()["p"]["granted"] == 6
+
+
+def test_live_requests_jump_the_backfill_queue():
+    scheduler = RequestScheduler({"p": RateLimit(20, 1, burst=1)})
+    scheduler.acquire("p")
+    order = []
+
+    def worker(level, tag):
+        scheduler.acquire("p", priority=level)
+        order.append(tag)
+
+    threads = [threading.Thread(target=worker, args=(Priority.BACKFILL, f"b{i}")) for i in range(3)]
+    for t in threads:
+        t.start()
+    while scheduler.queue_depth("p") < 3:
+        time.sleep(0.001)
+    live = threading.Thread(target=worker, args=(Priority.LIVE, "live"))
+    live.start()
+    for t in threads + [live]:
+        t.join()
+    assert order.index("live") <= 1
+
+
+def test_acquire_times_out_and_leaves_queue():
+    scheduler = RequestScheduler({"p": RateLimit(1, 60, burst=1)})
+    scheduler.acquire("p")
+    with pytest.raises(TimeoutError):
+        scheduler.acquire("p", timeout=0.01)
+    assert scheduler.queue_depth("p") == 0
+
+
+def test_build_clients_installs_scheduler_unless_off():
+    from aurora_apis import http_client
+    from aurora_core.api_manager import build_clients
+
+    build_clients(APIConfig(rate_limits="off"))
+    assert http_client.set_request_gate(None) is None
+    build_clients(APIConfig())
+    gate = http_client.set_request_gate(None)
+    assert isinstance(gate.__self__, RequestScheduler)
+
+
+def test_snapshot_sources_run_at_their_priority_in_worker_threads():
+    from types import SimpleNamespace
+
+    from aurora_core.data_fusion_bus import DataFusionBus
+    from aurora_core.request_scheduler import _current_priority
+
+    seen = {}
+
+    def record(name, value):
+        def fetch(*args, **kwargs):
+            seen[name] = _current_priority.get()
+            return value
+        return fetch
+
+    clients = SimpleNamespace(
+        alpha_vantage=SimpleNamespace(get_quote=record("quote", {})),
+        benzinga=SimpleNamespace(get_news=record("news", [])),
+        sec_edgar=SimpleNamespace(get_company_facts=record("fundamentals", {})),
+    )
+    bus = DataFusionBus(clients, concurrent=True)
+    bus.snapshot("AAPL")
+    bus.close()
+    assert seen == {"quote": Priority.LIVE, "news": Priority.BACKFILL, "fundamentals": Priority.BACKFILL}
+
+
+def test_deadline_drops_waiters_from_the_queue():
+    import asyncio
+
+    from aurora_core.request_scheduler import deadline
+
+    scheduler = RequestScheduler({"p": RateLimit(1, 60, burst=1)})
+    scheduler.acquire("p")
+    with deadline(time.monotonic() + 0.02):
+        with pytest.raises(TimeoutError):
+            scheduler.acquire("p")
+        with pytest.raises(TimeoutError):
+            asyncio.run(scheduler.acquire_async("p"))
+    with deadline(time.monotonic() - 1):
+        with pytest.raises(TimeoutError):
+            scheduler.acquire("p")
+    assert scheduler.queue_depth("p") == 0
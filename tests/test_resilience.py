@@ -0,0 +1,173 @@
+import asyncio
+import time
+from urllib import error
+
+import pytest
+
+from aurora_apis import http_client
+from aurora_apis.resilience import CircuitOpenError, Resilience, RetryPolicy
+from aurora_apis.transport import HTTPResponse, Transport
+
+
+class _ScriptedTransport(Transport):
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    def request(self, method, url, body=None, headers=None, timeout=10):
+        self.calls += 1
+        step = self.script.pop(0) if self.script else (200, {})
+        if isinstance(step, Exception):
+            raise step
+        status, hdrs = step
+        return HTTPResponse(status, "", hdrs, b'{"ok": true}', url)
+
+
+@pytest.fixture
+def install():
+    installed = []
+
+    def _install(script, resilience):
+        transport = _ScriptedTransport(script)
+        installed.append((http_client.set_transport(transport), http_client.set_resilience(resilience)))
+        return transport
+
+    yield _install
+    for transport, resilience in installed:
+        http_client.set_transport(transport)
+        http_client.set_resilience(resilience)
+
+
+def test_retries_transient_failures_and_honors_retry_after(install):
+    resilience = Resilience(retry=RetryPolicy(max_retries=3, backoff_base=0.001))
+    transport = install(
+        [TimeoutError("slow"), (503, {}), (429, {"retry-after": "0.05"}), (200, {})], resilience
+    )
+    start = time.monotonic()
+    assert http_client.http_get("http://api.example/q") == {"ok": True}
+    assert time.monotonic() - start >= 0.05
+    assert transport.calls == 4
+    stats = resilience.stats()["api.example"]
+    assert stats["retries"] == 3 and stats["failures"] == 2 and stats["state"] == "closed"
+
+
+def test_client_errors_and_posts_are_not_retried(install):
+    resilience = Resilience(retry=RetryPolicy(max_retries=3, backoff_base=0.001))
+    transport = install([(404, {}), (503, {})], resilience)
+    with pytest.raises(error.HTTPError):
+        http_client.http_get("http://api.example/missing")
+    with pytest.raises(error.HTTPError):
+        http_client.http_post("http://api.example/token", data={"a": 1})
+    assert transport.calls == 2
+
+
+def test_breaker_opens_fails_fast_and_recovers(install):
+    resilience = Resilience(
+        retry=RetryPolicy(max_retries=0), failure_threshold=2, recovery_timeout=0.05
+    )
+    transport = install([ConnectionResetError(), ConnectionResetError()], resilience)
+    for _ in range(2):
+        with pytest.raises(ConnectionResetError):
+            http_client.http_get("http://flaky.example/q")
+    with pytest.raises(CircuitOpenError):
+        http_client.http_get("http://flaky.example/q")
+    assert transport.calls == 2
+    assert "flaky.example" in resilience.open_circuits()
+
+    time.sleep(0.06)
+    assert http_client.http_get("http://flaky.example/q") == {"ok": True}
+    stats = resilience.stats()["flaky.example"]
+    assert stats["state"] == "closed" and stats["short_circuited"] == 1
+    assert stats["times_opened"] == 1
+
+
+def _half_open(resilience, host):
+    breaker = resilience.breaker(host)
+    for _ in range(resilience.failure_threshold):
+        breaker.record_failure()
+    breaker.opened_at -= resilience.recovery_timeout
+    return breaker
+
+
+def test_cancelled_async_probe_frees_the_half_open_slot():
+    resilience = Resilience(retry=RetryPolicy(max_retries=0), failure_threshold=1)
+    breaker = _half_open(resilience, "slow.example")
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def ok():
+        return "ok"
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(resilience.call_async("GET", "http://slow.example/q", hang), 0.01)
+        return await resilience.call_async("GET", "http://slow.example/q", ok)
+
+    assert asyncio.run(main()) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_failed_gate_does_not_take_the_stream_probe(install):
+    resilience = Resilience(retry=RetryPolicy(max_retries=0), failure_threshold=1)
+    install([], resilience)
+    breaker = _half_open(resilience, "gated.example")
+
+    def gate(url):
+        raise TimeoutError("rate limit wait timed out")
+
+    previous = http_client.set_request_gate(gate)
+    try:
+        with pytest.raises(TimeoutError):
+            with http_client.http_stream("GET", "http://gated.example/q"):
+                pass
+    finally:
+        http_client.set_request_gate(previous)
+    with http_client.http_stream("GET", "http://gated.example/q") as resp:
+        assert resp.status == 200
+    assert breaker.state == "closed"
+
+
+def test_gate_failures_do_not_count_against_the_host(install):
+    from aurora_apis import async_http_client
+
+    resilience = Resilience(retry=RetryPolicy(max_retries=2, backoff_base=0.001), failure_threshold=2)
+    transport = install([], resilience)
+    gated = []
+
+    def gate(url):
+        gated.append(url)
+        raise TimeoutError("rate limit wait timed out")
+
+    async def gate_async(url):
+        gate(url)
+
+    async def request():
+        await async_http_client.async_http_request("GET", "http://gated.example/q")
+
+    previous = http_client.set_request_gate(gate)
+    previous_async = async_http_client.set_async_request_gate(gate_async)
+    try:
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                http_client.http_get("http://gated.example/q")
+            with pytest.raises(TimeoutError):
+                asyncio.run(request())
+    finally:
+        http_client.set_request_gate(previous)
+        async_http_client.set_async_request_gate(previous_async)
+    assert len(gated) == 4 and transport.calls == 0
+    assert resilience.stats().get("gated.example", {}).get("failures", 0) == 0
+    assert resilience.breaker("gated.example").state == "closed"
+
+
+def test_retries_wait_on_the_gate(install):
+    resilience = Resilience(retry=RetryPolicy(max_retries=2, backoff_base=0.001))
+    transport = install([(503, {}), (200, {})], resilience)
+    gated = []
+    previous = http_client.set_request_gate(gated.append)
+    try:
+        assert http_client.http_get("http://api.example/q") == {"ok": True}
+    finally:
+        http_client.set_request_gate(previous)
+    assert len(gated) == transport.calls == 2
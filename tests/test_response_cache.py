@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+
+from aurora_apis.response_cache import CacheRule, ResponseCache
+from aurora_apis.transport import HTTPResponse
+
+
+def _fetcher(payload, calls, delay=0.0):
+    def fetch():
+        calls.append(1)
+        time.sleep(delay)
+        return HTTPResponse(200, "OK", {}, json.dumps(payload).encode())
+
+    return fetch
+
+
+def test_hits_misses_and_expiry():
+    cache = ResponseCache(rules=[CacheRule(r"/quote", 0.05)])
+    calls = []
+    fetch = _fetcher({"p": 1}, calls)
+    assert cache.get_or_fetch("http://x/quote?s=A", fetch) == {"p": 1}
+    assert cache.get_or_fetch("http://x/quote?s=A", fetch) == {"p": 1}
+    assert len(calls) == 1
+    time.sleep(0.06)
+    cache.get_or_fetch("http://x/quote?s=A", fetch)
+    assert len(calls) == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 2, 1)
+
+
+def test_unmatched_urls_are_not_cached():
+    cache = ResponseCache(rules=[CacheRule(r"/quote", 60)])
+    calls = []
+    for _ in range(2):
+        cache.get_or_fetch("http://x/token", _fetcher({}, calls))
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_bytes():
+    body_size = len(json.dumps({"v": "x" * 100}).encode())
+    cache = ResponseCache(max_bytes=body_size * 2, rules=[CacheRule(r".", 60)])
+    calls = []
+    fetch = _fetcher({"v": "x" * 100}, calls)
+    cache.get_or_fetch("a", fetch)
+    cache.get_or_fetch("b", fetch)
+    cache.get_or_fetch("a", fetch)  # refresh "a" so "b" is least recent
+    cache.get_or_fetch("c", fetch)
+    assert cache.stats()["evictions"] == 1
+    cache.get_or_fetch("a", fetch)
+    assert len(calls) == 3
+    cache.get_or_fetch("b", fetch)
+    assert len(calls) == 4
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    cache = ResponseCache(rules=[CacheRule(r".", 60)])
+    calls = []
+    fetch = _fetcher({"p": 1}, calls, delay=0.05)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("u", fetch)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert results == [{"p": 1}] * 8
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_callers_get_independent_copies():
+    cache = ResponseCache(rules=[CacheRule(r".", 60)])
+    calls = []
+    fetch = _fetcher({"items": [1, 2]}, calls)
+    first = cache.get_or_fetch("u", fetch)
+    first["items"].append(3)
+    assert cache.get_or_fetch("u", fetch) == {"items": [1, 2]}
+    assert cache.stats()["bytes"] == len(b'{"items": [1, 2]}')
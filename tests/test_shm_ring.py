@@ -0,0 +1,76 @@
+import math
+import multiprocessing
+import uuid
+from types import SimpleNamespace
+
+from aurora_apis.market_stream import Tick
+from aurora_core.data_fusion_bus import DataFusionBus, TickerSnapshot
+from aurora_core.shm_ring import ShmPublisher, SnapshotRing, TickRing
+
+
+def _name():
+    return f"aurora-test-{uuid.uuid4().hex[:12]}"
+
+
+def _child_reader(name, queue):
+    ring = TickRing.attach(name)
+    reader = ring.reader(from_start=True)
+    queue.put([(r.seq, r.symbol, r.price) for r in reader.poll()])
+    ring.close()
+
+
+def test_reader_in_another_process_sees_ticks():
+    ring = TickRing.create(_name(), capacity=8)
+    try:
+        ring.write_tick(Tick("AAPL", "trade", 1.5, "polygon", price=200.0, size=10))
+        ring.write_tick(Tick("MSFT", "trade", 1.6, "finnhub", price=410.0, size=1))
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_child_reader, args=(ring.name, queue))
+        proc.start()
+        assert queue.get(timeout=10) == [(1, "AAPL", 200.0), (2, "MSFT", 410.0)]
+        proc.join(10)
+    finally:
+        ring.close()
+
+
+def test_slow_reader_detects_overrun():
+    ring = TickRing.create(_name(), capacity=4)
+    try:
+        reader = TickRing.attach(ring.name).reader(from_start=True)
+        for i in range(10):
+            ring.write_tick(Tick("AAPL", "quote", float(i), "polygon", bid=i, ask=i + 1))
+        records = reader.poll()
+        assert [r.seq for r in records] == [8, 9, 10]
+        assert reader.lost == 7 and reader.overruns == 1
+        assert reader.latest["AAPL"].bid == 9.0 and math.isnan(records[0].price)
+        assert reader.poll() == []
+    finally:
+        ring.close()
+
+
+def test_publisher_mirrors_live_quotes_and_snapshots():
+    bus = DataFusionBus(SimpleNamespace())
+    ticks = TickRing.create(_name(), capacity=64)
+    snaps = SnapshotRing.create(_name(), capacity=4, slot_size=4096)
+    publisher = ShmPublisher(bus, ticks, snaps)
+    reader = ticks.reader()
+    try:
+        publisher.start()
+        bus.publish_tick(Tick("AAPL", "trade", 5.0, "polygon", price=200.0, size=1))
+        assert bus.flush(timeout=1)
+        bus.publish_tick(Tick("AAPL", "quote", 6.0, "polygon", bid=199.0, ask=201.0))
+        assert bus.flush(timeout=1)
+        publisher.stop()
+        records = reader.poll()
+        assert [r.kind for r in records] == ["merged", "merged"]
+        assert (records[-1].price, records[-1].bid, records[-1].timestamp) == (200.0, 199.0, 6.0)
+
+        snaps.write_snapshot(
+            TickerSnapshot("AAPL", {"price": 1}, [], {"facts": "x" * 10_000})
+        )
+        (snap,) = snaps.reader(from_start=True).poll()
+        assert snap["symbol"] == "AAPL" and "fundamentals" not in snap
+    finally:
+        ticks.close()
+        snaps.close()
@@ -0,0 +1,121 @@
+import math
+import sys
+
+import pytest
+
+from aurora_core.data_fusion_bus import TickerSnapshot
+from aurora_core.snapshot_models import CompactSnapshot, NewsItem, quote_from_payload
+
+
+GLOBAL_QUOTE = {
+    "01. symbol": "IBM",
+    "02. open": "166.0000",
+    "03. high": "167.5000",
+    "04. low": "165.2000",
+    "05. price": "167.0000",
+    "06. volume": "3471034",
+    "07. latest trading day": "2024-05-10",
+    "08. previous close": "165.0000",
+    "09. change": "2.0000",
+    "10. change percent": "1.2121%",
+}
+NEWS = [
+    {
+        "id": 38273812,
+        "title": "IBM beats",
+        "url": "https://www.benzinga.com/x",
+        "created": "Fri, 10 May 2024 16:05:12 -0400",
+        "stocks": [{"name": "IBM"}],
+    }
+]
+FACTS = {
+    "cik": 51143,
+    "entityName": "INTERNATIONAL BUSINESS MACHINES CORP",
+    "facts": {
+        "dei": {
+            "EntityCommonStockSharesOutstanding": {
+                "units": {"shares": [{"end": "2024-04-19", "val": 918000000, "filed": "2024-04-24"}]}
+            }
+        },
+        "us-gaap": {
+            "NetIncomeLoss": {
+                "units": {
+                    "USD": [
+                        {"start": "2023-01-01", "end": "2023-12-31", "val": 7502000000,
+                         "fp": "FY", "form": "10-K/A", "filed": "2024-06-26"},
+                        {"start": "2024-01-01", "end": "2024-03-31", "val": 1600000000,
+                         "fp": "Q1", "form": "10-Q", "filed": "2024-04-24"},
+                        {"start": "2023-01-01", "end": "2023-12-31", "val": 7500000000,
+                         "fp": "FY", "form": "10-K", "filed": "2024-02-26"},
+                    ]
+                }
+            },
+            "Revenues": {
+                "units": {
+                    "USD": [
+                        {"start": "2017-01-01", "end": "2017-12-31", "val": 79e9,
+                         "fp": "FY", "form": "10-K", "filed": "2018-02-27"},
+                    ]
+                }
+            },
+            "RevenueFromContractWithCustomerExcludingAssessedTax": {
+                "units": {
+                    "USD": [
+                        {"start": "2023-01-01", "end": "2023-12-31", "val": 61.9e9,
+                         "fp": "FY", "form": "10-K", "filed": "2024-02-26"},
+                        {"start": "2023-01-01", "end": "2023-09-30", "val": 44.8e9,
+                         "fp": "Q3", "form": "10-Q", "filed": "2023-10-30"},
+                    ]
+                }
+            },
+        },
+    },
+}
+
+
+def test_snapshot_normalizes_and_round_trips():
+    snap = TickerSnapshot("IBM", GLOBAL_QUOTE, NEWS, FACTS, stale=["news"])
+    compact = snap.normalized()
+
+    assert compact.quote.price == 167.0 and compact.quote.volume == 3471034
+    assert round(compact.quote.change_pct, 4) == 1.2121
+    assert compact.news[0].tickers == ("IBM",)
+    assert compact.news[0].published == 1715371512.0
+    # Fiscal-year values only, newest across concepts, latest restatement.
+    assert compact.fundamentals.net_income == 7.502e9
+    assert compact.fundamentals.revenue == 61.9e9
+    assert compact.fundamentals.shares_outstanding == 9.18e8
+    assert math.isnan(compact.fundamentals.eps_diluted)
+
+    data = compact.to_bytes()
+    decoded = CompactSnapshot.from_bytes(data)
+    assert decoded.to_bytes() == data  # NaN fields make == unusable
+    assert decoded.news == compact.news and decoded.stale == ("news",)
+    assert len(data) < 300
+    assert not hasattr(compact.quote, "__dict__")
+    assert sys.getsizeof(compact.quote) < 150
+
+
+def test_quote_shapes_from_other_providers():
+    finnhub = quote_from_payload("AAPL", {"c": 190.1, "o": 189, "h": 191, "l": 188, "pc": 188.5, "t": 1715371200})
+    polygon = quote_from_payload("AAPL", {"results": {"T": "AAPL", "p": 190.2, "s": 100, "t": 1715371200123456789}})
+    live = quote_from_payload("AAPL", {"symbol": "AAPL", "price": 190.3, "bid": 190.2, "quote_time": 5.0, "source": "polygon"})
+    assert (finnhub.source, finnhub.price, finnhub.prev_close) == ("finnhub", 190.1, 188.5)
+    assert polygon.symbol == "AAPL" and abs(polygon.timestamp - 1715371200.123) < 1e-3
+    assert (live.bid, live.timestamp) == (190.2, 5.0)
+
+
+def test_throttled_quote_payload_normalizes_to_none():
+    note = {"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."}
+    assert quote_from_payload("IBM", note) is None
+    assert TickerSnapshot("IBM", note, [], {}).normalized().quote is None
+
+
+def test_encode_handles_many_tickers_and_rejects_oversized_strings():
+    item = NewsItem(1, "sector wrap", "", 0.0, tickers=tuple(f"T{i}" for i in range(300)))
+    data = CompactSnapshot("SPY", news=(item,)).to_bytes()
+    assert len(CompactSnapshot.from_bytes(data).news[0].tickers) == 300
+
+    huge = NewsItem(2, "x" * 70_000, "", 0.0)
+    with pytest.raises(ValueError):
+        CompactSnapshot("SPY", news=(huge,)).to_bytes()
@@ -0,0 +1,195 @@
+import json
+from types import SimpleNamespace
+
+from aurora_apis import http_client
+from aurora_apis.reddit_client import RedditClient
+from aurora_apis.transport import HTTPResponse, Transport
+from aurora_core.event_bus import EventBus, Topic
+from aurora_core.social_aggregator import RollingCounts, SeenSet, SocialAggregator, extract_cashtags
+
+NOW = 1_700_000_000.0
+
+
+class FakeReddit:
+    def __init__(self, posts):
+        self.posts = posts  # newest first, like the API
+        self.calls = []
+
+    def search_subreddit(self, subreddit, query, limit=10, before=None):
+        self.calls.append(before)
+        if before is None:
+            return self.posts[:limit]
+        names = [p["name"] for p in self.posts]
+        newer = self.posts[: names.index(before)] if before in names else []
+        return newer[-limit:]
+
+
+class FakeStockTwits:
+    def __init__(self, messages):
+        self.messages = messages  # newest first
+        self.calls = []
+
+    def get_symbol_stream(self, symbol, since=None, max_id=None):
+        self.calls.append((since, max_id))
+        page = [
+            m for m in self.messages
+            if (since is None or m["id"] > since) and (max_id is None or m["id"] <= max_id)
+        ]
+        return {"messages": page[:2], "cursor": {"more": len(page) > 2}}
+
+
+def post(n, title, age=0):
+    return {"name": f"t3_{n}", "id": str(n), "title": title, "created_utc": NOW - age}
+
+
+def message(n, body, sentiment=None, symbols=("TSLA",)):
+    return {
+        "id": n,
+        "body": body,
+        "created_at": "2023-11-14T22:13:20Z",  # NOW
+        "symbols": [{"symbol": s} for s in symbols],
+        "entities": {"sentiment": {"basic": sentiment} if sentiment else None},
+    }
+
+
+def test_extract_cashtags_and_seen_set_bounds():
+    assert extract_cashtags("$aapl up, $MSFT down, $AAPL again, $brk.b") == ["AAPL", "MSFT", "BRK.B"]
+
+    seen = SeenSet(capacity=2)
+    assert seen.add("a") and seen.add("b") and not seen.add("a")
+    assert seen.add("c") and len(seen) == 2 and "a" not in seen
+
+
+def test_rolling_counts_windows_and_prune():
+    counts = RollingCounts(bucket=60, horizon=600)
+    counts.add("AAPL", NOW - 30, "Bullish", now=NOW)
+    counts.add("AAPL", NOW - 400, "Bearish", now=NOW)
+    assert not counts.add("AAPL", NOW - 3600, now=NOW)
+    assert counts.window("AAPL", 120, NOW) == (1, 1, 0)
+    assert counts.window("AAPL", 600, NOW) == (2, 1, 1)
+
+    counts.prune(NOW + 500)
+    assert counts.window("AAPL", 3600, NOW + 500) == (1, 1, 0)
+    counts.prune(NOW + 2000)
+    assert counts.symbols() == []
+
+
+def test_reddit_feed_fetches_only_new_posts():
+    reddit = FakeReddit([post(2, "$NVDA calls", age=10), post(1, "$AAPL and $NVDA", age=100)])
+    agg = SocialAggregator(SimpleNamespace(reddit=reddit), clock=lambda: NOW)
+    agg.watch_reddit("stocks", "earnings")
+
+    first = agg.poll()
+    assert [m.id for m in first] == ["t3_1", "t3_2"]
+    assert first[0].symbols == ("AAPL", "NVDA")
+    assert agg.mentions("NVDA") == 2
+
+    assert agg.poll() == []
+    assert reddit.calls == [None, "t3_2"]
+
+    reddit.posts.insert(0, post(3, "$AMD", age=1))
+    assert [m.id for m in agg.poll()] == ["t3_3"]
+    assert reddit.calls[-1] == "t3_2"
+    assert agg.stats()["feeds"]["reddit:stocks:earnings"]["cursor"] == "t3_3"
+
+
+def test_stocktwits_pages_back_to_cursor_and_dedupes():
+    stocktwits = FakeStockTwits([message(1, "first")])
+    bus = EventBus()
+    sub = bus.subscribe(Topic.SOCIAL)
+    agg = SocialAggregator(SimpleNamespace(stocktwits=stocktwits), events=bus, clock=lambda: NOW)
+    agg.watch_stocktwits("tsla")
+
+    assert len(agg.poll()) == 1
+    stocktwits.messages[:0] = [
+        message(5, "$AAPL too", "Bullish", ("TSLA", "AAPL")),
+        message(4, "four", "Bearish"),
+        message(3, "three"),
+        message(2, "two"),
+    ]
+    new = agg.poll()
+    assert sorted(int(m.id) for m in new) == [2, 3, 4, 5]
+    assert stocktwits.calls[1:] == [(1, None), (1, 3)]
+    assert agg.sentiment("TSLA") == {"mentions": 5, "bullish": 1, "bearish": 1}
+    assert agg.top(2) == [("TSLA", 5), ("AAPL", 1)]
+
+    # A cursor reset re-fetches old messages; the seen-set drops them.
+    agg.feeds["stocktwits:TSLA"].cursor = None
+    assert agg.poll() == [] and agg.duplicates == 2
+
+    events = sub.get_batch(100, timeout=0)
+    assert len(events) == 6 and {e.key for e in events} == {"TSLA", "AAPL"}
+
+
+def test_stocktwits_burst_beyond_max_pages_resumes_without_gaps():
+    stocktwits = FakeStockTwits([message(1, "first")])
+    agg = SocialAggregator(SimpleNamespace(stocktwits=stocktwits), max_pages=2, clock=lambda: NOW)
+    name = agg.watch_stocktwits("TSLA")
+    agg.poll()
+    stocktwits.messages[:0] = [message(n, str(n)) for n in range(9, 1, -1)]
+
+    # Two pages reach back to 6; the cursor stays at 1 until 2..5 are in.
+    assert sorted(int(m.id) for m in agg.poll()) == [6, 7, 8, 9]
+    assert agg.feeds[name].cursor == 1
+    stocktwits.messages.insert(0, message(10, "ten"))
+    assert sorted(int(m.id) for m in agg.poll()) == [2, 3, 4, 5]
+    assert stocktwits.calls[-2:] == [(1, 5), (1, 3)]
+    assert agg.feeds[name].cursor == 9
+
+    assert [int(m.id) for m in agg.poll()] == [10]
+    assert agg.feeds[name].cursor == 10
+
+
+class _RedditTransport(Transport):
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.tokens = 0
+        self.auth = []
+
+    def request(self, method, url, body=None, headers=None, timeout=10):
+        if url.endswith("/access_token"):
+            self.tokens += 1
+            payload = {"access_token": f"tok{self.tokens}", "expires_in": 3600}
+            return HTTPResponse(200, "OK", {}, json.dumps(payload).encode(), url)
+        self.auth.append(headers["Authorization"])
+        status = self.statuses.pop(0) if self.statuses else 200
+        return HTTPResponse(status, "", {}, b'{"data": {"children": []}}', url)
+
+
+def test_reddit_token_refreshes_on_expiry_and_401():
+    transport = _RedditTransport([200, 401, 200])
+    previous = http_client.set_transport(transport)
+    try:
+        reddit = RedditClient("id", "secret", "agent")
+        reddit.get_new("stocks")
+        reddit._token_expires = 0.0  # lapsed
+        reddit.get_new("stocks")  # 401 with a fresh token: retried once
+    finally:
+        http_client.set_transport(previous)
+    assert transport.tokens == 3
+    assert transport.auth == ["Bearer tok1", "Bearer tok2", "Bearer tok3"]
+
+
+def test_velocity_compares_short_and_long_rates():
+    now = [NOW]
+    agg = SocialAggregator(SimpleNamespace(), clock=lambda: now[0])
+    for age in (3000, 2000, 1000, 100, 50, 10):
+        agg.counts.add("GME", NOW - age, now=NOW)
+    # 3 of 6 mentions in the last 5 minutes of the hour: 6x the hourly rate.
+    assert agg.velocity("GME") == (3 / 300) / (6 / 3600)
+    assert agg.velocity("AAPL") == 0.0
+
+
+def test_failing_feed_is_recorded_and_others_still_poll():
+    def broken(*args, **kwargs):
+        raise RuntimeError("down")
+
+    clients = SimpleNamespace(
+        reddit=SimpleNamespace(search_subreddit=broken),
+        stocktwits=FakeStockTwits([message(1, "ok")]),
+    )
+    agg = SocialAggregator(clients, clock=lambda: NOW)
+    agg.watch_reddit("stocks", "x")
+    agg.watch_stocktwits("TSLA")
+    assert len(agg.poll()) == 1
+    assert agg.stats()["feeds"]["reddit:stocks:x"]["last_error"] == "RuntimeError: down"
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from aurora_core.social_aggregator import SocialAggregator
+from aurora_core.ticker_matcher import TickerMatcher
+
+NOW = 1_700_000_000.0
+
+
+def test_matches_symbols_cashtags_and_aliases():
+    matcher = TickerMatcher(
+        ["AAPL", "AMD", "BRK-B", "BRK", "IT", "F", "NVDA"], aliases={"Nvidia": "NVDA"}
+    )
+    text = "Loading $aapl and AMD; BRK.B too. nvidia beats, IT is boring, $it and $F rip"
+    found = matcher.matches(text)
+    assert [m.symbol for m in found] == ["AAPL", "AMD", "BRK-B", "NVDA", "IT", "F"]
+    assert text[found[0].start:found[0].end] == "$aapl" and found[0].cashtag
+    assert not found[1].cashtag
+
+
+def test_rejects_lowercase_substrings_and_stopwords():
+    matcher = TickerMatcher(["AMD", "ON", "CAT", "A"])
+    # lower-case bare words, embedded matches, stopwords and short bare tickers
+    assert matcher.extract("cat on a mat, AMDX, XAMD, ON the way, A plan") == []
+    assert matcher.extract("CAT and $on") == ["CAT", "ON"]
+    assert matcher.extract("CAT CAT $CAT") == ["CAT"]
+
+
+def test_overlapping_patterns_share_suffix_states():
+    matcher = TickerMatcher(["ABCD", "BC", "BCDE"], stopwords=())
+    assert matcher.extract("BCDE ABCD BC") == ["BCDE", "ABCD", "BC"]
+    assert len(matcher) == 3
+
+
+def test_subreddit_feed_routes_mentions_to_symbols():
+    posts = [
+        {"name": "t3_2", "title": "AMD vs $nvda", "created_utc": NOW - 5},
+        {"name": "t3_1", "title": "AAPL earnings", "selftext": "Apple guides up", "created_utc": NOW - 50},
+        {"name": "t3_0", "title": "what a day", "created_utc": NOW - 60},
+    ]
+    calls = []
+
+    def get_new(subreddit, limit=100, before=None):
+        calls.append((subreddit, before))
+        return posts if before is None else []
+
+    matcher = TickerMatcher(["AAPL", "AMD", "NVDA", "TSLA"], aliases={"apple": "AAPL"})
+    reddit = SimpleNamespace(get_new=get_new)
+    agg = SocialAggregator(SimpleNamespace(reddit=reddit), extract=matcher, clock=lambda: NOW)
+    for sub in ("stocks", "wallstreetbets"):
+        agg.watch_subreddit(sub)
+
+    agg.poll()
+    agg.poll()
+    assert calls == [("stocks", None), ("wallstreetbets", None), ("stocks", "t3_2"), ("wallstreetbets", "t3_2")]
+    assert agg.mentions("AAPL") == 1 and agg.mentions("TSLA") == 0
+    assert [m.id for m in agg.recent("amd")] == ["t3_2"]
+    assert agg.recent("AAPL")[0].symbols == ("AAPL",)